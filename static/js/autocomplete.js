@@ -0,0 +1,41 @@
+document.addEventListener("DOMContentLoaded", function () {
+  document.querySelectorAll("select[data-autocomplete-url]").forEach(function (select) {
+    const input = document.createElement("input");
+    const results = document.createElement("div");
+    let timer = null;
+
+    input.type = "search";
+    input.className = "form-control mb-2";
+    input.placeholder = "Search by username..";
+    results.className = "list-group mb-2";
+    select.before(input, results);
+
+    input.addEventListener("input", function () {
+      clearTimeout(timer);
+      timer = setTimeout(function () {
+        const url = new URL(select.dataset.autocompleteUrl, window.location.origin);
+        url.searchParams.set("q", input.value);
+
+        fetch(url, { headers: { Accept: "application/json" } })
+          .then((response) => response.json())
+          .then((data) => {
+            results.replaceChildren();
+            data.results.forEach(function (item) {
+              if (select.querySelector(`option[value="${item.id}"]`)) {
+                return;
+              }
+              const button = document.createElement("button");
+              button.type = "button";
+              button.className = "list-group-item list-group-item-action";
+              button.textContent = item.text;
+              button.addEventListener("click", function () {
+                select.add(new Option(item.text, item.id, true, true));
+                button.remove();
+              });
+              results.append(button);
+            });
+          });
+      }, 250);
+    });
+  });
+});
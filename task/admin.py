@@ -1,27 +1,121 @@
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth.models import Group
 from django.contrib import admin
+from django.contrib.admin.views.main import PAGE_VAR
+from django.db import transaction
 
-from task.models import TaskType, Task, Worker, Position
+from task import task_counts
+from task.bulk import apply_bulk_operations
+from task.models import TaskType, Task, TaskEvent, Worker, Position
+from task.pagination import EstimatedCountPaginator
+
+
+class InputFilter(admin.SimpleListFilter):
+    """
+    Filter typed into a text box instead of picked from a list, for
+    relations with too many rows to render as links.
+    """
+
+    template = "admin/input_filter.html"
+    lookup = None
+
+    def lookups(self, request, model_admin):
+        # A filter without lookups is not displayed at all.
+        return ((None, None),)
+
+    def choices(self, changelist):
+        yield {
+            "query_parts": [
+                (key, value)
+                for key, value in changelist.params.items()
+                if key not in (self.parameter_name, PAGE_VAR)
+            ],
+        }
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(**{self.lookup: self.value()})
+        return queryset
+
+
+class TaskTypeFilter(InputFilter):
+    title = "task type"
+    parameter_name = "task_type"
+    lookup = "task_type__name__icontains"
+
+
+class PerformanceAdminMixin:
+    """
+    Changelist settings for large tables: no ``COUNT(*)`` of the whole
+    table next to filtered results, and page numbers from the planner's
+    row estimate when nothing is filtered.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(TaskType)
 class TaskTypeAdmin(admin.ModelAdmin):
+    list_display = ("name", "open_task_count", "completed_task_count")
     search_fields = ("name",)
 
 
+def set_priority_action(priority):
+    def action(modeladmin, request, queryset):
+        modeladmin.apply_bulk(request, queryset, priority=priority)
+
+    action.__name__ = f"set_priority_{priority.name.lower()}"
+    return admin.action(
+        description=f"Set priority of selected tasks to {priority.label}"
+    )(action)
+
+
 @admin.register(Task)
-class TaskAdmin(admin.ModelAdmin):
+class TaskAdmin(PerformanceAdminMixin, admin.ModelAdmin):
     list_display = (
         "name", "deadline", "is_completed", "priority", "task_type"
     )
-    list_filter = ("is_completed", "priority", "task_type")
+    list_filter = ("is_completed", "priority", TaskTypeFilter)
+    list_select_related = ("task_type",)
     search_fields = ("name",)
+    autocomplete_fields = ("task_type", "assignees")
+    actions = (
+        "mark_completed",
+        "mark_not_completed",
+        *(set_priority_action(priority) for priority in Task.Priority),
+    )
+
+    def apply_bulk(self, request, queryset, **operations):
+        report = apply_bulk_operations(queryset, **operations)
+
+        for operation, result in report.items():
+            self.message_user(
+                request,
+                f"{operation}: {result['rows']} row(s) "
+                f"in {result['queries']} query(ies)",
+            )
+
+    def delete_queryset(self, request, queryset):
+        with transaction.atomic(), task_counts.tasks_deleted(queryset):
+            queryset.delete()
+
+    @admin.action(description="Mark selected tasks as completed")
+    def mark_completed(self, request, queryset):
+        self.apply_bulk(request, queryset, is_completed=True)
+
+    @admin.action(description="Mark selected tasks as not completed")
+    def mark_not_completed(self, request, queryset):
+        self.apply_bulk(request, queryset, is_completed=False)
 
 
 @admin.register(Worker)
-class WorkerAdmin(UserAdmin):
-    list_display = UserAdmin.list_display + ("position",)
+class WorkerAdmin(PerformanceAdminMixin, UserAdmin):
+    list_display = UserAdmin.list_display + (
+        "position", "open_task_count", "completed_task_count"
+    )
+    list_select_related = ("position",)
+    autocomplete_fields = ("position",)
     fieldsets = UserAdmin.fieldsets + ((None, {"fields": ("position",)}),)
     add_fieldsets = UserAdmin.add_fieldsets + (
         (None, {"fields": ("first_name", "last_name", "position")}),
@@ -30,7 +124,24 @@ class WorkerAdmin(UserAdmin):
 
 @admin.register(Position)
 class PositionAdmin(admin.ModelAdmin):
+    list_display = ("name", "worker_count")
     search_fields = ("name",)
 
 
+@admin.register(TaskEvent)
+class TaskEventAdmin(PerformanceAdminMixin, admin.ModelAdmin):
+    list_display = (
+        "created_at", "task_id", "actor_id", "action", "field",
+        "old_value", "new_value",
+    )
+    list_filter = ("action",)
+    date_hierarchy = "created_at"
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 admin.site.unregister(Group)
@@ -0,0 +1,403 @@
+import hashlib
+
+from django.contrib.auth import get_user_model
+from django.db.models import Prefetch
+from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.dateparse import parse_datetime
+from django.utils.http import quote_etag
+from django.views import View
+
+from task import deadlines, fragments, search, workload
+from task.models import TaskType, Task, TaskEvent, Position
+from task.pagination import CursorPaginator, InvalidCursor
+
+
+class ApiField:
+    """
+    A readable attribute of an API resource together with what the
+    queryset has to load for it: ``columns`` for ``only()``, the
+    relations to join or prefetch and an ``annotate`` callable applied to
+    the queryset when the field is requested.
+    """
+
+    def __init__(
+        self,
+        columns=(),
+        select_related=(),
+        prefetch_related=(),
+        value=None,
+        annotate=None,
+    ):
+        self.columns = columns
+        self.select_related = select_related
+        self.prefetch_related = prefetch_related
+        self.value = value
+        self.annotate = annotate
+
+    def serialize(self, obj, name):
+        if self.value is not None:
+            return self.value(obj)
+        return getattr(obj, name)
+
+
+class ApiError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class ApiView(View):
+    http_method_names = ["get", "head", "options"]
+    model = None
+    api_fields = {}
+    # Versioned models (see task.fragments) the responses are built from;
+    # without any, responses carry no ETag.
+    etag_models = ()
+
+    def dispatch(self, request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return JsonResponse(
+                {"detail": "Authentication credentials were not provided"},
+                status=401,
+            )
+
+        etag = self.get_etag()
+        if etag is not None:
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                return not_modified
+
+        try:
+            response = super().dispatch(request, *args, **kwargs)
+        except ApiError as error:
+            return JsonResponse({"detail": str(error)}, status=error.status)
+
+        if etag is not None and response.status_code == 200:
+            response["ETag"] = etag
+
+        return response
+
+    def get_etag(self):
+        """
+        Built from the version stamps of ``etag_models``, the request and
+        the date (for deadline buckets and workload), so an unchanged
+        resource answers 304 before any query runs.
+        """
+        if not self.etag_models:
+            return None
+
+        key = fragments.make_key(
+            "api",
+            self.etag_models,
+            self.request.path,
+            sorted(self.request.GET.lists()),
+            timezone.localdate(),
+        )
+        return quote_etag(hashlib.md5(key.encode()).hexdigest())
+
+    def get_fields(self):
+        requested = self.request.GET.get("fields")
+
+        if not requested:
+            return list(self.api_fields)
+
+        fields = [
+            name.strip() for name in requested.split(",") if name.strip()
+        ]
+        unknown = [name for name in fields if name not in self.api_fields]
+
+        if unknown:
+            raise ApiError(f"Unknown fields: {', '.join(unknown)}")
+
+        return fields
+
+    def get_queryset(self, fields, extra_columns=()):
+        columns, select_related, prefetch_related = set(extra_columns), [], []
+        annotations = []
+
+        for name in fields:
+            field = self.api_fields[name]
+            columns.update(field.columns)
+            select_related.extend(field.select_related)
+            prefetch_related.extend(field.prefetch_related)
+            if field.annotate is not None:
+                annotations.append(field.annotate)
+
+        queryset = self.model._default_manager.only(
+            self.model._meta.pk.name, *columns
+        )
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        for annotate in annotations:
+            queryset = annotate(queryset)
+
+        return self.filter_queryset(queryset)
+
+    def filter_queryset(self, queryset):
+        return queryset
+
+    def serialize(self, obj, fields):
+        return {
+            name: self.api_fields[name].serialize(obj, name)
+            for name in fields
+        }
+
+
+class ApiListView(ApiView):
+    cursor_ordering = ("id",)
+    page_size = 50
+    max_page_size = 500
+
+    def get_page_size(self):
+        try:
+            page_size = int(self.request.GET.get("page_size", self.page_size))
+        except ValueError:
+            raise ApiError("page_size must be an integer")
+
+        return max(1, min(page_size, self.max_page_size))
+
+    def get_cursor_ordering(self):
+        return self.cursor_ordering
+
+    def get_page_url(self, cursor):
+        if cursor is None:
+            return None
+
+        query = self.request.GET.copy()
+        query["cursor"] = cursor
+        return self.request.build_absolute_uri(
+            f"{self.request.path}?{query.urlencode()}"
+        )
+
+    def get(self, request, *args, **kwargs):
+        fields = self.get_fields()
+        ordering = self.get_cursor_ordering()
+        concrete = {field.name for field in self.model._meta.concrete_fields}
+        queryset = self.get_queryset(
+            fields,
+            extra_columns=[
+                field.lstrip("-")
+                for field in ordering
+                if field.lstrip("-") in concrete
+            ],
+        )
+        paginator = CursorPaginator(
+            queryset, ordering, self.get_page_size()
+        )
+
+        try:
+            page = paginator.page(request.GET.get("cursor"))
+        except InvalidCursor as error:
+            raise ApiError(str(error))
+
+        return JsonResponse(
+            {
+                "next": self.get_page_url(page.next_cursor),
+                "previous": self.get_page_url(page.previous_cursor),
+                "results": [self.serialize(obj, fields) for obj in page],
+            }
+        )
+
+
+class ApiDetailView(ApiView):
+    def get(self, request, pk, *args, **kwargs):
+        fields = self.get_fields()
+
+        try:
+            obj = self.get_queryset(fields).get(pk=pk)
+        except self.model.DoesNotExist:
+            raise ApiError("Not found", status=404)
+
+        return JsonResponse(self.serialize(obj, fields))
+
+
+TASK_FIELDS = {
+    "id": ApiField(),
+    "name": ApiField(columns=["name"]),
+    "description": ApiField(columns=["description"]),
+    "deadline": ApiField(columns=["deadline"]),
+    "is_completed": ApiField(columns=["is_completed"]),
+    "priority": ApiField(
+        columns=["priority"], value=lambda task: task.get_priority_display()
+    ),
+    "task_type": ApiField(
+        columns=["task_type", "task_type__name"],
+        select_related=["task_type"],
+        value=lambda task: task.task_type and task.task_type.name,
+    ),
+    "assignees": ApiField(
+        prefetch_related=[
+            Prefetch(
+                "assignees", queryset=get_user_model().objects.only("id")
+            )
+        ],
+        value=lambda task: [worker.id for worker in task.assignees.all()],
+    ),
+}
+
+WORKER_FIELDS = {
+    "id": ApiField(),
+    "username": ApiField(columns=["username"]),
+    "first_name": ApiField(columns=["first_name"]),
+    "last_name": ApiField(columns=["last_name"]),
+    "email": ApiField(columns=["email"]),
+    "position": ApiField(
+        columns=["position", "position__name"],
+        select_related=["position"],
+        value=lambda worker: worker.position and worker.position.name,
+    ),
+    "tasks": ApiField(
+        prefetch_related=[
+            Prefetch("tasks", queryset=Task.objects.only("id"))
+        ],
+        value=lambda worker: [task.id for task in worker.tasks.all()],
+    ),
+    "workload": ApiField(
+        columns=["open_task_count", "completed_task_count"],
+        annotate=workload.annotate_workload,
+        value=workload.serialize_workload,
+    ),
+}
+
+TASK_EVENT_FIELDS = {
+    "id": ApiField(),
+    "task": ApiField(columns=["task"], value=lambda event: event.task_id),
+    "actor": ApiField(columns=["actor"], value=lambda event: event.actor_id),
+    "action": ApiField(columns=["action"]),
+    "field": ApiField(columns=["field"]),
+    "old_value": ApiField(columns=["old_value"]),
+    "new_value": ApiField(columns=["new_value"]),
+    "created_at": ApiField(columns=["created_at"]),
+}
+
+NAME_FIELDS = {
+    "id": ApiField(),
+    "name": ApiField(columns=["name"]),
+}
+
+
+class SearchFilterMixin:
+    def filter_queryset(self, queryset):
+        query = self.request.GET.get("search")
+
+        if query:
+            return search.search(queryset, query)
+
+        return queryset
+
+
+class TaskApiListView(SearchFilterMixin, ApiListView):
+    model = Task
+    api_fields = TASK_FIELDS
+    etag_models = ("task", "tasktype")
+    cursor_ordering = ("is_completed", "priority", "id")
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        is_completed = self.request.GET.get("is_completed")
+        due = self.request.GET.get("due")
+
+        if is_completed in ("true", "false"):
+            queryset = queryset.filter(is_completed=is_completed == "true")
+
+        if due:
+            try:
+                queryset = queryset.filter(deadlines.due_filter(due))
+            except ValueError as error:
+                raise ApiError(str(error))
+
+        return queryset
+
+
+class TaskApiDetailView(ApiDetailView):
+    model = Task
+    api_fields = TASK_FIELDS
+    etag_models = ("task", "tasktype")
+
+
+class WorkerApiListView(SearchFilterMixin, ApiListView):
+    model = get_user_model()
+    api_fields = WORKER_FIELDS
+    etag_models = ("worker", "position", "task")
+
+    def get_cursor_ordering(self):
+        ordering = self.request.GET.get("ordering")
+
+        if not ordering:
+            return self.cursor_ordering
+        if ordering not in workload.ORDERINGS:
+            raise ApiError(
+                f"ordering must be one of {', '.join(workload.ORDERINGS)}"
+            )
+
+        return workload.ORDERINGS[ordering]
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        if self.request.GET.get("ordering"):
+            queryset = workload.annotate_workload(queryset)
+
+        return queryset
+
+
+class WorkerApiDetailView(ApiDetailView):
+    model = get_user_model()
+    api_fields = WORKER_FIELDS
+    etag_models = ("worker", "position", "task")
+
+
+class PositionApiListView(SearchFilterMixin, ApiListView):
+    model = Position
+    api_fields = NAME_FIELDS
+    etag_models = ("position",)
+
+
+class PositionApiDetailView(ApiDetailView):
+    model = Position
+    api_fields = NAME_FIELDS
+    etag_models = ("position",)
+
+
+class TaskTypeApiListView(SearchFilterMixin, ApiListView):
+    model = TaskType
+    api_fields = NAME_FIELDS
+    etag_models = ("tasktype",)
+
+
+class TaskTypeApiDetailView(ApiDetailView):
+    model = TaskType
+    api_fields = NAME_FIELDS
+    etag_models = ("tasktype",)
+
+
+class TaskEventApiListView(ApiListView):
+    model = TaskEvent
+    api_fields = TASK_EVENT_FIELDS
+
+    def filter_queryset(self, queryset):
+        since = self.request.GET.get("since")
+        task = self.request.GET.get("task")
+
+        if since:
+            try:
+                since = parse_datetime(since)
+            except ValueError:
+                since = None
+            if since is None:
+                raise ApiError("since must be an ISO 8601 date and time")
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+            queryset = queryset.filter(created_at__gte=since)
+
+        if task:
+            if not task.isdigit():
+                raise ApiError("task must be an id")
+            queryset = queryset.filter(task_id=int(task))
+
+        return queryset
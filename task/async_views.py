@@ -0,0 +1,154 @@
+"""
+Async versions of the read-only pages, routed by ``task.urls_async`` when
+the project is served through ``task_manager.asgi``. Fragment caches and
+counters are read on the event loop with the async cache API; database
+work goes through the async ORM, except for the paginated list queries,
+which Django's paginators only run synchronously.
+"""
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.contrib.auth.views import redirect_to_login
+from django.http import Http404
+from django.shortcuts import render
+
+from task import counters, deadlines, views
+from task.models import Task
+from task.visits import visit_counter
+
+
+async def is_authenticated(request) -> bool:
+    # Loads the session and the user in a thread; afterwards request.user
+    # is a plain attribute read.
+    return await sync_to_async(lambda: request.user.is_authenticated)()
+
+
+def async_login_required(view):
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if not await is_authenticated(request):
+            return redirect_to_login(request.get_full_path())
+        return await view(request, *args, **kwargs)
+
+    return wrapper
+
+
+class AsyncLoginRequiredMixin(LoginRequiredMixin):
+    async def dispatch(self, request, *args, **kwargs):
+        if not await is_authenticated(request):
+            return self.handle_no_permission()
+        return await super().dispatch(request, *args, **kwargs)
+
+
+class AsyncListMixin:
+    async def get(self, request, *args, **kwargs):
+        return await sync_to_async(super().get)(request, *args, **kwargs)
+
+
+class AsyncFragmentCacheMixin:
+    """``FragmentCacheMixin.get`` that serves cached pages on the loop."""
+
+    async def get(self, request, *args, **kwargs):
+        if await self.aload_cached_fragments():
+            return self.render_cached_fragments()
+        return await self.aget_uncached(request, *args, **kwargs)
+
+    async def aget_uncached(self, request, *args, **kwargs):
+        return await sync_to_async(self.get_uncached)(
+            request, *args, **kwargs
+        )
+
+
+class AsyncDetailMixin(AsyncFragmentCacheMixin):
+    async def aget_object(self):
+        try:
+            return await self.get_queryset().aget(pk=self.kwargs["pk"])
+        except self.model.DoesNotExist:
+            raise Http404(
+                f"No {self.model._meta.verbose_name} found matching the query"
+            )
+
+    async def aget_uncached(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        return self.render_to_response(
+            self.get_context_data(object=self.object)
+        )
+
+
+@async_login_required
+async def index(request):
+    counts = await counters.aget_counts()
+    num_visits = await sync_to_async(visit_counter.record)(request.session)
+
+    return render(
+        request, "task/index.html", {**counts, "num_visits": num_visits}
+    )
+
+
+class TaskTypeListView(
+    AsyncLoginRequiredMixin, AsyncListMixin, views.TaskTypeListView
+):
+    pass
+
+
+class PositionListView(
+    AsyncLoginRequiredMixin, AsyncListMixin, views.PositionListView
+):
+    pass
+
+
+class TaskListView(
+    AsyncLoginRequiredMixin, AsyncFragmentCacheMixin, views.TaskListView
+):
+    async def get(self, request, *args, **kwargs):
+        # The deadline bucket counts the page shows next to the fragments.
+        self.bucket_counts = await deadlines.aget_bucket_counts()
+        return await super().get(request, *args, **kwargs)
+
+    def get_bucket_counts(self):
+        return self.bucket_counts
+
+
+class WorkerListView(
+    AsyncLoginRequiredMixin, AsyncFragmentCacheMixin, views.WorkerListView
+):
+    pass
+
+
+class TaskDetailView(
+    AsyncLoginRequiredMixin, AsyncDetailMixin, views.TaskDetailView
+):
+    async def get(self, request, *args, **kwargs):
+        if not await self.aload_cached_fragments():
+            return await self.aget_uncached(request, *args, **kwargs)
+
+        self.is_assignee = await Task.assignees.through.objects.filter(
+            task_id=self.kwargs["pk"], worker_id=request.user.pk
+        ).aexists()
+        return self.render_cached_fragments()
+
+    def get_uncached_context_data(self):
+        if self.object is None:
+            return {
+                "task_id": self.kwargs["pk"],
+                "is_assignee": self.is_assignee,
+            }
+        return super().get_uncached_context_data()
+
+
+class WorkerDetailView(
+    AsyncLoginRequiredMixin, AsyncDetailMixin, views.WorkerDetailView
+):
+    async def aget_uncached(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        self.tasks = [
+            task
+            async for task in self.object.tasks.select_related("task_type")
+        ]
+        return self.render_to_response(
+            self.get_context_data(object=self.object)
+        )
+
+    def get_tasks(self):
+        return self.tasks
@@ -0,0 +1,345 @@
+import asyncio
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from http.cookies import SimpleCookie
+from itertools import takewhile
+
+from asgiref.sync import ThreadSensitiveContext, async_to_sync
+from django.contrib.auth import get_user_model
+from django.db import connection, connections
+from django.db.models import Count
+from django.test import AsyncClient, Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from task.importer import Importer
+from task.models import TaskType, Task, Position
+
+WORDS = (
+    "api", "auth", "billing", "cache", "checkout", "dashboard", "database",
+    "deploy", "email", "export", "import", "invoice", "login", "mobile",
+    "onboarding", "payment", "profile", "report", "search", "settings",
+    "signup", "upload", "webhook", "worker",
+)
+VERBS = (
+    "Fix", "Refactor", "Test", "Document", "Optimize", "Migrate", "Review",
+    "Design", "Implement", "Monitor",
+)
+FIRST_NAMES = (
+    "Joyce", "Jim", "Nancy", "Steve", "Robin", "Dustin", "Lucas", "Max",
+    "Will", "Mike", "Eleven", "Erica", "Eddie", "Karen", "Murray", "Argyle",
+)
+LAST_NAMES = (
+    "Byers", "Hopper", "Wheeler", "Harrington", "Buckley", "Henderson",
+    "Sinclair", "Mayfield", "Munson", "Bauman", "Owens", "Brenner",
+)
+
+
+def generate_records(
+    workers=100,
+    positions=5,
+    task_types=5,
+    tasks=1000,
+    max_assignees=8,
+    completed_ratio=0.3,
+    seed=0,
+):
+    """
+    Yield importer records for a synthetic dataset. Assignee counts
+    decay geometrically up to ``max_assignees`` and assignees are drawn
+    with Zipf-like weights, so a few workers carry most of the tasks.
+    """
+    rng = random.Random(seed)
+
+    for number in range(positions):
+        yield {
+            "model": "task.position",
+            "fields": {"name": f"Position {number}"},
+        }
+    for number in range(task_types):
+        yield {
+            "model": "task.tasktype",
+            "fields": {"name": f"Type {number}"},
+        }
+
+    usernames = []
+    for number in range(workers):
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        username = f"{first_name}.{last_name}.{number}".lower()
+        usernames.append(username)
+        yield {
+            "model": "task.worker",
+            "fields": {
+                "username": username,
+                "first_name": first_name,
+                "last_name": last_name,
+                "position": f"Position {rng.randrange(positions)}"
+                if positions
+                else None,
+            },
+        }
+
+    weights = [1 / rank for rank in range(1, workers + 1)]
+    assignee_counts = range(max_assignees + 1)
+    count_weights = [0.5 ** count for count in assignee_counts]
+    today = timezone.localdate()
+
+    for number in range(tasks):
+        count = min(
+            rng.choices(assignee_counts, count_weights)[0], len(usernames)
+        )
+        assignees = set()
+        while len(assignees) < count:
+            assignees.add(rng.choices(usernames, weights)[0])
+
+        verb, word = rng.choice(VERBS), rng.choice(WORDS)
+        yield {
+            "model": "task.task",
+            "fields": {
+                "name": f"{verb} {word} #{number}",
+                "description": f"{verb} the {word} {rng.choice(WORDS)} flow",
+                "deadline": (
+                    today + timedelta(days=rng.randrange(-90, 365))
+                ).isoformat(),
+                "is_completed": rng.random() < completed_ratio,
+                "priority": rng.choice(Task.Priority.values),
+                "task_type": f"Type {rng.randrange(task_types)}"
+                if task_types
+                else None,
+                "assignees": sorted(assignees),
+            },
+        }
+
+
+def generated_usernames(**options) -> list:
+    """The usernames ``generate_records(**options)`` gives its workers."""
+    return [
+        record["fields"]["username"]
+        for record in takewhile(
+            lambda record: record["model"] != "task.task",
+            generate_records(**options),
+        )
+        if record["model"] == "task.worker"
+    ]
+
+
+def generate_dataset(batch_size=1000, **options):
+    # Some generated deadlines are in the past, to fill the overdue bucket.
+    importer = Importer(batch_size=batch_size, check_deadlines=False)
+    importer.run(generate_records(**options))
+    return importer.counts
+
+
+def get_scenarios():
+    """``name -> url`` for the pages under test, picked from the data."""
+    task = (
+        Task.objects.annotate(assignee_count=Count("assignees"))
+        .order_by("-assignee_count", "id")
+        .only("id")
+        .first()
+    )
+    worker = (
+        get_user_model()
+        .objects.annotate(task_count=Count("tasks"))
+        .order_by("-task_count", "id")
+        .only("id")
+        .first()
+    )
+    last_page = max(1, (Task.objects.count() + 3) // 4)
+    task_list = reverse("task:task-list")
+
+    scenarios = {
+        "index": reverse("task:index"),
+        "task_list": task_list,
+        "task_list_last_page": f"{task_list}?page={last_page}",
+        "task_list_cursor": f"{task_list}?cursor=",
+        "task_search": f"{task_list}?name=dashboard",
+        "worker_search": f"{reverse('task:worker-list')}?username=byers",
+        "task_type_search": f"{reverse('task:task-type-list')}?name=type",
+        "position_search": f"{reverse('task:position-list')}?name=position",
+    }
+    if task:
+        scenarios["task_detail"] = task.get_absolute_url()
+    if worker:
+        scenarios["worker_detail"] = worker.get_absolute_url()
+
+    return scenarios
+
+
+def percentile(timings, percent):
+    if len(timings) == 1:
+        return timings[0]
+    return statistics.quantiles(timings, n=100, method="inclusive")[
+        percent - 1
+    ]
+
+
+def measure(client, url, iterations=20, warmup=2):
+    for _ in range(warmup):
+        client.get(url)
+
+    timings, queries = [], []
+    for _ in range(iterations):
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = client.get(url)
+            timings.append((time.perf_counter() - started) * 1000)
+        queries.append(len(captured))
+
+    return {
+        "url": url,
+        "status": response.status_code,
+        "iterations": iterations,
+        "min_ms": round(min(timings), 3),
+        "p50_ms": round(percentile(timings, 50), 3),
+        "p90_ms": round(percentile(timings, 90), 3),
+        "p99_ms": round(percentile(timings, 99), 3),
+        "max_ms": round(max(timings), 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "queries": max(queries),
+    }
+
+
+def run_benchmark(user, iterations=20, warmup=2, only=None):
+    client = Client()
+    client.force_login(user)
+
+    results = {}
+    for name, url in get_scenarios().items():
+        if only and name not in only:
+            continue
+        results[name] = measure(client, url, iterations, warmup)
+
+    return {
+        "database": connection.vendor,
+        "dataset": {
+            "tasks": Task.objects.count(),
+            "workers": get_user_model().objects.count(),
+            "task_types": TaskType.objects.count(),
+            "positions": Position.objects.count(),
+            "assignments": Task.assignees.through.objects.count(),
+        },
+        "results": results,
+    }
+
+
+ASYNC_URLCONF = "task_manager.urls_async"
+
+
+def _split(requests, concurrency):
+    return [
+        requests // concurrency + (number < requests % concurrency)
+        for number in range(concurrency)
+    ]
+
+
+def _throughput(url, results, elapsed):
+    timings, statuses = [], []
+    for worker_timings, worker_statuses in results:
+        timings += worker_timings
+        statuses += worker_statuses
+
+    return {
+        "url": url,
+        "status": max(statuses),
+        "requests": len(timings),
+        "requests_per_second": round(len(timings) / elapsed, 1),
+        "p50_ms": round(percentile(timings, 50), 3),
+        "p99_ms": round(percentile(timings, 99), 3),
+    }
+
+
+def measure_wsgi(cookies, url, concurrency, requests):
+    """``requests`` sync requests from ``concurrency`` threads."""
+
+    def worker(count):
+        client = Client()
+        client.cookies = SimpleCookie(cookies)
+        timings, statuses = [], []
+        try:
+            for _ in range(count):
+                started = time.perf_counter()
+                statuses.append(client.get(url).status_code)
+                timings.append((time.perf_counter() - started) * 1000)
+        finally:
+            connections.close_all()
+        return timings, statuses
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        results = list(pool.map(worker, _split(requests, concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return _throughput(url, results, elapsed)
+
+
+def measure_asgi(cookies, url, concurrency, requests):
+    """
+    ``requests`` requests to the async views from ``concurrency`` tasks on
+    one event loop, each in its own thread context like ``ASGIHandler``.
+    """
+
+    async def worker(count):
+        client = AsyncClient()
+        client.cookies = SimpleCookie(cookies)
+        timings, statuses = [], []
+        for _ in range(count):
+            async with ThreadSensitiveContext():
+                started = time.perf_counter()
+                response = await client.get(url)
+                timings.append((time.perf_counter() - started) * 1000)
+            statuses.append(response.status_code)
+        return timings, statuses
+
+    async def run():
+        return await asyncio.gather(
+            *(worker(count) for count in _split(requests, concurrency))
+        )
+
+    with override_settings(ROOT_URLCONF=ASYNC_URLCONF):
+        started = time.perf_counter()
+        results = async_to_sync(run)()
+        elapsed = time.perf_counter() - started
+
+    return _throughput(url, results, elapsed)
+
+
+def run_concurrency_benchmark(user, concurrency=8, requests=200, only=None):
+    """Throughput of the WSGI and ASGI stacks under concurrent requests."""
+    client = Client()
+    client.force_login(user)
+
+    results = {"wsgi": {}, "asgi": {}}
+    for name, url in get_scenarios().items():
+        if only and name not in only:
+            continue
+        results["wsgi"][name] = measure_wsgi(
+            client.cookies, url, concurrency, requests
+        )
+        results["asgi"][name] = measure_asgi(
+            client.cookies, url, concurrency, requests
+        )
+
+    return {
+        "database": connection.vendor,
+        "concurrency": concurrency,
+        "results": results,
+    }
+
+
+def compare(baseline, current, metric="p50_ms"):
+    """Yield ``(name, before, after, ratio)`` for scenarios in both runs."""
+    for name, result in current["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if before:
+            yield (
+                name,
+                before[metric],
+                result[metric],
+                result[metric] / before[metric] if before[metric] else None,
+            )
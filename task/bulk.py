@@ -0,0 +1,175 @@
+from django.db import connection, transaction
+
+from task import counters, fragments, journal, task_counts
+from task.models import Task, TaskEvent, Worker
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def _run(report, name, operation):
+    counter = QueryCounter()
+    with connection.execute_wrapper(counter):
+        rows = operation()
+    report[name] = {"rows": rows, "queries": counter.count}
+
+
+def _set_completion(tasks, is_completed):
+    changed = tasks.exclude(is_completed=is_completed)
+    task_counts.completion_changed(changed, is_completed)
+    rows = changed.update(is_completed=is_completed)
+    counters.task_completion_changed(is_completed, rows)
+    return rows
+
+
+def _set_task_type(tasks, task_type):
+    changed = tasks.exclude(task_type=task_type)
+    task_counts.task_type_changed(changed, task_type)
+    return changed.update(task_type=task_type)
+
+
+def _add_assignees(tasks, workers, batch_size):
+    through = Task.assignees.through
+    worker_ids = {worker.pk for worker in workers}
+    existing = set(
+        through.objects.filter(
+            task__in=tasks, worker_id__in=worker_ids
+        ).values_list("task_id", "worker_id")
+    )
+    missing = [
+        through(task_id=task_id, worker_id=worker_id)
+        for task_id in tasks.values_list("id", flat=True)
+        for worker_id in worker_ids
+        if (task_id, worker_id) not in existing
+    ]
+    through.objects.bulk_create(
+        missing, batch_size=batch_size, ignore_conflicts=True
+    )
+    task_counts.reconcile(Worker.objects.filter(pk__in=worker_ids))
+    journal.record_assignments(
+        TaskEvent.Action.ASSIGNED,
+        [(link.task_id, link.worker_id) for link in missing],
+    )
+    return len(missing)
+
+
+def _remove_assignees(tasks, workers):
+    links = Task.assignees.through.objects.filter(
+        task__in=tasks, worker__in=workers
+    )
+    journal.record_assignments(
+        TaskEvent.Action.UNASSIGNED, links.values_list("task_id", "worker_id")
+    )
+    deleted, _ = links.delete()
+    task_counts.reconcile(
+        Worker.objects.filter(pk__in=[worker.pk for worker in workers])
+    )
+    return deleted
+
+
+def _journal_changes(before, changes, report):
+    """Journal the ``changes`` whose operation in ``report`` wrote rows."""
+    journal.record(
+        *(
+            journal.event(task_id, TaskEvent.Action.CHANGED, field, old, new)
+            for task_id, *old_values in before
+            for (field, new), old in zip(changes.items(), old_values)
+            if old != new and report[field]["rows"]
+        )
+    )
+
+
+def _delete(tasks):
+    with task_counts.tasks_deleted(tasks):
+        _, deleted = tasks.delete()
+    return deleted.get(Task._meta.label, 0)
+
+
+def apply_bulk_operations(
+    tasks,
+    *,
+    is_completed=None,
+    priority=None,
+    task_type=None,
+    add_assignees=(),
+    remove_assignees=(),
+    delete=False,
+    batch_size=1000,
+):
+    """
+    Apply every requested change to the ``tasks`` queryset in one
+    transaction and return ``{operation: {"rows": n, "queries": n}}``.
+    """
+    tasks = tasks.order_by()
+    report = {}
+
+    with transaction.atomic():
+        # New values by journaled field, and the old ones before update().
+        changes = {
+            field: value
+            for field, value in (
+                ("is_completed", is_completed),
+                ("priority", priority),
+                ("task_type", task_type and task_type.pk),
+            )
+            if value is not None
+        }
+        # Fix the selection first: the operations below change the
+        # columns its filters may test.
+        before = list(
+            tasks.values_list(
+                "id",
+                *(Task._meta.get_field(name).attname for name in changes),
+            )
+        )
+        tasks = Task.objects.filter(pk__in=[row[0] for row in before])
+
+        if is_completed is not None:
+            _run(
+                report,
+                "is_completed",
+                lambda: _set_completion(tasks, is_completed),
+            )
+        if priority is not None:
+            _run(
+                report,
+                "priority",
+                lambda: tasks.exclude(priority=priority).update(
+                    priority=priority
+                ),
+            )
+        if task_type is not None:
+            _run(
+                report,
+                "task_type",
+                lambda: _set_task_type(tasks, task_type),
+            )
+        if add_assignees:
+            _run(
+                report,
+                "add_assignees",
+                lambda: _add_assignees(tasks, add_assignees, batch_size),
+            )
+        if remove_assignees:
+            _run(
+                report,
+                "remove_assignees",
+                lambda: _remove_assignees(tasks, remove_assignees),
+            )
+        if delete:
+            _run(report, "delete", lambda: _delete(tasks))
+
+        if not delete:
+            _journal_changes(before, changes, report)
+
+        # update() and through-table writes send no model signals.
+        if any(result["rows"] for result in report.values()):
+            fragments.bump("task")
+
+    return report
@@ -0,0 +1,367 @@
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from urllib.parse import urlparse
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.utils.module_loading import import_string
+
+GENERATION_KEY_PREFIX = "task:cache:generation:"
+# Keys under these prefixes embed the version stamps of what they were
+# built from (see task.fragments and task.deadlines), so a write never
+# makes another process' copy stale and bumps no generation.
+VERSIONED_PREFIXES = ("task:fragment:", "task:deadlines:")
+L1_MAX_ENTRIES = 1000
+L1_TIMEOUT = 5
+SYNC_INTERVAL = 1
+
+_MISSING = object()
+
+URL_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+    "rediss": "django.core.cache.backends.redis.RedisCache",
+    "dummy": "django.core.cache.backends.dummy.DummyCache",
+}
+
+
+def parse(url):
+    """Turn ``locmem://name``, ``file:///path`` or ``redis://...`` into a
+    ``CACHES`` entry."""
+    scheme = urlparse(url).scheme
+
+    if scheme not in URL_BACKENDS:
+        raise ValueError(f"Unsupported cache URL: {url}")
+
+    if scheme in ("redis", "rediss"):
+        location = url
+    elif scheme == "file":
+        location = urlparse(url).path
+    else:
+        location = url.split("://", 1)[1]
+
+    return {"BACKEND": URL_BACKENDS[scheme], "LOCATION": location}
+
+
+def namespace(key):
+    """The first two ``:`` separated parts, ``task:counter`` and so on."""
+    return ":".join(key.split(":", 2)[:2])
+
+
+def _generation_key(namespace):
+    return f"{GENERATION_KEY_PREFIX}{namespace}"
+
+
+def config(env="CACHE_URL", default="locmem://", tiered=True):
+    """
+    Build a ``CACHES`` entry from the ``env`` URL, like
+    ``dj_database_url.config``. Shared backends get an in-process L1 in
+    front of them unless ``tiered`` is off or ``CACHE_L1_MAX_ENTRIES`` is 0.
+    """
+    url = os.environ.get(env) or default
+    shared = parse(url)
+    max_entries = int(os.environ.get("CACHE_L1_MAX_ENTRIES", L1_MAX_ENTRIES))
+
+    if not tiered or not max_entries or url.startswith("locmem:"):
+        return shared
+
+    return {
+        "BACKEND": "task.cache.TieredCache",
+        "LOCATION": env,
+        "OPTIONS": {
+            "L2": shared,
+            "L1_MAX_ENTRIES": max_entries,
+            "L1_TIMEOUT": float(
+                os.environ.get("CACHE_L1_TIMEOUT", L1_TIMEOUT)
+            ),
+            "SYNC_INTERVAL": float(
+                os.environ.get("CACHE_SYNC_INTERVAL", SYNC_INTERVAL)
+            ),
+        },
+    }
+
+
+class LocalTier:
+    """
+    The L1 of a ``TieredCache``: an LRU of ``(expires_at, value, namespace)``
+    entries, with the last seen generation of each namespace.
+    Django creates a cache instance per thread, so the instances of one
+    cache share it through ``get_local_tier`` like ``LocMemCache`` does.
+    """
+
+    def __init__(self, max_entries, timeout):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.stats = Counter()
+        self.generations = {}
+        self.synced_at = None
+        self.lock = threading.RLock()
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        with self.lock:
+            entry = self._entries.get(key, _MISSING)
+
+            if entry is _MISSING:
+                return _MISSING
+
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats["expirations"] += 1
+                return _MISSING
+
+            self._entries.move_to_end(key)
+            self.stats["l1_hits"] += 1
+            return value
+
+    def set(self, key, value, namespace, timeout=DEFAULT_TIMEOUT):
+        ttl = self.timeout
+        if timeout is not DEFAULT_TIMEOUT and timeout is not None:
+            ttl = min(ttl, timeout)
+
+        with self.lock:
+            if ttl <= 0:
+                self._entries.pop(key, None)
+                return
+
+            self._entries[key] = (time.monotonic() + ttl, value, namespace)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def delete(self, key):
+        with self.lock:
+            self._entries.pop(key, None)
+
+    def drop(self, namespace) -> int:
+        with self.lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if entry[2] == namespace
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self):
+        with self.lock:
+            self._entries.clear()
+            self.generations.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_local_tiers = {}
+_local_tiers_lock = threading.Lock()
+
+
+def get_local_tier(name, max_entries, timeout):
+    with _local_tiers_lock:
+        if name not in _local_tiers:
+            _local_tiers[name] = LocalTier(max_entries, timeout)
+        return _local_tiers[name]
+
+
+class TieredCache(BaseCache):
+    """
+    A bounded in-process LRU (L1) in front of a shared cache (L2).
+
+    Writes go to L2 and increment the generation of the key's namespace
+    there (see ``namespace``). Every process reads the generations of the
+    namespaces it holds at most once per ``SYNC_INTERVAL`` seconds and
+    drops the entries of those another process has written to, so L1
+    entries are stale for at most ``SYNC_INTERVAL`` and never live longer
+    than ``L1_TIMEOUT``. ``LOCATION`` names the L1.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        l2 = dict(options["L2"])
+        l2_class = import_string(l2.pop("BACKEND"))
+
+        self.l2 = l2_class(l2.pop("LOCATION", ""), l2)
+        self.l1 = get_local_tier(
+            location,
+            options.get("L1_MAX_ENTRIES", L1_MAX_ENTRIES),
+            options.get("L1_TIMEOUT", L1_TIMEOUT),
+        )
+        self.sync_interval = options.get("SYNC_INTERVAL", SYNC_INTERVAL)
+
+    @property
+    def stats(self):
+        return self.l1.stats
+
+    def _l1_key(self, key, version):
+        return self.make_and_validate_key(key, version=version)
+
+    def _sync(self):
+        now = time.monotonic()
+        synced_at = self.l1.synced_at
+
+        if synced_at is not None and now - synced_at < self.sync_interval:
+            return
+
+        with self.l1.lock:
+            known = dict(self.l1.generations)
+        current = self.l2.get_many([_generation_key(name) for name in known])
+
+        with self.l1.lock:
+            for name, generation in known.items():
+                generation_now = current.get(_generation_key(name))
+                if generation_now != generation:
+                    if self.l1.drop(name):
+                        self.stats["invalidations"] += 1
+                    self.l1.generations[name] = generation_now
+            self.l1.synced_at = now
+
+    def _track(self, keys):
+        """
+        Learn the generations of namespaces seen for the first time,
+        before their values are read from L2.
+        """
+        with self.l1.lock:
+            names = {namespace(key) for key in keys} - set(
+                self.l1.generations
+            )
+        if not names:
+            return
+
+        current = self.l2.get_many([_generation_key(name) for name in names])
+        with self.l1.lock:
+            for name in names:
+                self.l1.generations.setdefault(
+                    name, current.get(_generation_key(name))
+                )
+
+    def _cache(self, key, version, value, timeout=DEFAULT_TIMEOUT):
+        self.l1.set(
+            self._l1_key(key, version), value, namespace(key), timeout
+        )
+
+    def _written(self, keys):
+        names = {
+            namespace(key)
+            for key in keys
+            if not key.startswith(VERSIONED_PREFIXES)
+        }
+
+        for name in names:
+            generation_key = _generation_key(name)
+            try:
+                generation = self.l2.incr(generation_key)
+            except ValueError:
+                self.l2.add(generation_key, 0, timeout=None)
+                generation = self.l2.incr(generation_key)
+
+            with self.l1.lock:
+                # Anything but our own increment means another process
+                # wrote to the namespace.
+                known = self.l1.generations.get(name)
+                if known is None or generation != known + 1:
+                    self.l1.drop(name)
+                self.l1.generations[name] = generation
+
+    def get(self, key, default=None, version=None):
+        self._sync()
+        l1_key = self._l1_key(key, version)
+        value = self.l1.get(l1_key)
+
+        if value is not _MISSING:
+            return value
+
+        self._track([key])
+        value = self.l2.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            self.stats["misses"] += 1
+            return default
+
+        self.stats["l2_hits"] += 1
+        self._cache(key, version, value)
+        return value
+
+    def get_many(self, keys, version=None):
+        self._sync()
+        found, missing = {}, []
+
+        for key in keys:
+            value = self.l1.get(self._l1_key(key, version))
+            if value is _MISSING:
+                missing.append(key)
+            else:
+                found[key] = value
+
+        if missing:
+            self._track(missing)
+            fetched = self.l2.get_many(missing, version=version)
+            self.stats["l2_hits"] += len(fetched)
+            self.stats["misses"] += len(missing) - len(fetched)
+            for key, value in fetched.items():
+                self._cache(key, version, value)
+            found.update(fetched)
+
+        return found
+
+    def has_key(self, key, version=None):
+        return self.get(key, _MISSING, version=version) is not _MISSING
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.l2.set(key, value, timeout=timeout, version=version)
+        self._written([key])
+        self._cache(key, version, value, timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        if not self.l2.add(key, value, timeout=timeout, version=version):
+            return False
+
+        self._written([key])
+        self._cache(key, version, value, timeout)
+        return True
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.l2.set_many(data, timeout=timeout, version=version)
+        self._written(data)
+
+        for key, value in data.items():
+            if key not in failed:
+                self._cache(key, version, value, timeout)
+
+        return failed
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.l2.touch(key, timeout=timeout, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        value = self.l2.incr(key, delta, version=version)
+        self._written([key])
+        self._cache(key, version, value)
+        return value
+
+    def delete(self, key, version=None):
+        deleted = self.l2.delete(key, version=version)
+        self._written([key])
+        self.l1.delete(self._l1_key(key, version))
+        return deleted
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        self.l2.delete_many(keys, version=version)
+        self._written(keys)
+
+        for key in keys:
+            self.l1.delete(self._l1_key(key, version))
+
+    def clear(self):
+        self.l2.clear()
+
+        self.l1.clear()
+
+    def close(self, **kwargs):
+        self.l2.close(**kwargs)
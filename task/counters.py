@@ -0,0 +1,130 @@
+import asyncio
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+
+from task.models import TaskType, Task, Position, Worker
+
+COUNTERS = (
+    "task_types",
+    "tasks",
+    "open_tasks",
+    "completed_tasks",
+    "positions",
+    "workers",
+)
+KEY_PREFIX = "task:counter:"
+# Counters are recounted at least this often, so the copies kept by
+# per-process caches cannot drift apart for long.
+TIMEOUT = 300
+
+
+def _key(name: str) -> str:
+    return f"{KEY_PREFIX}{name}"
+
+
+def _timeout() -> int:
+    return getattr(settings, "TASK_COUNTER_TIMEOUT", TIMEOUT)
+
+
+def _counts(task_totals, task_types, positions, workers) -> dict:
+    return {
+        "task_types": task_types,
+        "tasks": task_totals["tasks"],
+        "open_tasks": task_totals["tasks"] - task_totals["completed_tasks"],
+        "completed_tasks": task_totals["completed_tasks"],
+        "positions": positions,
+        "workers": workers,
+    }
+
+
+def _task_totals():
+    return {
+        "tasks": Count("id"),
+        "completed_tasks": Count("id", filter=Q(is_completed=True)),
+    }
+
+
+def compute_counts() -> dict:
+    return _counts(
+        Task.objects.aggregate(**_task_totals()),
+        TaskType.objects.count(),
+        Position.objects.count(),
+        Worker.objects.count(),
+    )
+
+
+async def acompute_counts() -> dict:
+    # Django runs the async ORM on one thread per request, so the queries
+    # still execute one after another; the event loop serves other
+    # requests while they do.
+    return _counts(
+        *await asyncio.gather(
+            Task.objects.aaggregate(**_task_totals()),
+            TaskType.objects.acount(),
+            Position.objects.acount(),
+            Worker.objects.acount(),
+        )
+    )
+
+
+def rebuild() -> dict:
+    counts = compute_counts()
+    cache.set_many(
+        {_key(name): value for name, value in counts.items()},
+        timeout=_timeout(),
+    )
+    return counts
+
+
+async def arebuild() -> dict:
+    counts = await acompute_counts()
+    await cache.aset_many(
+        {_key(name): value for name, value in counts.items()},
+        timeout=_timeout(),
+    )
+    return counts
+
+
+def get_counts() -> dict:
+    cached = cache.get_many([_key(name) for name in COUNTERS])
+
+    if len(cached) != len(COUNTERS):
+        return rebuild()
+
+    return {name: cached[_key(name)] for name in COUNTERS}
+
+
+async def aget_counts() -> dict:
+    cached = await cache.aget_many([_key(name) for name in COUNTERS])
+
+    if len(cached) != len(COUNTERS):
+        return await arebuild()
+
+    return {name: cached[_key(name)] for name in COUNTERS}
+
+
+def _incr(name: str, delta: int) -> None:
+    try:
+        cache.incr(_key(name), delta)
+    except ValueError:
+        # The counter was never built or has been evicted, the next
+        # get_counts() call recounts everything from scratch.
+        pass
+
+
+def incr(name: str, delta: int = 1) -> None:
+    """Add ``delta`` to the counter once the current transaction commits."""
+    transaction.on_commit(partial(_incr, name, delta))
+
+
+def task_completion_changed(is_completed: bool, delta: int = 1) -> None:
+    if is_completed:
+        incr("completed_tasks", delta)
+        incr("open_tasks", -delta)
+    else:
+        incr("open_tasks", delta)
+        incr("completed_tasks", -delta)
@@ -0,0 +1,177 @@
+import calendar
+import re
+from datetime import date, datetime, time, timedelta
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from task import fragments
+from task.models import Task
+
+BUCKETS = {
+    "overdue": "Overdue",
+    "today": "Due today",
+    "week": "Due this week",
+    "later": "Due later",
+}
+CACHE_KEY_PREFIX = "task:deadlines:"
+
+_MONTH = re.compile(r"^(\d{4})-(\d{2})$")
+# Years the calendar can page through without leaving the date range.
+MIN_YEAR = 2
+MAX_YEAR = 9998
+
+
+def end_of_week(today: date) -> date:
+    return today + timedelta(days=6 - today.weekday())
+
+
+def bucket_filter(name: str, today: date) -> Q:
+    """Open tasks in the bucket; buckets do not overlap."""
+    if name == "overdue":
+        deadline = Q(deadline__lt=today)
+    elif name == "today":
+        deadline = Q(deadline=today)
+    elif name == "week":
+        deadline = Q(deadline__gt=today, deadline__lte=end_of_week(today))
+    elif name == "later":
+        deadline = Q(deadline__gt=end_of_week(today))
+    else:
+        raise ValueError(f"Unknown deadline bucket: {name}")
+
+    return Q(is_completed=False) & deadline
+
+
+def month_range(year: int, month: int) -> tuple:
+    return (
+        date(year, month, 1),
+        date(year, month, calendar.monthrange(year, month)[1]),
+    )
+
+
+def parse_month(value: str) -> tuple:
+    match = _MONTH.match(value or "")
+    if (
+        not match
+        or not MIN_YEAR <= int(match[1]) <= MAX_YEAR
+        or not 1 <= int(match[2]) <= 12
+    ):
+        raise ValueError(f"Not a YYYY-MM month: {value}")
+    return int(match[1]), int(match[2])
+
+
+def due_filter(value: str, today: date = None) -> Q:
+    """
+    ``Q`` for a ``?due=`` value: a bucket name, a ``YYYY-MM`` month or a
+    ``YYYY-MM-DD`` day. Months and days include completed tasks.
+    """
+    today = today or timezone.localdate()
+
+    if value in BUCKETS:
+        return bucket_filter(value, today)
+
+    try:
+        return Q(deadline__range=month_range(*parse_month(value)))
+    except ValueError:
+        pass
+
+    try:
+        day = date.fromisoformat(value)
+        if not MIN_YEAR <= day.year <= MAX_YEAR:
+            raise ValueError(value)
+        return Q(deadline=day)
+    except ValueError:
+        raise ValueError(
+            f"due must be one of {', '.join(BUCKETS)}, "
+            f"a YYYY-MM month or a YYYY-MM-DD day"
+        )
+
+
+def _seconds_until_tomorrow() -> int:
+    tomorrow = datetime.combine(
+        timezone.localdate() + timedelta(days=1),
+        time.min,
+        tzinfo=timezone.get_current_timezone(),
+    )
+    return max(1, int((tomorrow - timezone.now()).total_seconds()))
+
+
+def _make_key(name: str, version) -> str:
+    # Keys carry the task version and the date, so they change with any
+    # task write and at midnight; the timeout only frees the old ones.
+    return f"{CACHE_KEY_PREFIX}{name}:{timezone.localdate()}:{version}"
+
+
+def _cache_key(name: str) -> str:
+    (version,) = fragments.get_versions(["task"])
+    return _make_key(name, version)
+
+
+async def _acache_key(name: str) -> str:
+    (version,) = await fragments.aget_versions(["task"])
+    return _make_key(name, version)
+
+
+def _cached(name, compute):
+    key = _cache_key(name)
+    value = cache.get(key)
+
+    if value is None:
+        value = compute()
+        cache.set(key, value, timeout=_seconds_until_tomorrow())
+
+    return value
+
+
+def _bucket_counts_query():
+    today = timezone.localdate()
+    return Task.objects.filter(is_completed=False), {
+        name: Count("id", filter=bucket_filter(name, today))
+        for name in BUCKETS
+    }
+
+
+def get_bucket_counts() -> dict:
+    """``{bucket: open task count}`` from one aggregate query, cached."""
+    tasks, counts = _bucket_counts_query()
+    return _cached("buckets", lambda: tasks.aggregate(**counts))
+
+
+async def aget_bucket_counts() -> dict:
+    key = await _acache_key("buckets")
+    value = await cache.aget(key)
+
+    if value is None:
+        tasks, counts = _bucket_counts_query()
+        value = await tasks.aaggregate(**counts)
+        await cache.aset(key, value, timeout=_seconds_until_tomorrow())
+
+    return value
+
+
+def get_bucket_summary(counts=None) -> list:
+    if counts is None:
+        counts = get_bucket_counts()
+    return [(name, label, counts[name]) for name, label in BUCKETS.items()]
+
+
+def get_day_counts(year: int, month: int) -> dict:
+    """``{day: {"open": n, "total": n}}`` for a month, grouped in one query."""
+
+    def compute():
+        rows = (
+            Task.objects.filter(deadline__range=month_range(year, month))
+            .order_by()
+            .values("deadline")
+            .annotate(
+                total=Count("id"),
+                open=Count("id", filter=Q(is_completed=False)),
+            )
+        )
+        return {
+            row["deadline"]: {"open": row["open"], "total": row["total"]}
+            for row in rows
+        }
+
+    return _cached(f"days:{year}-{month:02}", compute)
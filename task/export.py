@@ -0,0 +1,105 @@
+import csv
+import json
+from collections import defaultdict
+from itertools import islice
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from task.models import Task
+
+EXPORT_COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "deadline",
+    "is_completed",
+    "priority",
+    "task_type",
+    "assignees",
+)
+EXPORT_FORMATS = ("csv", "ndjson")
+CHUNK_SIZE = 2000
+
+
+class Echo:
+    """File-like object whose ``write`` hands the line back to the caller."""
+
+    def write(self, value):
+        return value
+
+
+def iter_task_rows(queryset=None, chunk_size=CHUNK_SIZE):
+    """
+    Yield one dict per task without caching the queryset. Rows are read
+    with a server-side cursor where the database supports it, and the
+    assignee usernames of every chunk are fetched in a single query.
+    """
+    if queryset is None:
+        queryset = Task.objects.all()
+
+    rows = queryset.order_by("id").values_list(
+        "id",
+        "name",
+        "description",
+        "deadline",
+        "is_completed",
+        "priority",
+        "task_type__name",
+    ).iterator(chunk_size=chunk_size)
+
+    while True:
+        chunk = list(islice(rows, chunk_size))
+
+        if not chunk:
+            return
+
+        assignees = defaultdict(list)
+        for task_id, username in (
+            Task.assignees.through.objects.filter(
+                task_id__in=[row[0] for row in chunk]
+            )
+            .order_by("task_id", "worker__username")
+            .values_list("task_id", "worker__username")
+        ):
+            assignees[task_id].append(username)
+
+        for row in chunk:
+            yield {
+                "id": row[0],
+                "name": row[1],
+                "description": row[2],
+                "deadline": row[3],
+                "is_completed": row[4],
+                "priority": Task.Priority(row[5]).label,
+                "task_type": row[6],
+                "assignees": assignees[row[0]],
+            }
+
+
+def iter_csv(rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+
+    for row in rows:
+        yield writer.writerow(
+            [
+                " ".join(row[column])
+                if column == "assignees"
+                else row[column]
+                for column in EXPORT_COLUMNS
+            ]
+        )
+
+
+def iter_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+def iter_export(export_format, queryset=None, chunk_size=CHUNK_SIZE):
+    rows = iter_task_rows(queryset, chunk_size=chunk_size)
+
+    if export_format == "csv":
+        return iter_csv(rows)
+
+    return iter_ndjson(rows)
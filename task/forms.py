@@ -2,9 +2,11 @@ from django import forms
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import UserCreationForm
 from django.core.exceptions import ValidationError
-from django.utils import timezone
+from django.urls import reverse_lazy
 
-from task.models import Worker, Task
+from task import deadlines, search
+from task.models import Worker, Task, TaskType
+from task.validators import validate_deadline
 
 
 class WorkerForm(UserCreationForm):
@@ -23,6 +25,48 @@ class SignupForm(UserCreationForm):
         fields = UserCreationForm.Meta.fields
 
 
+class AutocompleteSelectMultiple(forms.SelectMultiple):
+    """
+    Renders only the selected options; the rest are looked up on demand
+    from the JSON endpoint in ``data-autocomplete-url``.
+    """
+
+    class Media:
+        js = ("js/autocomplete.js",)
+
+    def optgroups(self, name, value, attrs=None):
+        # Invalid submitted values are left to the field's errors.
+        selected = [pk for pk in value if str(pk).isdigit()]
+        queryset = self.choices.queryset.filter(pk__in=selected)
+        choices = self.choices
+        self.choices = [
+            (obj.pk, choices.field.label_from_instance(obj))
+            for obj in (queryset if selected else [])
+        ]
+        try:
+            return super().optgroups(name, value, attrs)
+        finally:
+            self.choices = choices
+
+
+def assignees_field(**kwargs):
+    """A worker multiple choice picked through the autocomplete widget."""
+    return forms.ModelMultipleChoiceField(
+        queryset=get_user_model().objects.only(
+            "id", "username", "first_name", "last_name"
+        ),
+        widget=AutocompleteSelectMultiple(
+            attrs={
+                "data-autocomplete-url": reverse_lazy(
+                    "task:worker-autocomplete"
+                )
+            }
+        ),
+        required=False,
+        **kwargs,
+    )
+
+
 class TaskForm(forms.ModelForm):
     class Meta:
         model = Task
@@ -34,22 +78,11 @@ class TaskForm(forms.ModelForm):
         }
     )
 
-    assignees = forms.ModelMultipleChoiceField(
-        queryset=get_user_model().objects.all(),
-        widget=forms.CheckboxSelectMultiple,
-        required=False
-    )
+    assignees = assignees_field()
 
     def clean_deadline(self):
         deadline = self.cleaned_data["deadline"]
-        if deadline < timezone.localdate():
-            raise ValidationError("The deadline cannot be set in the past")
-
-        max_deadline = timezone.localdate() + timezone.timedelta(days=365 * 20)
-
-        if deadline > max_deadline:
-            raise ValidationError("The deadline cannot be set more than 20 years into the future")
-
+        validate_deadline(deadline)
         return deadline
 
 
@@ -61,6 +94,31 @@ class NameSearchForm(forms.Form):
         widget=forms.TextInput(attrs={"placeholder": "Search by name.."})
     )
 
+    def search(self, queryset):
+        if not self.is_valid():
+            return queryset.none()
+
+        if not self.cleaned_data["name"]:
+            return queryset
+
+        return search.search(queryset, self.cleaned_data["name"])
+
+
+def filter_tasks(queryset, data):
+    """
+    Apply the task list filters in ``data``: the ``name`` search and the
+    ``due`` deadline filter. Raises ValueError for an unknown ``due``.
+    """
+    queryset = NameSearchForm({"name": data.get("name", "")}).search(
+        queryset
+    )
+    due = data.get("due")
+
+    if due:
+        queryset = queryset.filter(deadlines.due_filter(due))
+
+    return queryset
+
 
 class WorkerUsernameSearchForm(forms.Form):
     username = forms.CharField(
@@ -69,3 +127,115 @@ class WorkerUsernameSearchForm(forms.Form):
         label="",
         widget=forms.TextInput(attrs={"placeholder": "Search by username.."})
     )
+
+    def search(self, queryset):
+        if not self.is_valid():
+            return queryset.none()
+
+        if not self.cleaned_data["username"]:
+            return queryset
+
+        return search.search(queryset, self.cleaned_data["username"])
+
+
+class IdListField(forms.Field):
+    widget = forms.MultipleHiddenInput
+    default_error_messages = {
+        "invalid_list": "Enter a list of IDs.",
+    }
+
+    def to_python(self, value):
+        if not value:
+            return []
+        if isinstance(value, str):
+            value = [value]
+        try:
+            return [
+                int(item)
+                for chunk in value
+                for item in str(chunk).split(",")
+                if item.strip()
+            ]
+        except (TypeError, ValueError):
+            raise ValidationError(
+                self.error_messages["invalid_list"], code="invalid_list"
+            )
+
+
+class TaskBulkForm(forms.Form):
+    tasks = IdListField(required=False)
+    select_all = forms.BooleanField(
+        required=False, label="Apply to all tasks matching the search"
+    )
+    name = forms.CharField(
+        max_length=255, required=False, widget=forms.HiddenInput
+    )
+    due = forms.CharField(
+        max_length=32, required=False, widget=forms.HiddenInput
+    )
+    is_completed = forms.TypedChoiceField(
+        choices=[
+            ("", "Completion"),
+            ("true", "Mark as done"),
+            ("false", "Unmark as done"),
+        ],
+        coerce=lambda value: value == "true",
+        empty_value=None,
+        required=False,
+        label="",
+    )
+    priority = forms.TypedChoiceField(
+        choices=[("", "Priority")] + Task.Priority.choices,
+        coerce=int,
+        empty_value=None,
+        required=False,
+        label="",
+    )
+    task_type = forms.ModelChoiceField(
+        queryset=TaskType.objects.all(),
+        empty_label="Task type",
+        required=False,
+        label="",
+    )
+    add_assignees = assignees_field(label="Assign")
+    remove_assignees = assignees_field(label="Unassign")
+    delete = forms.BooleanField(required=False, label="Delete")
+
+    def clean(self):
+        cleaned_data = super().clean()
+
+        if not cleaned_data.get("tasks") and not cleaned_data.get(
+            "select_all"
+        ):
+            raise ValidationError(
+                "Select tasks or apply the operation to the whole search"
+            )
+
+        return cleaned_data
+
+    def clean_due(self):
+        due = self.cleaned_data["due"]
+
+        if due:
+            try:
+                deadlines.due_filter(due)
+            except ValueError as error:
+                raise ValidationError(str(error))
+
+        return due
+
+    def get_queryset(self):
+        if self.cleaned_data["tasks"]:
+            return Task.objects.filter(id__in=self.cleaned_data["tasks"])
+
+        return filter_tasks(Task.objects.all(), self.cleaned_data)
+
+    def get_operations(self):
+        return {
+            "is_completed": self.cleaned_data["is_completed"],
+            "priority": self.cleaned_data["priority"],
+            "task_type": self.cleaned_data["task_type"],
+            "add_assignees": self.cleaned_data["add_assignees"],
+            "remove_assignees": self.cleaned_data["remove_assignees"],
+            "delete": self.cleaned_data["delete"],
+        }
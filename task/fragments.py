@@ -0,0 +1,156 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.db import connection, transaction
+
+VERSIONED_MODELS = ("task", "worker", "position", "tasktype")
+VERSION_KEY_PREFIX = "task:version:"
+FRAGMENT_KEY_PREFIX = "task:fragment:"
+# Stale fragments are never read again once a version moves on, the
+# timeout only bounds how long they occupy the cache.
+FRAGMENT_TIMEOUT = 60 * 60 * 24
+
+
+def _version_key(name: str) -> str:
+    return f"{VERSION_KEY_PREFIX}{name}"
+
+
+def _missing_versions(keys, versions) -> dict:
+    return {key: time.time_ns() for key in keys if key not in versions}
+
+
+def get_versions(names) -> list:
+    keys = [_version_key(name) for name in names]
+    versions = cache.get_many(keys)
+    missing = _missing_versions(keys, versions)
+
+    if missing:
+        cache.set_many(missing, timeout=None)
+        versions.update(missing)
+
+    return [versions[key] for key in keys]
+
+
+async def aget_versions(names) -> list:
+    keys = [_version_key(name) for name in names]
+    versions = await cache.aget_many(keys)
+    missing = _missing_versions(keys, versions)
+
+    if missing:
+        await cache.aset_many(missing, timeout=None)
+        versions.update(missing)
+
+    return [versions[key] for key in keys]
+
+
+def _set_versions(names):
+    cache.set_many(
+        {_version_key(name): time.time_ns() for name in names}, timeout=None
+    )
+
+
+def bump(*names):
+    """
+    Give the models a new version stamp, invalidating every fragment
+    rendered from them. Inside a transaction the stamp moves again on
+    commit, so fragments rendered from the old rows meanwhile are dropped.
+    """
+    _set_versions(names)
+
+    if connection.in_atomic_block:
+        transaction.on_commit(lambda: _set_versions(names))
+
+
+def _make_key(name, versions, parts) -> str:
+    versions = "-".join(str(version) for version in versions)
+    digest = hashlib.md5(repr(parts).encode()).hexdigest()
+    return f"{FRAGMENT_KEY_PREFIX}{name}:{versions}:{digest}"
+
+
+def make_key(name, models, *parts) -> str:
+    return _make_key(name, get_versions(models), parts)
+
+
+async def amake_key(name, models, *parts) -> str:
+    return _make_key(name, await aget_versions(models), parts)
+
+
+class FragmentCacheMixin:
+    """
+    Caches the ``{% fragment %}`` blocks of a view's template under keys
+    built from the version stamps of ``fragment_models`` and the request.
+    When every fragment is cached the page is rendered from them alone,
+    without loading the objects; per-user parts of the page must stay
+    outside the fragments and come from ``get_uncached_context_data``.
+    """
+
+    fragment_models = ()
+    fragment_names = ("content",)
+
+    def get_fragment_key_parts(self):
+        """Anything besides the URL that the fragments depend on."""
+        return ()
+
+    def get_fragment_key_args(self):
+        return (
+            self.request.resolver_match.view_name,
+            self.fragment_models,
+            sorted(self.kwargs.items()),
+            sorted(self.request.GET.lists()),
+            *self.get_fragment_key_parts(),
+        )
+
+    def get_fragment_keys(self, base=None):
+        if base is None:
+            base = make_key(*self.get_fragment_key_args())
+        return {name: f"{base}:{name}" for name in self.fragment_names}
+
+    def get_uncached_context_data(self):
+        return {}
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update(self.get_uncached_context_data())
+        return context
+
+    def load_cached_fragments(self) -> bool:
+        """Look the fragments up, True when all of them are cached."""
+        self.fragment_keys = self.get_fragment_keys()
+        return self.use_cached_fragments(
+            cache.get_many(self.fragment_keys.values())
+        )
+
+    async def aload_cached_fragments(self) -> bool:
+        self.fragment_keys = self.get_fragment_keys(
+            await amake_key(*self.get_fragment_key_args())
+        )
+        return self.use_cached_fragments(
+            await cache.aget_many(self.fragment_keys.values())
+        )
+
+    def use_cached_fragments(self, cached) -> bool:
+        if len(cached) < len(self.fragment_keys):
+            self.cached_fragments = {}
+            return False
+
+        self.cached_fragments = {
+            name: cached[key] for name, key in self.fragment_keys.items()
+        }
+        return True
+
+    def render_cached_fragments(self):
+        self.object = None
+        self.object_list = self.model._default_manager.none()
+
+        return self.render_to_response(
+            {"view": self, **self.get_uncached_context_data()}
+        )
+
+    def get_uncached(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get(self, request, *args, **kwargs):
+        if self.load_cached_fragments():
+            return self.render_cached_fragments()
+        return self.get_uncached(request, *args, **kwargs)
@@ -0,0 +1,392 @@
+import csv
+import json
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.exceptions import ValidationError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+
+from task import counters, fragments, task_counts
+from task.models import TaskType, Task, Position
+from task.validators import validate_deadline
+
+IMPORT_FORMATS = ("csv", "ndjson", "json")
+IMPORT_MODELS = {
+    "task": "task.task",
+    "worker": "task.worker",
+    "tasktype": "task.tasktype",
+    "position": "task.position",
+}
+BATCH_SIZE = 1000
+TASK_FIELDS = ("name", "description", "deadline", "is_completed", "priority")
+WORKER_FIELDS = (
+    "username",
+    "first_name",
+    "last_name",
+    "email",
+    "is_staff",
+    "is_active",
+    "is_superuser",
+    "date_joined",
+    "last_login",
+)
+
+
+class RowError(ValueError):
+    pass
+
+
+def iter_csv(file):
+    yield from csv.DictReader(file)
+
+
+def iter_ndjson(file):
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def iter_json(file, chunk_size=64 * 1024):
+    """
+    Yield the items of a top-level JSON array (e.g. a ``dumpdata``
+    fixture) one by one, holding only the current item in memory.
+    """
+    decoder = json.JSONDecoder()
+    buffer = file.read(chunk_size).lstrip()
+
+    if not buffer.startswith("["):
+        raise RowError("Expected a JSON array")
+
+    buffer = buffer[1:]
+
+    while True:
+        buffer = buffer.lstrip(", \t\r\n")
+
+        if buffer.startswith("]"):
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                raise RowError("Unexpected end of JSON array")
+            buffer += chunk
+            continue
+
+        yield item
+        buffer = buffer[end:]
+
+
+READERS = {
+    "csv": iter_csv,
+    "ndjson": iter_ndjson,
+    "json": iter_json,
+}
+
+
+class Lookup:
+    """In-memory ``natural key -> id`` table for a model."""
+
+    def __init__(self, pairs):
+        self.ids_by_key = dict(pairs)
+        self.ids = set(self.ids_by_key.values())
+
+    def __contains__(self, key):
+        return key in self.ids_by_key
+
+    def add(self, key, pk):
+        self.ids_by_key[key] = pk
+        if pk is not None:
+            self.ids.add(pk)
+
+    def get(self, value):
+        # Fixtures reference rows by primary key, flat files by name.
+        if isinstance(value, int):
+            if value not in self.ids:
+                raise RowError(f"Unknown id: {value}")
+            return value
+
+        if value not in self.ids_by_key:
+            raise RowError(f"Unknown name: {value}")
+
+        return self.ids_by_key[value]
+
+
+class Importer:
+    """
+    Loads tasks, workers, task types and positions with ``bulk_create``
+    in batches of ``batch_size``. Task types and positions are resolved
+    by name (or fixture id) through in-memory lookups, and assignees are
+    written straight into the through table.
+
+    Tasks must follow the deadline rules of the task form unless
+    ``check_deadlines`` is off, e.g. for historical data. With ``dry_run``
+    nothing is written; every row is validated the same way and the errors
+    are collected.
+    """
+
+    def __init__(
+        self,
+        batch_size=BATCH_SIZE,
+        dry_run=False,
+        keep_ids=True,
+        check_deadlines=True,
+    ):
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.check_deadlines = check_deadlines
+        self.keep_ids = keep_ids
+        self.task_types = Lookup(TaskType.objects.values_list("name", "id"))
+        self.positions = Lookup(Position.objects.values_list("name", "id"))
+        self.workers = Lookup(
+            get_user_model().objects.order_by().values_list("username", "id")
+        )
+        self.pending_tasks = []
+        self.pending_workers = []
+        self.models_with_ids = set()
+        self.counts = {
+            "records": 0,
+            "tasktype": 0,
+            "position": 0,
+            "worker": 0,
+            "task": 0,
+            "assignments": 0,
+        }
+        self.errors = []
+
+    def run(self, records, default_model="task"):
+        with transaction.atomic():
+            for number, record in enumerate(records, start=1):
+                self.counts["records"] += 1
+                try:
+                    self.add(record, default_model)
+                except (RowError, ValidationError) as error:
+                    messages = getattr(error, "messages", [str(error)])
+                    if not self.dry_run:
+                        raise RowError(
+                            f"Record {number}: {'; '.join(messages)}"
+                        )
+                    self.errors.extend(
+                        f"Record {number}: {message}" for message in messages
+                    )
+
+            self.flush_workers()
+            self.flush_tasks()
+
+            if not self.dry_run:
+                self.reset_sequences()
+                counters.rebuild()
+                task_counts.reconcile()
+                fragments.bump(*fragments.VERSIONED_MODELS)
+
+        return self.counts
+
+    def add(self, record, default_model):
+        if not isinstance(record, dict):
+            raise RowError("Expected an object")
+
+        if "model" in record and "fields" in record:
+            label, pk, fields = record["model"], record.get("pk"), dict(
+                record["fields"]
+            )
+        else:
+            fields = dict(record)
+            label, pk = IMPORT_MODELS[default_model], fields.pop("id", None)
+
+        if pk in ("", None) or not self.keep_ids:
+            pk = None
+        else:
+            try:
+                pk = int(pk)
+            except (TypeError, ValueError):
+                raise RowError(f"Invalid id: {pk}")
+
+        if label == "task.tasktype":
+            self.add_name(TaskType, self.task_types, "tasktype", pk, fields)
+        elif label == "task.position":
+            self.add_name(Position, self.positions, "position", pk, fields)
+        elif label == "task.worker":
+            self.add_worker(pk, fields)
+        elif label == "task.task":
+            self.add_task(pk, fields)
+        else:
+            raise RowError(f"Unsupported model: {label}")
+
+    def add_name(self, model, lookup, counter, pk, fields):
+        name = fields.get("name")
+
+        if not name:
+            raise RowError("Name is required")
+        if name in lookup:
+            return
+
+        obj = model(pk=pk, name=name)
+        obj.clean_fields()
+
+        if not self.dry_run:
+            obj.save(force_insert=True)
+            if pk is not None:
+                self.models_with_ids.add(model)
+
+        lookup.add(name, obj.pk)
+        self.counts[counter] += 1
+
+    def get_or_create_name(self, model, lookup, counter, value):
+        if value in ("", None):
+            return None
+        if isinstance(value, str) and value not in lookup:
+            self.add_name(model, lookup, counter, None, {"name": value})
+        return lookup.get(value)
+
+    def build(self, model, pk, fields, names):
+        obj = model(pk=pk)
+
+        for name in names:
+            value = fields.get(name)
+            if value in ("", None):
+                continue
+            field = model._meta.get_field(name)
+            setattr(obj, field.attname, field.to_python(value))
+
+        return obj
+
+    def add_worker(self, pk, fields):
+        worker = self.build(get_user_model(), pk, fields, WORKER_FIELDS)
+
+        if worker.username in self.workers:
+            raise RowError(f"Worker {worker.username} already exists")
+
+        password = fields.get("password")
+        try:
+            identify_hasher(password)
+        except (TypeError, ValueError):
+            password = make_password(password or None)
+        worker.password = password
+
+        worker.position_id = self.get_or_create_name(
+            Position, self.positions, "position", fields.get("position")
+        )
+        worker.clean_fields(exclude=["position"])
+
+        self.workers.add(worker.username, worker.pk)
+        self.pending_workers.append(worker)
+
+        if len(self.pending_workers) >= self.batch_size:
+            self.flush_workers()
+
+    def add_task(self, pk, fields):
+        # Assignees may be workers from earlier in the same file.
+        self.flush_workers()
+
+        fields["priority"] = self.parse_priority(fields.get("priority"))
+        task = self.build(Task, pk, fields, TASK_FIELDS)
+        task.task_type_id = self.get_or_create_name(
+            TaskType, self.task_types, "tasktype", fields.get("task_type")
+        )
+        task.clean_fields(exclude=["task_type"])
+
+        if self.check_deadlines:
+            validate_deadline(task.deadline)
+
+        assignees = fields.get("assignees") or []
+        if isinstance(assignees, str):
+            assignees = assignees.split()
+        worker_ids = {self.workers.get(worker) for worker in assignees}
+
+        self.pending_tasks.append((task, worker_ids))
+
+        if len(self.pending_tasks) >= self.batch_size:
+            self.flush_tasks()
+
+    def parse_priority(self, value):
+        if value in ("", None):
+            return Task.Priority.MEDIUM
+
+        for priority in Task.Priority:
+            if str(value).lower() == priority.label.lower():
+                return priority
+
+        try:
+            return Task.Priority(int(value))
+        except (TypeError, ValueError):
+            raise RowError(f"Invalid priority: {value}")
+
+    def flush_workers(self):
+        if not self.pending_workers:
+            return
+
+        workers, self.pending_workers = self.pending_workers, []
+        self.counts["worker"] += len(workers)
+
+        if self.dry_run:
+            return
+
+        get_user_model().objects.bulk_create(
+            workers, batch_size=self.batch_size
+        )
+        for worker in workers:
+            self.workers.add(worker.username, worker.pk)
+        if any(worker.pk is not None for worker in workers):
+            self.models_with_ids.add(get_user_model())
+
+    def flush_tasks(self):
+        if not self.pending_tasks:
+            return
+
+        pending, self.pending_tasks = self.pending_tasks, []
+        self.counts["task"] += len(pending)
+        self.counts["assignments"] += sum(
+            len(worker_ids) for _, worker_ids in pending
+        )
+
+        if self.dry_run:
+            return
+
+        tasks = [task for task, _ in pending]
+        if any(task.pk is not None for task in tasks):
+            self.models_with_ids.add(Task)
+
+        Task.objects.bulk_create(tasks, batch_size=self.batch_size)
+
+        through = Task.assignees.through
+        through.objects.bulk_create(
+            [
+                through(task_id=task.pk, worker_id=worker_id)
+                for task, worker_ids in pending
+                for worker_id in worker_ids
+            ],
+            batch_size=self.batch_size,
+        )
+
+    def reset_sequences(self):
+        # Rows inserted with explicit ids do not advance the sequences.
+        if not self.models_with_ids:
+            return
+
+        statements = connection.ops.sequence_reset_sql(
+            no_style(), list(self.models_with_ids)
+        )
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+
+def import_file(
+    file,
+    import_format,
+    default_model="task",
+    batch_size=BATCH_SIZE,
+    dry_run=False,
+    keep_ids=True,
+    check_deadlines=True,
+):
+    importer = Importer(
+        batch_size=batch_size,
+        dry_run=dry_run,
+        keep_ids=keep_ids,
+        check_deadlines=check_deadlines,
+    )
+    importer.run(READERS[import_format](file), default_model=default_model)
+    return importer
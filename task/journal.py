@@ -0,0 +1,203 @@
+import contextvars
+from datetime import timedelta
+from functools import partial
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.db import transaction
+from django.db.models import DEFERRED, Max
+from django.utils import timezone
+
+from task.models import TaskEvent
+
+BATCH_SIZE = 500
+RETENTION_DAYS = 365
+# Fields whose changes are journaled, by attname.
+TRACKED_FIELDS = {
+    "name": "name",
+    "description": "description",
+    "deadline": "deadline",
+    "is_completed": "is_completed",
+    "priority": "priority",
+    "task_type_id": "task_type",
+}
+
+_journal = contextvars.ContextVar("task_journal", default=None)
+
+
+class Journal:
+    """
+    Buffer of task events written with ``bulk_create``, once every
+    ``TASK_EVENT_BATCH_SIZE`` events and when the ``with`` block ends.
+    Events join the buffer when the transaction that made the change
+    commits, so rolled back changes leave no trace.
+    """
+
+    def __init__(self, user=None, batch_size=None):
+        self.user = user
+        self.batch_size = batch_size or getattr(
+            settings, "TASK_EVENT_BATCH_SIZE", BATCH_SIZE
+        )
+        self.pending = []
+        self.closed = False
+
+    @property
+    def actor_id(self):
+        # request.user is lazy, only journaled requests load it.
+        return getattr(self.user, "pk", None)
+
+    def extend(self, events):
+        self.pending.extend(events)
+
+        # Changes committed after the block ended are written at once.
+        if self.closed or len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        pending, self.pending = self.pending, []
+
+        if pending:
+            TaskEvent.objects.bulk_create(pending, batch_size=self.batch_size)
+
+        return len(pending)
+
+    def __enter__(self):
+        self._token = _journal.set(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        _journal.reset(self._token)
+        self.closed = True
+        self.flush()
+
+
+class JournalMiddleware:
+    """Writes the task events of each request in one bulk insert."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        with Journal(user=getattr(request, "user", None)):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        journal = Journal(user=getattr(request, "user", None))
+        token = _journal.set(journal)
+        try:
+            return await self.get_response(request)
+        finally:
+            _journal.reset(token)
+            journal.closed = True
+            await sync_to_async(journal.flush)()
+
+
+def event(task_id, action, field="", old_value=None, new_value=None):
+    return TaskEvent(
+        task_id=task_id,
+        action=action,
+        field=field,
+        old_value=old_value,
+        new_value=new_value,
+        created_at=timezone.now(),
+    )
+
+
+def record(*events):
+    """
+    Journal ``events`` once the current transaction commits, through the
+    active ``Journal`` or, outside one, with a single insert.
+    """
+    if not events:
+        return
+
+    journal = _journal.get()
+
+    if journal is None:
+        transaction.on_commit(partial(TaskEvent.objects.bulk_create, events))
+        return
+
+    for task_event in events:
+        task_event.actor_id = journal.actor_id
+
+    transaction.on_commit(partial(journal.extend, events))
+
+
+def changed_fields(task):
+    """``(field, old, new)`` for the tracked fields ``save()`` changed."""
+    for attname, field in TRACKED_FIELDS.items():
+        old = task.loaded_value(attname)
+        new = getattr(task, attname)
+        if old is not DEFERRED and old != new:
+            yield field, old, new
+
+
+def record_changes(task):
+    record(
+        *(
+            event(task.pk, TaskEvent.Action.CHANGED, field, old, new)
+            for field, old, new in changed_fields(task)
+        )
+    )
+
+
+def record_assignments(action, pairs):
+    """Journal ``(task_id, worker_id)`` pairs as assigned or unassigned."""
+    assigned = action == TaskEvent.Action.ASSIGNED
+    record(
+        *(
+            event(
+                task_id,
+                action,
+                "assignees",
+                old_value=None if assigned else worker_id,
+                new_value=worker_id if assigned else None,
+            )
+            for task_id, worker_id in pairs
+        )
+    )
+
+
+def compact(days=None, keep_latest=False, batch_size=10000) -> int:
+    """
+    Delete events older than ``days`` (``TASK_EVENT_RETENTION_DAYS``) in
+    batches of ``batch_size``. ``keep_latest`` keeps the newest old event
+    of each task field, so every task's history still starts from a known
+    value. Returns the number of events deleted.
+    """
+    if days is None:
+        days = getattr(settings, "TASK_EVENT_RETENTION_DAYS", RETENTION_DAYS)
+
+    old = TaskEvent.objects.filter(
+        created_at__lt=timezone.now() - timedelta(days=days)
+    )
+    if keep_latest:
+        old = old.exclude(
+            id__in=old.order_by()
+            .values("task_id", "field")
+            .annotate(latest=Max("id"))
+            .values("latest")
+        )
+
+    deleted = 0
+    while True:
+        ids = list(
+            old.order_by("id").values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+
+        count, _ = TaskEvent.objects.filter(id__in=ids).delete()
+        deleted += count
@@ -0,0 +1,103 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from task.benchmark import (
+    compare,
+    run_benchmark,
+    run_concurrency_benchmark,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure latency percentiles and query counts of the main pages "
+        "and write them as JSON"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=2)
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            dest="scenarios",
+            help="Only run this scenario, can be repeated",
+        )
+        parser.add_argument(
+            "--user", help="Username to log in as, defaults to the first one"
+        )
+        parser.add_argument(
+            "--output", help="File to write to, defaults to stdout"
+        )
+        parser.add_argument(
+            "--compare", help="Earlier result file to compare p50 latency to"
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            help="Compare WSGI and ASGI throughput with this many "
+            "concurrent clients instead of measuring latency",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="Requests per scenario and stack with --concurrency",
+        )
+
+    def handle(self, *args, **options):
+        users = get_user_model().objects.order_by("id")
+        if options["user"]:
+            users = users.filter(username=options["user"])
+        user = users.first()
+
+        if user is None:
+            raise CommandError("No user to log in as, run generate_data first")
+
+        # Lets the test client through ALLOWED_HOSTS.
+        setup_test_environment()
+        try:
+            if options["concurrency"]:
+                report = run_concurrency_benchmark(
+                    user,
+                    concurrency=options["concurrency"],
+                    requests=options["requests"],
+                    only=options["scenarios"],
+                )
+            else:
+                report = run_benchmark(
+                    user,
+                    iterations=options["iterations"],
+                    warmup=options["warmup"],
+                    only=options["scenarios"],
+                )
+        finally:
+            teardown_test_environment()
+
+        output = json.dumps(report, indent=2, sort_keys=True)
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as file:
+                file.write(output + "\n")
+        else:
+            self.stdout.write(output)
+
+        if options["concurrency"]:
+            for name, wsgi in report["results"]["wsgi"].items():
+                asgi = report["results"]["asgi"][name]
+                self.stderr.write(
+                    f"{name}: WSGI {wsgi['requests_per_second']} req/s, "
+                    f"ASGI {asgi['requests_per_second']} req/s"
+                )
+        elif options["compare"]:
+            with open(options["compare"], encoding="utf-8") as file:
+                baseline = json.load(file)
+
+            for name, before, after, ratio in compare(baseline, report):
+                change = f"{ratio:.2f}x" if ratio is not None else "n/a"
+                self.stderr.write(
+                    f"{name}: {before:.2f}ms -> {after:.2f}ms ({change})"
+                )
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from task import journal
+
+
+class Command(BaseCommand):
+    help = "Delete task events older than the retention period"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Keep this many days of events, defaults to "
+            "TASK_EVENT_RETENTION_DAYS",
+        )
+        parser.add_argument(
+            "--keep-latest",
+            action="store_true",
+            help="Keep the newest old event of each task field",
+        )
+        parser.add_argument("--batch-size", type=int, default=10000)
+
+    def handle(self, *args, **options):
+        deleted = journal.compact(
+            days=options["days"],
+            keep_latest=options["keep_latest"],
+            batch_size=options["batch_size"],
+        )
+
+        self.stdout.write(self.style.SUCCESS(f"{deleted} event(s) deleted"))
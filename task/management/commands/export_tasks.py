@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from task.export import CHUNK_SIZE, EXPORT_FORMATS, iter_export
+
+
+class Command(BaseCommand):
+    help = "Stream every task with its task type and assignees"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format", choices=EXPORT_FORMATS, default="csv"
+        )
+        parser.add_argument(
+            "--output", help="File to write to, defaults to stdout"
+        )
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1")
+
+        lines = iter_export(
+            options["format"], chunk_size=options["chunk_size"]
+        )
+
+        if not options["output"]:
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+
+        with open(
+            options["output"], "w", encoding="utf-8", newline=""
+        ) as output:
+            output.writelines(lines)
@@ -0,0 +1,71 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from task.benchmark import generate_dataset, generated_usernames
+from task.importer import RowError
+
+
+class Command(BaseCommand):
+    help = "Generate a synthetic dataset for benchmarks"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=100)
+        parser.add_argument("--positions", type=int, default=5)
+        parser.add_argument("--task-types", type=int, default=5)
+        parser.add_argument("--tasks", type=int, default=10000)
+        parser.add_argument(
+            "--max-assignees",
+            type=int,
+            default=8,
+            help="Most tasks get one or two assignees, a few get up to this",
+        )
+        parser.add_argument("--completed-ratio", type=float, default=0.3)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        dataset = {
+            name: options[name]
+            for name in (
+                "workers",
+                "positions",
+                "task_types",
+                "tasks",
+                "max_assignees",
+                "completed_ratio",
+                "seed",
+            )
+        }
+        clashes = list(
+            get_user_model()
+            .objects.filter(username__in=generated_usernames(**dataset))
+            .order_by("username")
+            .values_list("username", flat=True)[:5]
+        )
+        if clashes:
+            raise CommandError(
+                f"Generated usernames already exist ({', '.join(clashes)}), "
+                f"run it on an empty database (manage.py flush)."
+            )
+
+        try:
+            counts = generate_dataset(
+                batch_size=options["batch_size"], **dataset
+            )
+        except (RowError, IntegrityError) as error:
+            raise CommandError(
+                f"Generation failed, nothing was saved: {error}"
+            )
+
+        for name in ("tasktype", "position", "worker", "task", "assignments"):
+            self.stdout.write(f"{name}: {counts[name]}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Dataset generated in {time.perf_counter() - started:.2f}s"
+            )
+        )
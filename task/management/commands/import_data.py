@@ -0,0 +1,102 @@
+import os
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from task.importer import (
+    BATCH_SIZE,
+    IMPORT_FORMATS,
+    IMPORT_MODELS,
+    RowError,
+    import_file,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk import tasks, workers, task types and positions from CSV, "
+        "NDJSON or JSON fixture files"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to read, '-' for stdin")
+        parser.add_argument(
+            "--format",
+            choices=IMPORT_FORMATS,
+            help="Defaults to the file extension",
+        )
+        parser.add_argument(
+            "--model",
+            choices=IMPORT_MODELS,
+            default="task",
+            help="Model of the rows in CSV/NDJSON files without a model key",
+        )
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate every row without writing anything",
+        )
+        parser.add_argument(
+            "--ignore-ids",
+            action="store_true",
+            help="Let the database assign ids instead of using the file's",
+        )
+        parser.add_argument(
+            "--skip-deadline-checks",
+            action="store_true",
+            help="Accept deadlines the task form would reject, e.g. past "
+            "ones in historical data",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        import_format = options["format"] or os.path.splitext(path)[1][1:]
+
+        if import_format not in IMPORT_FORMATS:
+            raise CommandError(
+                f"Cannot guess the format of {path}, pass --format"
+            )
+
+        started = time.perf_counter()
+        try:
+            if path == "-":
+                importer = self.run(sys.stdin, import_format, options)
+            else:
+                with open(path, encoding="utf-8", newline="") as file:
+                    importer = self.run(file, import_format, options)
+        except (RowError, ValueError, IntegrityError) as error:
+            raise CommandError(f"Import failed, nothing was saved: {error}")
+        elapsed = time.perf_counter() - started
+
+        counts = importer.counts
+        for name in ("tasktype", "position", "worker", "task", "assignments"):
+            self.stdout.write(f"{name}: {counts[name]}")
+
+        self.stdout.write(
+            f"{counts['records']} records in {elapsed:.2f}s "
+            f"({counts['records'] / max(elapsed, 1e-9):.0f} rows/s)"
+        )
+
+        if options["dry_run"]:
+            for error in importer.errors:
+                self.stderr.write(error)
+            if importer.errors:
+                raise CommandError(f"{len(importer.errors)} invalid records")
+            self.stdout.write(self.style.SUCCESS("All records are valid"))
+            return
+
+        self.stdout.write(self.style.SUCCESS("Import finished"))
+
+    def run(self, file, import_format, options):
+        return import_file(
+            file,
+            import_format,
+            default_model=options["model"],
+            batch_size=options["batch_size"],
+            dry_run=options["dry_run"],
+            keep_ids=not options["ignore_ids"],
+            check_deadlines=not options["skip_deadline_checks"],
+        )
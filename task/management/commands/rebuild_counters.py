@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from task import counters
+
+
+class Command(BaseCommand):
+    help = "Recount the dashboard counters from the database"
+
+    def handle(self, *args, **options):
+        counts = counters.rebuild()
+
+        for name, value in counts.items():
+            self.stdout.write(f"{name}: {value}")
+
+        self.stdout.write(self.style.SUCCESS("Dashboard counters rebuilt"))
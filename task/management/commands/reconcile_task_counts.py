@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from task import fragments, task_counts
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount the task and worker count columns of workers, task types "
+        "and positions, fixing rows that drifted"
+    )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            repaired = task_counts.reconcile()
+
+        if any(repaired.values()):
+            fragments.bump("worker", "tasktype", "position")
+
+        for name, rows in repaired.items():
+            self.stdout.write(f"{name}: {rows} row(s) fixed")
+
+        self.stdout.write(self.style.SUCCESS("Task counts reconciled"))
@@ -0,0 +1,334 @@
+import contextvars
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import ExitStack
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.template import TemplateDoesNotExist
+from django.template.backends.django import DjangoTemplates, Template, reraise
+from django.utils.crypto import constant_time_compare
+
+logger = logging.getLogger("task.requests")
+
+SECONDS_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+SLOW_REQUEST_MS = 500
+
+_request_stats = contextvars.ContextVar("task_request_stats", default=None)
+
+
+class Histogram:
+    """Cumulative Prometheus-style histogram keyed by label values."""
+
+    def __init__(self, name, documentation, labels, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = buckets
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = {
+                    "buckets": [0] * len(self.buckets),
+                    "sum": 0.0,
+                    "count": 0,
+                }
+            index = bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series["buckets"][index] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def _sample(self, suffix, label_values, value, le=None):
+        pairs = list(zip(self.labels, label_values))
+        if le is not None:
+            pairs.append(("le", le))
+        labels = ",".join(
+            '{}="{}"'.format(
+                name,
+                str(label)
+                .replace("\\", "\\\\")
+                .replace('"', '\\"')
+                .replace("\n", "\\n"),
+            )
+            for name, label in pairs
+        )
+        return f"{self.name}{suffix}{{{labels}}} {value}"
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+
+        with self._lock:
+            series = sorted(
+                (label_values, dict(data, buckets=list(data["buckets"])))
+                for label_values, data in self._series.items()
+            )
+
+        for label_values, data in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets, data["buckets"]):
+                cumulative += count
+                lines.append(
+                    self._sample("_bucket", label_values, cumulative, bound)
+                )
+            lines += [
+                self._sample("_bucket", label_values, data["count"], "+Inf"),
+                self._sample("_sum", label_values, data["sum"]),
+                self._sample("_count", label_values, data["count"]),
+            ]
+
+        return "\n".join(lines)
+
+
+REQUEST_DURATION = Histogram(
+    "task_request_duration_seconds",
+    "Wall time of a request.",
+    ("view", "method", "status"),
+    SECONDS_BUCKETS,
+)
+DB_DURATION = Histogram(
+    "task_request_db_duration_seconds",
+    "Time spent in database queries during a request.",
+    ("view", "method"),
+    SECONDS_BUCKETS,
+)
+DB_QUERIES = Histogram(
+    "task_request_db_queries",
+    "Number of database queries issued by a request.",
+    ("view", "method"),
+    QUERY_BUCKETS,
+)
+TEMPLATE_DURATION = Histogram(
+    "task_request_template_duration_seconds",
+    "Time spent rendering templates during a request.",
+    ("view", "method"),
+    SECONDS_BUCKETS,
+)
+HISTOGRAMS = (REQUEST_DURATION, DB_DURATION, DB_QUERIES, TEMPLATE_DURATION)
+
+
+CACHE_EVENTS = "task_cache_events_total"
+
+
+def render_cache_stats():
+    """Hits, misses and L1 evictions of the caches that count them."""
+    lines = [
+        f"# HELP {CACHE_EVENTS} Lookups and L1 evictions of tiered caches.",
+        f"# TYPE {CACHE_EVENTS} counter",
+    ]
+
+    for alias in settings.CACHES:
+        stats = getattr(caches[alias], "stats", None)
+        if stats is None:
+            continue
+        for event, count in sorted(stats.items()):
+            lines.append(
+                f'{CACHE_EVENTS}{{cache="{alias}",event="{event}"}} {count}'
+            )
+
+    return "\n".join(lines)
+
+
+def render_metrics():
+    blocks = [histogram.render() for histogram in HISTOGRAMS]
+    blocks.append(render_cache_stats())
+    return "\n".join(blocks) + "\n"
+
+
+def can_view_metrics(request) -> bool:
+    """Staff users, or requests bearing ``TASK_METRICS_TOKEN``."""
+    user = getattr(request, "user", None)
+    token = getattr(settings, "TASK_METRICS_TOKEN", "")
+    authorization = request.headers.get("Authorization", "")
+
+    return bool(user is not None and user.is_staff) or bool(
+        token and constant_time_compare(authorization, f"Bearer {token}")
+    )
+
+
+def reset_metrics():
+    for histogram in HISTOGRAMS:
+        histogram.clear()
+
+
+class RequestStats:
+    def __init__(self):
+        self.queries = []
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.template_depth = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            self.db_time += duration
+            self.queries.append((sql, duration))
+
+
+class InstrumentedTemplate(Template):
+    def render(self, context=None, request=None):
+        stats = _request_stats.get()
+
+        if stats is None:
+            return super().render(context, request)
+
+        # Templates rendered from inside another one (crispy forms,
+        # inclusion tags) are already covered by the outer timing.
+        stats.template_depth += 1
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            stats.template_depth -= 1
+            if not stats.template_depth:
+                stats.template_time += time.perf_counter() - started
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """Django template backend that reports render time to the middleware."""
+
+    def from_string(self, template_code):
+        return InstrumentedTemplate(
+            self.engine.from_string(template_code), self
+        )
+
+    def get_template(self, template_name):
+        try:
+            return InstrumentedTemplate(
+                self.engine.get_template(template_name), self
+            )
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
+
+
+def wrap_connections(stack, wrapper):
+    """Enter ``wrapper`` as an ``execute_wrapper`` of every connection."""
+    for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(wrapper))
+
+
+class RequestMetricsMiddleware:
+    """
+    Times every request, its database queries and its template rendering.
+    The numbers are added to the in-process histograms served by the
+    metrics view, sent back in a ``Server-Timing`` header to those allowed
+    to read the metrics, and requests slower than ``TASK_SLOW_REQUEST_MS``
+    are logged with their SQL.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+
+        try:
+            with ExitStack() as stack:
+                wrap_connections(stack, stats)
+                response = self.get_response(request)
+        finally:
+            _request_stats.reset(token)
+
+        duration = time.perf_counter() - started
+        self.record(request, response, stats, duration)
+        if can_view_metrics(request):
+            self.add_timing(response, stats, duration)
+
+        return response
+
+    async def __acall__(self, request):
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+
+        # Queries run in the request's sync_to_async thread, whose
+        # connections are wrapped there.
+        stack = ExitStack()
+        try:
+            await sync_to_async(wrap_connections)(stack, stats)
+            try:
+                response = await self.get_response(request)
+            finally:
+                await sync_to_async(stack.close)()
+        finally:
+            _request_stats.reset(token)
+
+        duration = time.perf_counter() - started
+        self.record(request, response, stats, duration)
+        # request.user is loaded lazily, from the database.
+        if await sync_to_async(can_view_metrics)(request):
+            self.add_timing(response, stats, duration)
+
+        return response
+
+    def add_timing(self, response, stats, duration):
+        response["Server-Timing"] = ", ".join(
+            [
+                f'db;dur={stats.db_time * 1000:.1f};'
+                f'desc="{len(stats.queries)} queries"',
+                f"tpl;dur={stats.template_time * 1000:.1f}",
+                f"total;dur={duration * 1000:.1f}",
+            ]
+        )
+
+    def record(self, request, response, stats, duration):
+        match = request.resolver_match
+        view = match.view_name if match else "unresolved"
+
+        REQUEST_DURATION.observe(
+            duration, view, request.method, response.status_code
+        )
+        DB_DURATION.observe(stats.db_time, view, request.method)
+        DB_QUERIES.observe(len(stats.queries), view, request.method)
+        TEMPLATE_DURATION.observe(stats.template_time, view, request.method)
+
+        threshold = getattr(settings, "TASK_SLOW_REQUEST_MS", SLOW_REQUEST_MS)
+        if threshold is not None and duration * 1000 >= threshold:
+            logger.warning(
+                "Slow request %s %s (%s): %.1fms, %d queries in %.1fms\n%s",
+                request.method,
+                request.get_full_path(),
+                view,
+                duration * 1000,
+                len(stats.queries),
+                stats.db_time * 1000,
+                "\n".join(
+                    f"  {query_duration * 1000:.1f}ms {sql}"
+                    for sql, query_duration in stats.queries
+                ),
+            )
@@ -0,0 +1,82 @@
+# Generated by Django 4.2.5 on 2026-10-18 17:05
+
+from django.db import migrations, models
+
+PRIORITY_RANKS = {"urgent": 1, "high": 2, "medium": 3, "low": 4}
+
+
+def priority_to_rank(apps, schema_editor):
+    Task = apps.get_model("task", "Task")
+    for priority, rank in PRIORITY_RANKS.items():
+        Task.objects.filter(priority=priority).update(priority_rank=rank)
+
+
+def rank_to_priority(apps, schema_editor):
+    Task = apps.get_model("task", "Task")
+    for priority, rank in PRIORITY_RANKS.items():
+        Task.objects.filter(priority_rank=rank).update(priority=priority)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task", "0006_task_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_ordering_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_type_ordering_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_open_ordering_idx",
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="priority_rank",
+            field=models.PositiveSmallIntegerField(default=3),
+        ),
+        migrations.RunPython(priority_to_rank, rank_to_priority),
+        migrations.RemoveField(
+            model_name="task",
+            name="priority",
+        ),
+        migrations.RenameField(
+            model_name="task",
+            old_name="priority_rank",
+            new_name="priority",
+        ),
+        migrations.AlterField(
+            model_name="task",
+            name="priority",
+            field=models.PositiveSmallIntegerField(
+                choices=[(1, "Urgent"), (2, "High"), (3, "Medium"), (4, "Low")],
+                default=3,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["is_completed", "priority", "id"], name="task_ordering_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["task_type", "is_completed", "priority"],
+                name="task_type_ordering_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_completed", False)),
+                fields=["is_completed", "priority", "id"],
+                name="task_open_ordering_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.5 on 2026-10-18 17:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task", "0007_task_priority_rank"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["is_completed", "deadline"], name="task_completed_deadline_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 4.2.5 on 2026-10-18 17:22
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count(rows, outer_field):
+    return Coalesce(
+        Subquery(
+            rows.filter(**{outer_field: OuterRef("pk")})
+            .order_by()
+            .values(outer_field)
+            .annotate(count=Count("*"))
+            .values("count")
+        ),
+        0,
+    )
+
+
+def populate_counts(apps, schema_editor):
+    Task = apps.get_model("task", "Task")
+    Worker = apps.get_model("task", "Worker")
+    assignments = Task.assignees.through.objects
+
+    Worker.objects.update(
+        open_task_count=count(
+            assignments.filter(task__is_completed=False), "worker"
+        ),
+        completed_task_count=count(
+            assignments.filter(task__is_completed=True), "worker"
+        ),
+    )
+    apps.get_model("task", "TaskType").objects.update(
+        open_task_count=count(
+            Task.objects.filter(is_completed=False), "task_type"
+        ),
+        completed_task_count=count(
+            Task.objects.filter(is_completed=True), "task_type"
+        ),
+    )
+    apps.get_model("task", "Position").objects.update(
+        worker_count=count(Worker.objects.all(), "position")
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task", "0008_task_completed_deadline_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="position",
+            name="worker_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="tasktype",
+            name="completed_task_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="tasktype",
+            name="open_task_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="worker",
+            name="completed_task_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="worker",
+            name="open_task_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,60 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# task.search.SEARCH_FIELDS when the indexes were added.
+TRIGRAM_FIELDS = {
+    "task": ("name", "description"),
+    "worker": ("username", "first_name", "last_name"),
+    "tasktype": ("name",),
+    "position": ("name",),
+}
+
+
+def trigram_indexes(apps):
+    for model_name, fields in TRIGRAM_FIELDS.items():
+        model = apps.get_model("task", model_name)
+        for field in fields:
+            # The names the indexes had when search.install created them.
+            yield model, GinIndex(
+                fields=[field],
+                opclasses=["gin_trgm_ops"],
+                name=f"{model._meta.db_table}_{field}_trgm",
+            )
+
+
+def existing_indexes(schema_editor, model):
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        return connection.introspection.get_constraints(
+            cursor, model._meta.db_table
+        )
+
+
+def add_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for model, index in trigram_indexes(apps):
+        if index.name not in existing_indexes(schema_editor, model):
+            schema_editor.add_index(model, index)
+
+
+def remove_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for model, index in trigram_indexes(apps):
+        if index.name in existing_indexes(schema_editor, model):
+            schema_editor.remove_index(model, index)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task", "0010_taskevent"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(add_trigram_indexes, remove_trigram_indexes),
+    ]
@@ -0,0 +1,100 @@
+from django.db import migrations
+
+# Columns of the SQLite FTS5 mirror tables, as SQL over a row of the
+# mirrored table, when the tables were added.
+FTS_COLUMNS = {
+    "task_task": {
+        "name": "{row}.name",
+        "description": "{row}.description",
+    },
+    "task_worker": {
+        "username": "{row}.username",
+        "full_name": "{row}.first_name || ' ' || {row}.last_name",
+    },
+}
+TRIGGERS = ("insert", "delete", "update")
+
+
+def install_fts(connection):
+    """
+    Create the trigram-tokenized FTS5 tables and the triggers keeping
+    them in sync, and fill the tables whenever a trigger was missing.
+    SQLite drops the triggers when a migration rebuilds the mirrored
+    table, so such migrations have to run this again.
+    """
+    with connection.cursor() as cursor:
+        for table, columns in FTS_COLUMNS.items():
+            fts_table = f"{table}_fts"
+            names = ", ".join(columns)
+            new_values = ", ".join(
+                expression.format(row="new") for expression in columns.values()
+            )
+            table_values = ", ".join(
+                expression.format(row=table)
+                for expression in columns.values()
+            )
+
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} "
+                f"USING fts5({names}, tokenize='trigram')"
+            )
+            cursor.execute(
+                "SELECT COUNT(*) FROM sqlite_master "
+                "WHERE type = 'trigger' AND tbl_name = %s "
+                "AND name LIKE %s",
+                [table, f"{fts_table}_%"],
+            )
+            if cursor.fetchone()[0] == len(TRIGGERS):
+                continue
+
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {fts_table}_insert "
+                f"AFTER INSERT ON {table} BEGIN "
+                f"INSERT INTO {fts_table}(rowid, {names}) "
+                f"VALUES (new.id, {new_values}); END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {fts_table}_delete "
+                f"AFTER DELETE ON {table} BEGIN "
+                f"DELETE FROM {fts_table} WHERE rowid = old.id; END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {fts_table}_update "
+                f"AFTER UPDATE ON {table} BEGIN "
+                f"DELETE FROM {fts_table} WHERE rowid = old.id; "
+                f"INSERT INTO {fts_table}(rowid, {names}) "
+                f"VALUES (new.id, {new_values}); END"
+            )
+            cursor.execute(f"DELETE FROM {fts_table}")
+            cursor.execute(
+                f"INSERT INTO {fts_table}(rowid, {names}) "
+                f"SELECT id, {table_values} FROM {table}"
+            )
+
+
+def create_fts_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    install_fts(schema_editor.connection)
+
+
+def drop_fts_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        for table in FTS_COLUMNS:
+            for trigger in TRIGGERS:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{trigger}")
+            cursor.execute(f"DROP TABLE IF EXISTS {table}_fts")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task", "0011_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts_tables, drop_fts_tables),
+    ]
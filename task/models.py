@@ -1,12 +1,74 @@
 from django.contrib.auth.models import AbstractUser
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.urls import reverse
+from django.utils import timezone
 
 from task_manager import settings
 
 
-class TaskType(models.Model):
+class LoadedValuesMixin:
+    """
+    Remembers the column values a row was loaded with, so signal handlers
+    can tell which fields a ``save()`` changed.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def loaded_value(self, attname):
+        return getattr(self, "_loaded_values", {}).get(
+            attname, models.DEFERRED
+        )
+
+    def remember_loaded_values(self):
+        self._loaded_values = {
+            field.attname: self.__dict__[field.attname]
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        }
+
+
+class CounterFieldsMixin:
+    """
+    Leaves the ``counter_fields`` out of the ``UPDATE`` of a plain
+    ``save()``: ``task.task_counts`` maintains them with ``F()`` updates,
+    which writing back the loaded values would undo.
+    """
+
+    counter_fields = ()
+
+    def save(self, *args, force_insert=False, update_fields=None, **kwargs):
+        existing = not (force_insert or self._state.adding)
+
+        if existing and update_fields is None:
+            deferred = self.get_deferred_fields()
+            update_fields = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.counter_fields
+                and field.attname not in deferred
+            ]
+
+        super().save(
+            *args,
+            force_insert=force_insert,
+            update_fields=update_fields,
+            **kwargs,
+        )
+
+
+class TaskType(CounterFieldsMixin, models.Model):
     name = models.CharField(max_length=255, unique=True)
+    # Maintained by task.task_counts, see reconcile_task_counts.
+    open_task_count = models.IntegerField(default=0, editable=False)
+    completed_task_count = models.IntegerField(default=0, editable=False)
+
+    counter_fields = ("open_task_count", "completed_task_count")
 
     class Meta:
         verbose_name = "task type"
@@ -16,20 +78,19 @@ class TaskType(models.Model):
         return self.name
 
 
-class Task(models.Model):
-    PRIORITY_CHOICES = [
-        ("urgent", "Urgent"),
-        ("high", "High"),
-        ("medium", "Medium"),
-        ("low", "Low"),
-    ]
+class Task(LoadedValuesMixin, models.Model):
+    class Priority(models.IntegerChoices):
+        URGENT = 1, "Urgent"
+        HIGH = 2, "High"
+        MEDIUM = 3, "Medium"
+        LOW = 4, "Low"
 
     name = models.CharField(max_length=255)
     description = models.TextField()
     deadline = models.DateField()
     is_completed = models.BooleanField()
-    priority = models.CharField(
-        choices=PRIORITY_CHOICES, default="medium", max_length=10
+    priority = models.PositiveSmallIntegerField(
+        choices=Priority.choices, default=Priority.MEDIUM
     )
     task_type = models.ForeignKey(
         TaskType, on_delete=models.SET_NULL, related_name="tasks", null=True
@@ -40,6 +101,26 @@ class Task(models.Model):
 
     class Meta:
         ordering = ["is_completed", "priority"]
+        indexes = [
+            models.Index(
+                fields=["is_completed", "priority", "id"],
+                name="task_ordering_idx",
+            ),
+            models.Index(
+                fields=["task_type", "is_completed", "priority"],
+                name="task_type_ordering_idx",
+            ),
+            models.Index(fields=["deadline"], name="task_deadline_idx"),
+            models.Index(
+                fields=["is_completed", "deadline"],
+                name="task_completed_deadline_idx",
+            ),
+            models.Index(
+                fields=["is_completed", "priority", "id"],
+                condition=models.Q(is_completed=False),
+                name="task_open_ordering_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -48,7 +129,7 @@ class Task(models.Model):
         return reverse("task:task-detail", kwargs={"pk": self.pk})
 
 
-class Worker(AbstractUser):
+class Worker(LoadedValuesMixin, CounterFieldsMixin, AbstractUser):
     position = models.ForeignKey(
         "Position",
         on_delete=models.CASCADE,
@@ -56,6 +137,10 @@ class Worker(AbstractUser):
         blank=True,
         null=True
     )
+    open_task_count = models.IntegerField(default=0, editable=False)
+    completed_task_count = models.IntegerField(default=0, editable=False)
+
+    counter_fields = ("open_task_count", "completed_task_count")
 
     class Meta:
         ordering = ["position"]
@@ -69,8 +154,58 @@ class Worker(AbstractUser):
         return reverse("task:worker-detail", kwargs={"pk": self.pk})
 
 
-class Position(models.Model):
+class Position(CounterFieldsMixin, models.Model):
     name = models.CharField(max_length=128, unique=True)
+    worker_count = models.IntegerField(default=0, editable=False)
+
+    counter_fields = ("worker_count",)
 
     def __str__(self):
         return self.name
+
+
+class TaskEvent(models.Model):
+    """
+    Append-only journal of task changes, written by ``task.journal``.
+    Rows outlive the tasks and workers they mention, so the foreign keys
+    have no database constraint.
+    """
+
+    class Action(models.TextChoices):
+        CREATED = "created", "Created"
+        CHANGED = "changed", "Changed"
+        DELETED = "deleted", "Deleted"
+        ASSIGNED = "assigned", "Assigned"
+        UNASSIGNED = "unassigned", "Unassigned"
+
+    task = models.ForeignKey(
+        Task,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name="events",
+    )
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        null=True,
+        related_name="+",
+    )
+    action = models.CharField(max_length=16, choices=Action.choices)
+    field = models.CharField(max_length=64, blank=True)
+    old_value = models.JSONField(null=True, encoder=DjangoJSONEncoder)
+    new_value = models.JSONField(null=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name = "task event"
+        verbose_name_plural = "task events"
+        indexes = [
+            models.Index(fields=["created_at"], name="taskevent_created_idx"),
+            models.Index(fields=["task", "id"], name="taskevent_task_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.get_action_display()} task {self.task_id}"
@@ -0,0 +1,160 @@
+import logging
+import re
+import sys
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+
+from task import metrics
+
+logger = logging.getLogger("task.nplusone")
+
+THRESHOLD = 3
+
+_IN_LIST = re.compile(r"IN \((?:%s, )*%s\)")
+_WHITESPACE = re.compile(r"\s+")
+_INSTRUMENTATION = (__file__, metrics.__file__)
+
+
+class NPlusOneError(AssertionError):
+    pass
+
+
+def query_shape(sql):
+    """SQL with the parameter lists collapsed, so per-row lookups match."""
+    return _IN_LIST.sub("IN (...)", _WHITESPACE.sub(" ", sql)).strip()
+
+
+def _caller():
+    # The innermost template node or project frame (outside Django, the
+    # standard library and the instrumentation) that issued the query.
+    frame = sys._getframe(2)
+    while frame is not None:
+        code = frame.f_code
+        node = frame.f_locals.get("self")
+
+        if code.co_name == "render_annotated" and getattr(node, "token", None):
+            return f"{node.origin.name}:{node.token.lineno} (template)"
+
+        if (
+            "site-packages" not in code.co_filename
+            and "/lib/python" not in code.co_filename
+            and code.co_filename not in _INSTRUMENTATION
+        ):
+            return f"{code.co_filename}:{frame.f_lineno} in {code.co_name}"
+
+        frame = frame.f_back
+    return "unknown"
+
+
+class QueryShapeRecorder:
+    """
+    ``execute_wrapper`` that counts identical query shapes. A shape run
+    ``threshold`` times or more is reported as a likely N+1 together with
+    the code that issued it.
+    """
+
+    def __init__(self, threshold=None):
+        if threshold is None:
+            threshold = getattr(settings, "TASK_NPLUSONE_THRESHOLD", THRESHOLD)
+        self.threshold = threshold
+        self.shapes = Counter()
+        self.callers = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        shape = query_shape(sql)
+        self.shapes[shape] += 1
+
+        if self.shapes[shape] == self.threshold:
+            self.callers[shape] = _caller()
+
+        return execute(sql, params, many, context)
+
+    @property
+    def count(self):
+        return sum(self.shapes.values())
+
+    def offenders(self):
+        return [
+            (shape, count, self.callers[shape])
+            for shape, count in self.shapes.most_common()
+            if count >= self.threshold
+        ]
+
+    def report(self):
+        return "\n".join(
+            f"{count}x {shape}\n    from {caller}"
+            for shape, count, caller in self.offenders()
+        )
+
+
+@contextmanager
+def record_queries(threshold=None):
+    recorder = QueryShapeRecorder(threshold)
+
+    with ExitStack() as stack:
+        metrics.wrap_connections(stack, recorder)
+        yield recorder
+
+
+@contextmanager
+def assert_no_nplusone(threshold=None):
+    with record_queries(threshold) as recorder:
+        yield recorder
+
+    if recorder.offenders():
+        raise NPlusOneError(f"Repeated queries:\n{recorder.report()}")
+
+
+class NPlusOneMiddleware:
+    """
+    Opt-in staging check: logs requests that repeat the same query shape
+    ``TASK_NPLUSONE_THRESHOLD`` times or more to ``task.nplusone``, or
+    raises ``NPlusOneError`` when ``TASK_NPLUSONE`` is ``"raise"``.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        with record_queries() as recorder:
+            response = self.get_response(request)
+
+        return self.check(request, response, recorder)
+
+    async def __acall__(self, request):
+        recorder = QueryShapeRecorder()
+        stack = ExitStack()
+        await sync_to_async(metrics.wrap_connections)(stack, recorder)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+
+        return self.check(request, response, recorder)
+
+    def check(self, request, response, recorder):
+        if recorder.offenders():
+            message = (
+                f"Possible N+1 queries in {request.method} "
+                f"{request.get_full_path()}:\n{recorder.report()}"
+            )
+            if getattr(settings, "TASK_NPLUSONE", "log") == "raise":
+                raise NPlusOneError(message)
+            logger.warning(message)
+
+        return response
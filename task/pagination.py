@@ -0,0 +1,230 @@
+from django.core import signing
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.http import Http404
+from django.utils.functional import cached_property
+
+# Below this many rows an exact COUNT(*) is cheap and the estimate is noise.
+ESTIMATE_THRESHOLD = 10000
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class CursorPage:
+    is_cursor_page = True
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Keyset paginator: every page is a ``WHERE key > last_key LIMIT n``
+    query, so it costs the same at any depth and never runs ``COUNT(*)``.
+    ``ordering`` must end with a unique field to make the key total.
+    """
+
+    salt = "task.pagination.cursor"
+
+    def __init__(self, queryset, ordering, per_page):
+        self.queryset = queryset
+        self.ordering = tuple(ordering)
+        self.per_page = int(per_page)
+
+    def encode_cursor(self, obj, direction):
+        key = [
+            obj.serializable_value(field.lstrip("-"))
+            for field in self.ordering
+        ]
+        return signing.dumps({"k": key, "d": direction}, salt=self.salt)
+
+    def decode_cursor(self, cursor):
+        try:
+            data = signing.loads(cursor, salt=self.salt)
+        except signing.BadSignature:
+            raise InvalidCursor("Cursor is not valid")
+
+        if (
+            not isinstance(data, dict)
+            or data.get("d") not in ("next", "previous")
+            or not isinstance(data.get("k"), list)
+            or len(data["k"]) != len(self.ordering)
+        ):
+            raise InvalidCursor("Cursor is not valid")
+
+        return data["k"], data["d"]
+
+    def _keyset_filter(self, key, reverse):
+        keyset = Q()
+        for index, field in enumerate(self.ordering):
+            descending = field.startswith("-") != reverse
+            lookup = "lt" if descending else "gt"
+            condition = Q(**{f"{field.lstrip('-')}__{lookup}": key[index]})
+            for previous_field, value in zip(self.ordering[:index], key):
+                condition &= Q(**{previous_field.lstrip("-"): value})
+            keyset |= condition
+        return keyset
+
+    def _reversed_ordering(self):
+        return [
+            field[1:] if field.startswith("-") else f"-{field}"
+            for field in self.ordering
+        ]
+
+    def page(self, cursor=None):
+        if not cursor:
+            key, direction = None, "next"
+        else:
+            key, direction = self.decode_cursor(cursor)
+
+        if direction == "next":
+            queryset = self.queryset.order_by(*self.ordering)
+            if key is not None:
+                queryset = queryset.filter(self._keyset_filter(key, False))
+        else:
+            queryset = self.queryset.order_by(*self._reversed_ordering())
+            queryset = queryset.filter(self._keyset_filter(key, True))
+
+        rows = list(queryset[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if direction == "previous":
+            rows.reverse()
+            next_cursor = (
+                self.encode_cursor(rows[-1], "next") if rows else None
+            )
+            previous_cursor = (
+                self.encode_cursor(rows[0], "previous") if has_more else None
+            )
+        else:
+            next_cursor = (
+                self.encode_cursor(rows[-1], "next") if has_more else None
+            )
+            previous_cursor = (
+                self.encode_cursor(rows[0], "previous")
+                if key is not None and rows
+                else None
+            )
+
+        return CursorPage(rows, next_cursor, previous_cursor)
+
+
+class CursorPaginationMixin:
+    """
+    Opt-in keyset pagination for list views: requests carrying a
+    ``cursor`` query parameter (even an empty one for the first page)
+    are paginated by ``cursor_ordering`` instead of page numbers.
+    """
+
+    cursor_ordering = ("id",)
+    cursor_query_param = "cursor"
+
+    def is_cursor_paginated(self):
+        return self.cursor_query_param in self.request.GET
+
+    def get_cursor_ordering(self):
+        return self.cursor_ordering
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.is_cursor_paginated():
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = CursorPaginator(
+            queryset, self.get_cursor_ordering(), page_size
+        )
+        try:
+            page = paginator.page(
+                self.request.GET.get(self.cursor_query_param)
+            )
+        except InvalidCursor as error:
+            raise Http404(str(error))
+
+        return paginator, page, page.object_list, page.has_other_pages()
+
+
+class OrderingParamMixin:
+    """
+    Lets ``?ordering=`` pick one of the named ``orderings`` of a list
+    view. Each ends with a unique field, so cursor pages key on it too.
+    """
+
+    orderings = {}
+    ordering_query_param = "ordering"
+
+    def get_ordering(self):
+        name = self.request.GET.get(self.ordering_query_param)
+
+        if not name:
+            return super().get_ordering()
+        if name not in self.orderings:
+            raise Http404(f"Unknown ordering: {name}")
+
+        return self.orderings[name]
+
+    def get_cursor_ordering(self):
+        if self.request.GET.get(self.ordering_query_param):
+            return self.get_ordering()
+        return super().get_cursor_ordering()
+
+
+def estimated_count(queryset):
+    """
+    PostgreSQL's planner estimate of the rows of an unfiltered queryset's
+    table (``pg_class.reltuples``), or None when it has none to offer.
+    """
+    connection = connections[queryset.db]
+    query = queryset.query
+
+    if connection.vendor != "postgresql" or query.where or query.distinct:
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+
+    # reltuples is -1 until the table has been vacuumed or analyzed.
+    if row is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that trusts the planner's row estimate for large unfiltered
+    tables instead of running ``COUNT(*)`` over them on every page.
+    """
+
+    @cached_property
+    def count(self):
+        if isinstance(self.object_list, QuerySet):
+            estimate = estimated_count(self.object_list)
+            if estimate is not None and estimate >= ESTIMATE_THRESHOLD:
+                return estimate
+        return super().count
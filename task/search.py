@@ -0,0 +1,99 @@
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.db import connections, router
+from django.db.models import CharField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Concat
+from django.utils.module_loading import import_string
+
+SEARCH_FIELDS = {
+    "task.Task": ("name", "description"),
+    "task.Worker": ("username", "first_name", "last_name"),
+    "task.TaskType": ("name",),
+    "task.Position": ("name",),
+}
+# Searched like SEARCH_FIELDS, through an alias of the same name.
+SEARCH_EXPRESSIONS = {
+    "task.Worker": {
+        "search_full_name": Concat(
+            "first_name", Value(" "), "last_name", output_field=CharField()
+        ),
+    },
+}
+
+
+def _searched(queryset):
+    """``queryset`` with the search aliases, and the names to search."""
+    label = queryset.model._meta.label
+    expressions = SEARCH_EXPRESSIONS.get(label, {})
+
+    if expressions:
+        queryset = queryset.alias(**expressions)
+
+    return queryset, (*SEARCH_FIELDS[label], *expressions)
+
+
+class ContainsSearchBackend:
+    """Portable fallback: ``icontains`` over every searchable field."""
+
+    def search(self, queryset, query):
+        queryset, fields = _searched(queryset)
+        return queryset.filter(
+            reduce(
+                or_, (Q(**{f"{field}__icontains": query}) for field in fields)
+            )
+        )
+
+
+class SqliteFTSSearchBackend(ContainsSearchBackend):
+    """
+    SQLite FTS5 backend for development and tests. Tasks and workers are
+    mirrored into trigram-tokenized FTS5 tables kept in sync by triggers
+    (migration 0012), which keeps the substring semantics of
+    ``icontains``.
+    """
+
+    fts_models = ("task.Task", "task.Worker")
+    # The trigram tokenizer cannot match anything shorter than a trigram.
+    min_query_length = 3
+
+    def search(self, queryset, query):
+        label = queryset.model._meta.label
+
+        if (
+            label not in self.fts_models
+            or len(query) < self.min_query_length
+        ):
+            return super().search(queryset, query)
+
+        fts_table = f"{queryset.model._meta.db_table}_fts"
+        match = '"{}"'.format(query.replace('"', '""'))
+        return queryset.filter(
+            pk__in=RawSQL(
+                f"SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH %s",
+                [match],
+            )
+        )
+
+
+# PostgreSQL uses the fallback: the pg_trgm GIN indexes of migration 0011
+# serve its ILIKE '%x%' lookups.
+VENDOR_BACKENDS = {
+    "sqlite": SqliteFTSSearchBackend,
+}
+
+
+def get_backend(connection):
+    backend = getattr(settings, "TASK_SEARCH_BACKEND", None)
+
+    if backend:
+        return import_string(backend)()
+
+    return VENDOR_BACKENDS.get(connection.vendor, ContainsSearchBackend)()
+
+
+def search(queryset, query):
+    connection = connections[router.db_for_read(queryset.model)]
+    return get_backend(connection).search(queryset, query)
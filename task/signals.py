@@ -0,0 +1,257 @@
+from django.core.signals import request_finished
+from django.db.models import DEFERRED
+from django.db.models.signals import (
+    m2m_changed,
+    post_save,
+    post_delete,
+    pre_delete,
+)
+from django.dispatch import receiver
+
+from task import counters, fragments, journal, task_counts
+from task.models import TaskType, Task, TaskEvent, Position, Worker
+from task.visits import visit_counter
+
+MODEL_COUNTERS = {
+    TaskType: "task_types",
+    Position: "positions",
+    Worker: "workers",
+}
+
+
+@receiver(post_save, sender=TaskType)
+@receiver(post_save, sender=Position)
+@receiver(post_save, sender=Worker)
+def count_created(sender, instance, created, **kwargs):
+    if created:
+        counters.incr(MODEL_COUNTERS[sender])
+
+
+@receiver(post_delete, sender=TaskType)
+@receiver(post_delete, sender=Position)
+@receiver(post_delete, sender=Worker)
+def count_deleted(sender, instance, **kwargs):
+    counters.incr(MODEL_COUNTERS[sender], -1)
+
+
+@receiver(post_save, sender=Task)
+def count_task_saved(sender, instance, created, **kwargs):
+    if created:
+        counters.incr("tasks")
+        counters.incr(
+            "completed_tasks" if instance.is_completed else "open_tasks"
+        )
+    else:
+        was_completed = instance.loaded_value("is_completed")
+        if (
+            was_completed is not DEFERRED
+            and was_completed != instance.is_completed
+        ):
+            counters.task_completion_changed(instance.is_completed)
+
+
+@receiver(post_delete, sender=Task)
+def count_task_deleted(sender, instance, **kwargs):
+    counters.incr("tasks", -1)
+    counters.incr(
+        "completed_tasks" if instance.is_completed else "open_tasks", -1
+    )
+
+
+@receiver(post_save, sender=TaskType)
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Position)
+@receiver(post_save, sender=Worker)
+def bump_saved_version(sender, instance, update_fields=None, **kwargs):
+    # Logins save last_login only, which no cached fragment shows.
+    if update_fields and set(update_fields) <= {"last_login"}:
+        return
+
+    fragments.bump(sender._meta.model_name)
+
+
+@receiver(post_delete, sender=TaskType)
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Position)
+@receiver(post_delete, sender=Worker)
+def bump_deleted_version(sender, instance, **kwargs):
+    fragments.bump(sender._meta.model_name)
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+def bump_assignees_version(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        fragments.bump("task")
+
+
+def _adjust_task_type(pk, is_completed, delta):
+    if pk is not None:
+        task_counts.adjust(
+            TaskType.objects.filter(pk=pk),
+            **task_counts.state_deltas(is_completed, delta),
+        )
+
+
+def _adjust_position(pk, delta):
+    if pk is not None:
+        task_counts.adjust(
+            Position.objects.filter(pk=pk), worker_count=delta
+        )
+
+
+@receiver(post_save, sender=Task)
+def count_saved_task(sender, instance, created, **kwargs):
+    if created:
+        _adjust_task_type(instance.task_type_id, instance.is_completed, 1)
+        return
+
+    was_completed = instance.loaded_value("is_completed")
+    old_task_type = instance.loaded_value("task_type_id")
+
+    if DEFERRED in (was_completed, old_task_type):
+        # Saved from a partial load, so the old values are unknown.
+        task_counts.reconcile(
+            TaskType.objects.all(), Worker.objects.filter(tasks=instance)
+        )
+        return
+
+    if (old_task_type, was_completed) != (
+        instance.task_type_id,
+        instance.is_completed,
+    ):
+        _adjust_task_type(old_task_type, was_completed, -1)
+        _adjust_task_type(instance.task_type_id, instance.is_completed, 1)
+
+    if was_completed != instance.is_completed:
+        task_counts.adjust(
+            Worker.objects.filter(tasks=instance),
+            **task_counts.state_deltas(was_completed, -1),
+            **task_counts.state_deltas(instance.is_completed, 1),
+        )
+
+
+@receiver(pre_delete, sender=Task)
+def count_deleted_task(sender, instance, **kwargs):
+    if task_counts.counted_in_bulk():
+        return
+
+    # The assignments are deleted without m2m_changed, count them while
+    # they still exist.
+    task_counts.adjust(
+        Worker.objects.filter(tasks=instance),
+        **task_counts.state_deltas(instance.is_completed, -1),
+    )
+    _adjust_task_type(instance.task_type_id, instance.is_completed, -1)
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+def count_assignments(sender, instance, action, reverse, pk_set, **kwargs):
+    # Removals are counted before the rows go, for the rows that exist.
+    if action not in ("post_add", "pre_remove", "pre_clear"):
+        return
+
+    sign = 1 if action == "post_add" else -1
+
+    if not reverse:
+        if action == "post_add":
+            workers = Worker.objects.filter(pk__in=pk_set)
+        elif action == "pre_remove":
+            workers = Worker.objects.filter(tasks=instance, pk__in=pk_set)
+        else:
+            workers = Worker.objects.filter(tasks=instance)
+
+        task_counts.adjust(
+            workers, **task_counts.state_deltas(instance.is_completed, sign)
+        )
+        return
+
+    if action == "post_add":
+        tasks = Task.objects.filter(pk__in=pk_set)
+    elif action == "pre_remove":
+        tasks = instance.tasks.filter(pk__in=pk_set)
+    else:
+        tasks = instance.tasks.all()
+
+    task_counts.adjust(
+        Worker.objects.filter(pk=instance.pk),
+        **task_counts.task_state_deltas(tasks, sign),
+    )
+
+
+@receiver(post_save, sender=Worker)
+def count_saved_worker(sender, instance, created, **kwargs):
+    if created:
+        _adjust_position(instance.position_id, 1)
+        return
+
+    old_position = instance.loaded_value("position_id")
+
+    if old_position is DEFERRED:
+        task_counts.reconcile(Position.objects.all())
+    elif old_position != instance.position_id:
+        _adjust_position(old_position, -1)
+        _adjust_position(instance.position_id, 1)
+
+
+@receiver(post_delete, sender=Worker)
+def count_deleted_worker(sender, instance, **kwargs):
+    _adjust_position(instance.position_id, -1)
+
+
+@receiver(post_save, sender=Task)
+def journal_saved_task(sender, instance, created, **kwargs):
+    if created:
+        journal.record(
+            journal.event(
+                instance.pk, TaskEvent.Action.CREATED, new_value=instance.name
+            )
+        )
+    else:
+        journal.record_changes(instance)
+
+
+@receiver(post_delete, sender=Task)
+def journal_deleted_task(sender, instance, **kwargs):
+    journal.record(
+        journal.event(
+            instance.pk, TaskEvent.Action.DELETED, old_value=instance.name
+        )
+    )
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+def journal_assignments(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "post_add":
+        journal.record_assignments(
+            TaskEvent.Action.ASSIGNED,
+            [
+                (pk, instance.pk) if reverse else (instance.pk, pk)
+                for pk in pk_set
+            ],
+        )
+    elif action in ("pre_remove", "pre_clear"):
+        links = Task.assignees.through.objects.filter(
+            **{"worker" if reverse else "task": instance}
+        )
+        if action == "pre_remove":
+            links = links.filter(
+                **{"task__in" if reverse else "worker__in": pk_set}
+            )
+
+        journal.record_assignments(
+            TaskEvent.Action.UNASSIGNED,
+            links.values_list("task_id", "worker_id"),
+        )
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Worker)
+def remember_loaded_values(sender, instance, **kwargs):
+    # Connected last: the receivers above compare against the old values.
+    instance.remember_loaded_values()
+
+
+@receiver(request_finished)
+def flush_visits(sender, **kwargs):
+    # After the response went out, so the session writes don't delay it.
+    visit_counter.flush_if_due()
@@ -0,0 +1,202 @@
+import contextvars
+from contextlib import contextmanager
+from functools import reduce
+from operator import or_
+
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from task.models import TaskType, Task, Position, Worker
+
+# Counter columns by the ``is_completed`` value of the tasks they count.
+STATE_COUNTS = (("open_task_count", False), ("completed_task_count", True))
+
+_deleting = contextvars.ContextVar("task_counts_deleting", default=False)
+
+
+def state_deltas(is_completed: bool, delta: int) -> dict:
+    if is_completed:
+        return {"completed_task_count": delta}
+    return {"open_task_count": delta}
+
+
+def adjust(queryset, **deltas) -> int:
+    """Add ``deltas`` to counter columns in one ``SET x = x + n`` update."""
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+
+    if not deltas:
+        return 0
+
+    return queryset.update(
+        **{name: F(name) + delta for name, delta in deltas.items()}
+    )
+
+
+def task_state_deltas(tasks, sign: int) -> dict:
+    """Open and completed task counts of ``tasks`` times ``sign``."""
+    totals = tasks.aggregate(
+        open_task_count=Count("id", filter=Q(is_completed=False)),
+        completed_task_count=Count("id", filter=Q(is_completed=True)),
+    )
+    return {name: sign * count for name, count in totals.items()}
+
+
+def _count(rows, outer_field):
+    return Coalesce(
+        Subquery(
+            rows.filter(**{outer_field: OuterRef("pk")})
+            .order_by()
+            .values(outer_field)
+            .annotate(count=Count("*"))
+            .values("count")
+        ),
+        0,
+    )
+
+
+def _move(queryset, count, is_completed: bool) -> int:
+    """Move ``count`` tasks of each row to the open or completed count."""
+    sign = 1 if is_completed else -1
+    return queryset.update(
+        open_task_count=F("open_task_count") - sign * count,
+        completed_task_count=F("completed_task_count") + sign * count,
+    )
+
+
+def _remove(queryset, rows, outer_field, is_completed="is_completed"):
+    """Subtract the open and completed ``rows`` of each row from its counts."""
+    return queryset.update(
+        **{
+            name: F(name)
+            - _count(rows.filter(**{is_completed: state}), outer_field)
+            for name, state in STATE_COUNTS
+        }
+    )
+
+
+def completion_changed(tasks, is_completed: bool) -> None:
+    """
+    Move ``tasks`` between the open and completed counts of their workers
+    and task types, for writes that bypass ``save()``. Each row moves by
+    the number of the tasks it holds, counted in the ``UPDATE`` itself.
+    """
+    assignments = Task.assignees.through.objects.filter(task__in=tasks)
+
+    _move(
+        Worker.objects.filter(pk__in=assignments.values("worker_id")),
+        _count(assignments, "worker"),
+        is_completed,
+    )
+    _move(
+        TaskType.objects.filter(pk__in=tasks.values("task_type_id")),
+        _count(tasks, "task_type"),
+        is_completed,
+    )
+
+
+def task_type_changed(tasks, task_type) -> None:
+    """
+    Move the counts of ``tasks`` from their task types to ``task_type``.
+    Call it before the ``update()``, with tasks of other task types only.
+    """
+    _remove(
+        TaskType.objects.filter(pk__in=tasks.values("task_type_id")),
+        tasks,
+        "task_type",
+    )
+    adjust(
+        TaskType.objects.filter(pk=task_type.pk),
+        **task_state_deltas(tasks, 1),
+    )
+
+
+@contextmanager
+def tasks_deleted(tasks):
+    """
+    Take ``tasks`` off the counts of their workers and task types with
+    one ``UPDATE`` per table, for a ``tasks.delete()`` in the ``with``
+    block that then skips the per-task ``pre_delete`` handler.
+    """
+    assignments = Task.assignees.through.objects.filter(task__in=tasks)
+
+    _remove(
+        Worker.objects.filter(pk__in=assignments.values("worker_id")),
+        assignments,
+        "worker",
+        "task__is_completed",
+    )
+    _remove(
+        TaskType.objects.filter(pk__in=tasks.values("task_type_id")),
+        tasks,
+        "task_type",
+    )
+
+    token = _deleting.set(True)
+    try:
+        yield
+    finally:
+        _deleting.reset(token)
+
+
+def counted_in_bulk() -> bool:
+    """Whether deleted tasks were already counted by ``tasks_deleted``."""
+    return _deleting.get()
+
+
+def actual_counts(model) -> dict:
+    """``{column: expression}`` recounting each counter from its source."""
+    assignments = Task.assignees.through.objects
+
+    if model is Worker:
+        return {
+            "open_task_count": _count(
+                assignments.filter(task__is_completed=False), "worker"
+            ),
+            "completed_task_count": _count(
+                assignments.filter(task__is_completed=True), "worker"
+            ),
+        }
+    if model is TaskType:
+        return {
+            "open_task_count": _count(
+                Task.objects.filter(is_completed=False), "task_type"
+            ),
+            "completed_task_count": _count(
+                Task.objects.filter(is_completed=True), "task_type"
+            ),
+        }
+    if model is Position:
+        return {"worker_count": _count(Worker.objects.all(), "position")}
+
+    raise ValueError(f"{model.__name__} has no task counts")
+
+
+def reconcile(*querysets) -> dict:
+    """
+    Recount the counter columns of the rows in ``querysets`` (every
+    worker, task type and position by default) with one ``UPDATE`` per
+    model that only touches drifted rows. Returns ``{model: rows fixed}``.
+    """
+    if not querysets:
+        querysets = (
+            Worker.objects.all(),
+            TaskType.objects.all(),
+            Position.objects.all(),
+        )
+
+    repaired = {}
+    for queryset in querysets:
+        model = queryset.model
+        counts = actual_counts(model)
+        drifted = reduce(
+            or_, (~Q(**{name: F(f"actual_{name}")}) for name in counts)
+        )
+        repaired[model._meta.verbose_name_plural] = (
+            queryset.alias(
+                **{f"actual_{name}": count for name, count in counts.items()}
+            )
+            .filter(drifted)
+            .update(**actual_counts(model))
+        )
+
+    return repaired
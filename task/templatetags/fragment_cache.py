@@ -0,0 +1,47 @@
+from django import template
+from django.core.cache import cache
+
+from task.fragments import FRAGMENT_TIMEOUT
+
+register = template.Library()
+
+
+class FragmentNode(template.Node):
+    def __init__(self, name, nodelist):
+        self.name = name
+        self.nodelist = nodelist
+
+    def render(self, context):
+        name = self.name.resolve(context)
+        view = context.get("view")
+        keys = getattr(view, "fragment_keys", None)
+
+        if not keys or name not in keys:
+            return self.nodelist.render(context)
+
+        cached = view.cached_fragments.get(name)
+        if cached is not None:
+            return cached
+
+        content = self.nodelist.render(context)
+        cache.set(keys[name], content, FRAGMENT_TIMEOUT)
+        return content
+
+
+@register.tag
+def fragment(parser, token):
+    """
+    {% fragment "name" %}...{% endfragment %} renders the block once per
+    version of the view's ``fragment_models`` (see FragmentCacheMixin).
+    """
+    bits = token.split_contents()
+
+    if len(bits) != 2:
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' takes the fragment name as its only argument"
+        )
+
+    nodelist = parser.parse(("endfragment",))
+    parser.delete_first_token()
+
+    return FragmentNode(parser.compile_filter(bits[1]), nodelist)
@@ -1,8 +1,13 @@
+from unittest import mock
+
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from task.models import Position, TaskType, Task
+from task.pagination import EstimatedCountPaginator, estimated_count
 
 
 class TaskAdminTest(TestCase):
@@ -29,7 +34,7 @@ class TaskAdminTest(TestCase):
             description="Fix Dashboard for Vacancies",
             deadline="2024-10-05 03:26:35",
             is_completed=False,
-            priority="low",
+            priority=Task.Priority.LOW,
             task_type=task_type)
         self.task.assignees.set([worker])
 
@@ -39,7 +44,7 @@ class TaskAdminTest(TestCase):
 
         self.assertContains(response, self.task.name)
         self.assertContains(response, self.task.is_completed)
-        self.assertContains(response, self.task.priority)
+        self.assertContains(response, self.task.get_priority_display())
         self.assertContains(response, self.task.task_type)
 
     def test_filter_fields(self):
@@ -69,6 +74,104 @@ class TaskAdminTest(TestCase):
         self.assertContains(response, "assignees")
 
 
+class TaskAdminPerformanceTest(TestCase):
+    def setUp(self) -> None:
+        self.admin_user = get_user_model().objects.create_superuser(
+            username="admin",
+            password="qwerty",
+        )
+        self.client.force_login(self.admin_user)
+        self.task = Task.objects.create(
+            name="Fix Dashboard",
+            deadline="2030-10-05",
+            is_completed=False,
+            priority=Task.Priority.LOW,
+            task_type=TaskType.objects.create(name="QA"),
+        )
+
+    def test_changelist_queries_do_not_scale(self):
+        url = reverse("admin:task_task_changelist")
+
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(url)
+
+        for number in range(10):
+            Task.objects.create(
+                name=f"Task {number}",
+                deadline="2030-10-05",
+                is_completed=False,
+                priority=Task.Priority.HIGH,
+                task_type=TaskType.objects.create(name=f"Type {number}"),
+            )
+
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(url)
+
+        self.assertContains(response, "Type 9")
+        self.assertEqual(len(many), len(few))
+
+    def test_task_type_filter(self):
+        other = TaskType.objects.create(name="Bug")
+        Task.objects.create(
+            name="Crash on login",
+            deadline="2030-10-05",
+            is_completed=False,
+            priority=Task.Priority.HIGH,
+            task_type=other,
+        )
+
+        response = self.client.get(
+            reverse("admin:task_task_changelist"), {"task_type": "bu"}
+        )
+
+        self.assertContains(response, "Crash on login")
+        self.assertNotContains(response, self.task.name)
+
+    def test_bulk_actions(self):
+        url = reverse("admin:task_task_changelist")
+
+        self.client.post(
+            url,
+            {"action": "mark_completed", "_selected_action": [self.task.pk]},
+        )
+        self.client.post(
+            url,
+            {
+                "action": "set_priority_urgent",
+                "_selected_action": [self.task.pk],
+            },
+        )
+
+        self.task.refresh_from_db()
+        self.assertTrue(self.task.is_completed)
+        self.assertEqual(self.task.priority, Task.Priority.URGENT)
+
+    def test_task_relations_use_autocomplete(self):
+        response = self.client.get(reverse("admin:task_task_add"))
+
+        self.assertContains(response, 'data-field-name="task_type"')
+        self.assertContains(response, 'data-field-name="assignees"')
+
+
+class EstimatedCountPaginatorTest(TestCase):
+    def test_exact_count_without_estimate(self):
+        TaskType.objects.create(name="QA")
+
+        self.assertIsNone(estimated_count(TaskType.objects.all()))
+        self.assertEqual(
+            EstimatedCountPaginator(TaskType.objects.all(), 10).count, 1
+        )
+
+    def test_large_tables_use_estimate(self):
+        with mock.patch(
+            "task.pagination.estimated_count", return_value=250000
+        ):
+            paginator = EstimatedCountPaginator(TaskType.objects.all(), 100)
+
+            self.assertEqual(paginator.count, 250000)
+            self.assertEqual(paginator.num_pages, 2500)
+
+
 class WorkerAdminTest(TestCase):
     def setUp(self) -> None:
         position = Position.objects.create(name="DevOps")
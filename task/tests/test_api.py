@@ -0,0 +1,159 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from task.models import Position, TaskType, Task
+
+
+class TaskApiTest(TestCase):
+    def setUp(self) -> None:
+        self.position = Position.objects.create(name="DevOps")
+        self.worker = get_user_model().objects.create_user(
+            username="worker",
+            password="qwerty",
+            position=self.position,
+        )
+        self.client.force_login(self.worker)
+        self.task_type = TaskType.objects.create(name="Bug")
+
+        for number in range(5):
+            task = Task.objects.create(
+                name=f"{number}Fix Dashboard",
+                description="Fix Dashboard for Vacancies",
+                deadline="2030-10-05",
+                is_completed=number == 0,
+                priority=Task.Priority.LOW,
+                task_type=self.task_type,
+            )
+            task.assignees.add(self.worker)
+
+        self.url = reverse("task:api-task-list")
+
+    def test_login_required(self):
+        self.client.logout()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_sparse_fields(self):
+        response = self.client.get(self.url, {"fields": "id,name"})
+
+        self.assertEqual(
+            response.json()["results"][0],
+            {"id": 2, "name": "1Fix Dashboard"}
+        )
+
+    def test_unknown_field(self):
+        response = self.client.get(self.url, {"fields": "id,password"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_query_count_bounded_by_requested_relations(self):
+        with self.assertNumQueries(3):
+            self.client.get(self.url, {"fields": "id,name"})
+
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                self.url, {"fields": "id,task_type,assignees"}
+            )
+
+        self.assertEqual(
+            response.json()["results"][0],
+            {"id": 2, "task_type": "Bug", "assignees": [self.worker.id]}
+        )
+
+    def test_cursor_pagination(self):
+        response = self.client.get(self.url, {"page_size": 2})
+        ids = [task["id"] for task in response.json()["results"]]
+
+        while response.json()["next"]:
+            response = self.client.get(response.json()["next"])
+            ids += [task["id"] for task in response.json()["results"]]
+
+        self.assertEqual(
+            ids,
+            list(
+                Task.objects.order_by(
+                    "is_completed", "priority", "id"
+                ).values_list("id", flat=True)
+            )
+        )
+
+    def test_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        # Loading the session and the user, nothing else.
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.assertNotEqual(
+            self.client.get(self.url, {"fields": "id"})["ETag"], etag
+        )
+        Task.objects.filter(is_completed=True).get().assignees.clear()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_filters(self):
+        response = self.client.get(
+            self.url, {"is_completed": "true", "fields": "name"}
+        )
+
+        self.assertEqual(
+            response.json()["results"], [{"name": "0Fix Dashboard"}]
+        )
+
+    def test_detail(self):
+        response = self.client.get(
+            reverse("task:api-task-detail", args=[1]),
+            {"fields": "name,priority,deadline"}
+        )
+
+        self.assertEqual(
+            response.json(),
+            {
+                "name": "0Fix Dashboard",
+                "priority": "Low",
+                "deadline": "2030-10-05",
+            }
+        )
+
+    def test_detail_not_found(self):
+        response = self.client.get(reverse("task:api-task-detail", args=[0]))
+
+        self.assertEqual(response.status_code, 404)
+
+
+class WorkerApiTest(TestCase):
+    def setUp(self) -> None:
+        self.position = Position.objects.create(name="DevOps")
+        self.worker = get_user_model().objects.create_user(
+            username="worker",
+            password="qwerty",
+            position=self.position,
+        )
+        self.client.force_login(self.worker)
+
+    def test_worker_with_position(self):
+        response = self.client.get(
+            reverse("task:api-worker-list"), {"fields": "username,position"}
+        )
+
+        self.assertEqual(
+            response.json()["results"],
+            [{"username": "worker", "position": "DevOps"}]
+        )
+
+    def test_positions_and_task_types(self):
+        TaskType.objects.create(name="Bug")
+
+        positions = self.client.get(reverse("task:api-position-list"))
+        task_types = self.client.get(
+            reverse("task:api-task-type-detail", args=[1])
+        )
+
+        self.assertEqual(
+            positions.json()["results"], [{"id": 1, "name": "DevOps"}]
+        )
+        self.assertEqual(task_types.json(), {"id": 1, "name": "Bug"})
@@ -0,0 +1,108 @@
+from asyncio import iscoroutinefunction
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import resolve, reverse
+
+from task import fragments
+from task.metrics import RequestMetricsMiddleware
+from task.models import Position, Task, TaskType
+
+async def view(request):
+    pass
+
+
+ASYNC_PAGES = (
+    "task:index",
+    "task:task-type-list",
+    "task:task-list",
+    "task:position-list",
+    "task:worker-list",
+)
+
+
+@override_settings(ROOT_URLCONF="task_manager.urls_async")
+class AsyncViewsTest(TestCase):
+    def setUp(self) -> None:
+        fragments.bump(*fragments.VERSIONED_MODELS)
+        self.position = Position.objects.create(name="Developer")
+        self.user = get_user_model().objects.create_user(
+            username="worker",
+            password="qwerty",
+            position=self.position,
+        )
+        self.task = Task.objects.create(
+            name="Async task",
+            deadline="2030-01-01",
+            is_completed=False,
+            priority=Task.Priority.URGENT,
+            task_type=TaskType.objects.create(name="Bug"),
+        )
+        self.task.assignees.add(self.user)
+        self.async_client.force_login(self.user)
+
+    def test_read_pages_are_async(self):
+        for name in ASYNC_PAGES:
+            self.assertTrue(iscoroutinefunction(resolve(reverse(name)).func))
+        self.assertFalse(
+            iscoroutinefunction(resolve(reverse("task:task-create")).func)
+        )
+
+    async def test_pages(self):
+        for name in ASYNC_PAGES:
+            response = await self.async_client.get(reverse(name))
+            self.assertEqual(response.status_code, 200, name)
+
+        response = await self.async_client.get(reverse("task:index"))
+        self.assertEqual(response.context["tasks"], 1)
+        self.assertEqual(response.context["num_visits"], 2)
+
+    async def test_task_detail(self):
+        url = reverse("task:task-detail", args=[self.task.pk])
+
+        uncached = await self.async_client.get(url)
+        cached = await self.async_client.get(url)
+
+        for response in (uncached, cached):
+            self.assertContains(response, "Async task")
+            self.assertTrue(response.context["is_assignee"])
+        self.assertIsNone(cached.context.get("object"))
+
+        missing = await self.async_client.get(
+            reverse("task:task-detail", args=[self.task.pk + 1])
+        )
+        self.assertEqual(missing.status_code, 404)
+
+    async def test_worker_detail(self):
+        url = reverse("task:worker-detail", args=[self.user.pk])
+
+        for _ in range(2):
+            response = await self.async_client.get(url)
+            self.assertContains(response, "Async task")
+            self.assertContains(response, "Developer")
+
+    async def test_cursor_pagination(self):
+        response = await self.async_client.get(
+            reverse("task:task-list") + "?cursor="
+        )
+
+        self.assertContains(response, "Async task")
+
+    async def test_login_required(self):
+        self.async_client.cookies.clear()
+
+        for name in ASYNC_PAGES:
+            response = await self.async_client.get(reverse(name))
+            self.assertEqual(response.status_code, 302, name)
+            self.assertTrue(response.url.startswith(reverse("login")))
+
+    async def test_middleware_records_async_requests(self):
+        url = reverse("task:worker-detail", args=[self.user.pk])
+        await get_user_model().objects.filter(pk=self.user.pk).aupdate(
+            is_staff=True
+        )
+
+        response = await self.async_client.get(url)
+
+        self.assertTrue(iscoroutinefunction(RequestMetricsMiddleware(view)))
+        self.assertNotIn('"0 queries"', response["Server-Timing"])
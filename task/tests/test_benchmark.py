@@ -0,0 +1,85 @@
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db.models import Count
+from django.test import TestCase, TransactionTestCase
+
+from task.benchmark import (
+    compare,
+    generate_dataset,
+    run_benchmark,
+    run_concurrency_benchmark,
+)
+from task.models import Task
+
+
+class BenchmarkTest(TestCase):
+    def setUp(self) -> None:
+        self.counts = generate_dataset(
+            workers=20, tasks=200, max_assignees=5, seed=1
+        )
+
+    def test_generate_dataset(self):
+        self.assertEqual(self.counts["task"], 200)
+        self.assertEqual(get_user_model().objects.count(), 20)
+        self.assertEqual(
+            Task.assignees.through.objects.count(),
+            self.counts["assignments"],
+        )
+
+        workload = list(
+            get_user_model()
+            .objects.annotate(task_count=Count("tasks"))
+            .order_by("-task_count")
+            .values_list("task_count", flat=True)
+        )
+        self.assertGreater(workload[0], 3 * workload[-1])
+
+    def test_generate_data_twice(self):
+        args = ("generate_data", "--workers", "20", "--seed", "1")
+
+        with self.assertRaisesMessage(
+            CommandError, "Generated usernames already exist"
+        ) as raised:
+            call_command(*args)
+        self.assertIn(
+            get_user_model().objects.order_by("username").first().username,
+            str(raised.exception),
+        )
+        self.assertEqual(Task.objects.count(), 200)
+
+    def test_run_benchmark(self):
+        report = run_benchmark(
+            get_user_model().objects.first(), iterations=3, warmup=0
+        )
+
+        self.assertEqual(report["dataset"]["tasks"], 200)
+        self.assertIn("worker_detail", report["results"])
+        for result in report["results"].values():
+            self.assertEqual(result["status"], 200, result["url"])
+            self.assertLessEqual(result["p50_ms"], result["max_ms"])
+            self.assertGreater(result["queries"], 0)
+
+        ratios = {name: ratio for name, _, _, ratio in compare(report, report)}
+        self.assertEqual(ratios["index"], 1)
+
+
+class ConcurrencyBenchmarkTest(TransactionTestCase):
+    def test_run_concurrency_benchmark(self):
+        generate_dataset(workers=5, tasks=20, max_assignees=2, seed=1)
+
+        report = run_concurrency_benchmark(
+            get_user_model().objects.first(),
+            concurrency=2,
+            requests=4,
+            only=("index", "task_list", "task_detail"),
+        )
+
+        for stack in ("wsgi", "asgi"):
+            self.assertEqual(
+                set(report["results"][stack]),
+                {"index", "task_list", "task_detail"},
+            )
+            for result in report["results"][stack].values():
+                self.assertEqual(result["status"], 200, result["url"])
+                self.assertEqual(result["requests"], 4)
+                self.assertGreater(result["requests_per_second"], 0)
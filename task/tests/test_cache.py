@@ -0,0 +1,188 @@
+import time
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from task import cache as task_cache
+from task.cache import TieredCache
+from task.metrics import render_cache_stats
+
+
+def make_cache(name, **options):
+    return TieredCache(
+        name,
+        {
+            "OPTIONS": {
+                "L2": {
+                    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                    "LOCATION": "test-l2",
+                },
+                **options,
+            }
+        },
+    )
+
+
+class TieredCacheTest(SimpleTestCase):
+    def setUp(self) -> None:
+        task_cache._local_tiers.clear()
+        self.cache = make_cache("worker-1", SYNC_INTERVAL=0)
+        self.cache.clear()
+
+    def test_reads_are_served_from_l1(self):
+        self.cache.set("key", "value")
+
+        with mock.patch.object(
+            self.cache.l2, "get_many", wraps=self.cache.l2.get_many
+        ) as l2_get_many:
+            self.assertEqual(self.cache.get("key"), "value")
+            self.assertEqual(self.cache.get_many(["key"]), {"key": "value"})
+
+        # Only the namespace generations are read from L2.
+        self.assertNotIn(
+            mock.call(["key"], version=None), l2_get_many.call_args_list
+        )
+        self.assertEqual(self.cache.stats["l1_hits"], 2)
+
+    def test_l1_misses_fall_back_to_l2(self):
+        self.cache.l2.set("key", "value")
+
+        self.assertEqual(self.cache.get("key"), "value")
+        self.assertEqual(self.cache.get("key"), "value")
+        self.assertIsNone(self.cache.get("missing"))
+        self.assertEqual(self.cache.stats["l2_hits"], 1)
+        self.assertEqual(self.cache.stats["l1_hits"], 1)
+        self.assertEqual(self.cache.stats["misses"], 1)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = make_cache("small", L1_MAX_ENTRIES=2, SYNC_INTERVAL=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.stats["evictions"], 1)
+        self.assertIs(cache.l1.get(cache.make_key("b")), task_cache._MISSING)
+        self.assertEqual(cache.l1.get(cache.make_key("a")), 1)
+
+    def test_l1_entries_expire(self):
+        cache = make_cache("short", L1_TIMEOUT=0.01, SYNC_INTERVAL=60)
+        cache.set("key", "value")
+        time.sleep(0.02)
+
+        self.assertEqual(cache.get("key"), "value")
+        self.assertEqual(cache.stats["expirations"], 1)
+        self.assertEqual(cache.stats["l2_hits"], 1)
+
+    def test_writes_in_other_processes_invalidate_l1(self):
+        other = make_cache("worker-2", SYNC_INTERVAL=0)
+        self.cache.set("key", "old")
+        self.assertEqual(other.get("key"), "old")
+
+        self.cache.set("key", "new")
+
+        self.assertEqual(other.get("key"), "new")
+        self.assertEqual(other.stats["invalidations"], 1)
+
+    def test_writes_only_invalidate_their_namespace(self):
+        other = make_cache("worker-2", SYNC_INTERVAL=0)
+        self.cache.set("task:counter:tasks", 1)
+        self.cache.set("task:version:task", 1)
+        other.get_many(["task:counter:tasks", "task:version:task"])
+
+        self.cache.set("task:version:task", 2)
+        self.cache.set("task:fragment:page", "html")
+
+        self.assertEqual(other.get("task:counter:tasks"), 1)
+        self.assertEqual(other.get("task:version:task"), 2)
+        self.assertEqual(other.stats["l1_hits"], 1)
+        self.assertEqual(other.stats["invalidations"], 1)
+
+    def test_own_writes_keep_l1(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.incr("b")
+
+        self.assertEqual(self.cache.get_many(["a", "b"]), {"a": 1, "b": 3})
+        self.assertEqual(self.cache.stats["l1_hits"], 2)
+
+    def test_delete_reaches_l2(self):
+        self.cache.set("key", "value")
+        self.cache.delete("key")
+
+        self.assertFalse(self.cache.has_key("key"))
+        self.assertIsNone(self.cache.l2.get("key"))
+
+    def test_threads_share_l1(self):
+        self.assertIs(make_cache("worker-1").l1, self.cache.l1)
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "task.cache.TieredCache",
+                "LOCATION": "worker-1",
+                "OPTIONS": {
+                    "L2": {
+                        "BACKEND": "django.core.cache.backends.locmem."
+                        "LocMemCache",
+                        "LOCATION": "test-l2",
+                    },
+                },
+            }
+        }
+    )
+    def test_stats_are_exported(self):
+        caches["default"].get("missing")
+
+        self.assertIn(
+            'task_cache_events_total{cache="default",event="misses"} 1',
+            render_cache_stats(),
+        )
+
+
+class CacheConfigTest(SimpleTestCase):
+    def test_parse(self):
+        self.assertEqual(
+            task_cache.parse("file:///var/tmp/cache"),
+            {
+                "BACKEND": "django.core.cache.backends.filebased."
+                "FileBasedCache",
+                "LOCATION": "/var/tmp/cache",
+            },
+        )
+        self.assertEqual(
+            task_cache.parse("redis://localhost:6379/1")["LOCATION"],
+            "redis://localhost:6379/1",
+        )
+        with self.assertRaises(ValueError):
+            task_cache.parse("memcached://localhost")
+
+    def test_shared_backends_are_tiered(self):
+        with mock.patch.dict(
+            "os.environ",
+            {"CACHE_URL": "redis://localhost", "CACHE_L1_MAX_ENTRIES": "50"},
+        ):
+            config = task_cache.config()
+
+        self.assertEqual(config["BACKEND"], "task.cache.TieredCache")
+        self.assertEqual(config["OPTIONS"]["L1_MAX_ENTRIES"], 50)
+        self.assertEqual(
+            config["OPTIONS"]["L2"]["LOCATION"], "redis://localhost"
+        )
+
+    def test_local_backends_are_not_tiered(self):
+        with mock.patch.dict("os.environ", {"CACHE_URL": "locmem://"}):
+            self.assertEqual(
+                task_cache.config()["BACKEND"],
+                "django.core.cache.backends.locmem.LocMemCache",
+            )
+
+        with mock.patch.dict(
+            "os.environ",
+            {"CACHE_URL": "file:///tmp/cache", "CACHE_L1_MAX_ENTRIES": "0"},
+        ):
+            self.assertEqual(
+                task_cache.config()["BACKEND"],
+                "django.core.cache.backends.filebased.FileBasedCache",
+            )
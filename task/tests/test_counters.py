@@ -0,0 +1,110 @@
+import time
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task import counters
+from task.models import Position, TaskType, Task
+
+
+class DashboardCountersTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.position = Position.objects.create(name="DevOps")
+        self.worker = get_user_model().objects.create_user(
+            username="worker",
+            password="qwerty",
+            position=self.position,
+        )
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.task = Task.objects.create(
+            name="Fix Dashboard",
+            description="Fix Dashboard for Vacancies",
+            deadline="2030-10-05",
+            is_completed=False,
+            priority=Task.Priority.LOW,
+            task_type=self.task_type,
+        )
+        cache.clear()
+
+    def test_counts_match_database(self):
+        self.assertEqual(counters.get_counts(), counters.compute_counts())
+
+    def test_counters_follow_create_update_delete(self):
+        counters.get_counts()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(
+                name="Fix Login",
+                description="Fix Login page",
+                deadline="2030-10-05",
+                is_completed=True,
+                priority=Task.Priority.HIGH,
+                task_type=self.task_type,
+            )
+            task = Task.objects.get(id=self.task.id)
+            task.is_completed = True
+            task.save()
+            Position.objects.create(name="QA")
+            self.task_type.delete()
+
+        self.assertEqual(
+            counters.get_counts(),
+            {
+                "task_types": 0,
+                "tasks": 2,
+                "open_tasks": 0,
+                "completed_tasks": 2,
+                "positions": 2,
+                "workers": 1,
+            },
+        )
+
+    def test_rolled_back_changes_are_not_counted(self):
+        counts = counters.get_counts()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    Position.objects.create(name="QA")
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        self.assertEqual(counters.get_counts(), counts)
+
+    @override_settings(TASK_COUNTER_TIMEOUT=60)
+    def test_drifted_counters_expire(self):
+        counters.get_counts()
+        cache.incr(counters._key("tasks"), 100)
+
+        with mock.patch("time.time", return_value=time.time() + 61):
+            self.assertEqual(counters.get_counts()["tasks"], 1)
+
+    def test_index_runs_no_aggregate_queries_when_warm(self):
+        self.client.force_login(self.worker)
+        self.client.get(reverse("task:index"))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("task:index"))
+
+        self.assertEqual(response.context["tasks"], 1)
+        self.assertEqual(response.context["open_tasks"], 1)
+        self.assertFalse(
+            any("COUNT(" in query["sql"] for query in queries.captured_queries)
+        )
+
+    def test_rebuild_counters_command(self):
+        counters.get_counts()
+        cache.set(counters._key("tasks"), 100)
+
+        call_command("rebuild_counters", stdout=StringIO())
+
+        self.assertEqual(counters.get_counts()["tasks"], 1)
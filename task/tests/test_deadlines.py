@@ -0,0 +1,172 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from task import deadlines, fragments
+from task.models import Task, TaskEvent
+
+
+class DeadlineBucketTest(TestCase):
+    def setUp(self) -> None:
+        fragments.bump("task")
+        self.today = timezone.localdate()
+        self.end_of_week = deadlines.end_of_week(self.today)
+        self.user = get_user_model().objects.create_user(
+            username="worker", password="qwerty"
+        )
+        self.client.force_login(self.user)
+
+        self.tasks = {
+            name: self.create_task(name, deadline)
+            for name, deadline in (
+                ("overdue", self.today - timedelta(days=3)),
+                ("today", self.today),
+                ("later", self.end_of_week + timedelta(days=1)),
+            )
+        }
+        if self.end_of_week > self.today:
+            self.tasks["week"] = self.create_task("week", self.end_of_week)
+        self.create_task("done", self.today - timedelta(days=1), True)
+
+    def create_task(self, name, deadline, is_completed=False):
+        return Task.objects.create(
+            name=name,
+            description=name,
+            deadline=deadline,
+            is_completed=is_completed,
+        )
+
+    def test_buckets(self):
+        for bucket in deadlines.BUCKETS:
+            names = set(
+                Task.objects.filter(
+                    deadlines.bucket_filter(bucket, self.today)
+                ).values_list("name", flat=True)
+            )
+            self.assertEqual(names, {bucket} & set(self.tasks), bucket)
+
+    def test_due_filter(self):
+        month = Task.objects.filter(
+            deadlines.due_filter(f"{self.today:%Y-%m}")
+        )
+        day = Task.objects.filter(deadlines.due_filter(f"{self.today}"))
+
+        self.assertIn("today", month.values_list("name", flat=True))
+        self.assertEqual(list(day.values_list("name", flat=True)), ["today"])
+        for value in ("soon", "2030-13", "2030-02-30", "9999-12-31"):
+            with self.assertRaises(ValueError):
+                deadlines.due_filter(value)
+
+    def test_bucket_counts_are_one_cached_query(self):
+        with self.assertNumQueries(1):
+            counts = deadlines.get_bucket_counts()
+        with self.assertNumQueries(0):
+            self.assertEqual(deadlines.get_bucket_counts(), counts)
+
+        self.assertEqual(counts["overdue"], 1)
+        self.assertEqual(counts["today"], 1)
+        self.assertEqual(counts["later"], 1)
+
+        self.create_task("overdue too", self.today - timedelta(days=1))
+        self.assertEqual(deadlines.get_bucket_counts()["overdue"], 2)
+
+    def test_day_counts(self):
+        counts = deadlines.get_day_counts(self.today.year, self.today.month)
+
+        self.assertEqual(counts[self.today], {"open": 1, "total": 1})
+
+    def test_task_list_filter(self):
+        response = self.client.get(
+            reverse("task:task-list"), {"due": "overdue"}
+        )
+
+        self.assertEqual(
+            [task.name for task in response.context["task_list"]],
+            ["overdue"],
+        )
+        self.assertContains(response, "Overdue (1)")
+        self.assertEqual(
+            self.client.get(
+                reverse("task:task-list"), {"due": "soon"}
+            ).status_code,
+            404,
+        )
+
+    def test_bulk_select_all_keeps_the_filter(self):
+        url = reverse("task:task-bulk")
+
+        self.client.post(
+            url, {"select_all": "on", "due": "overdue", "delete": "on"}
+        )
+
+        self.assertFalse(Task.objects.filter(name="overdue").exists())
+        self.assertEqual(
+            Task.objects.count(), len(self.tasks)
+        )
+        response = self.client.post(
+            url,
+            {"select_all": "on", "due": "soon", "delete": "on"},
+            HTTP_ACCEPT="application/json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Task.objects.count(), len(self.tasks))
+
+    def test_bulk_operations_keep_the_selection(self):
+        overdue = self.tasks["overdue"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("task:task-bulk"),
+                {
+                    "select_all": "on",
+                    "due": "overdue",
+                    "is_completed": "true",
+                    "priority": Task.Priority.URGENT,
+                    "add_assignees": [self.user.pk],
+                },
+                HTTP_ACCEPT="application/json",
+            )
+
+        operations = response.json()["operations"]
+        self.assertEqual(
+            {name: result["rows"] for name, result in operations.items()},
+            {"is_completed": 1, "priority": 1, "add_assignees": 1},
+        )
+        overdue.refresh_from_db()
+        self.assertTrue(overdue.is_completed)
+        self.assertEqual(overdue.priority, Task.Priority.URGENT)
+        self.assertEqual(list(self.user.tasks.all()), [overdue])
+        self.assertEqual(
+            set(
+                TaskEvent.objects.filter(
+                    field__in=["is_completed", "priority"]
+                ).values_list("task__name", "field")
+            ),
+            {("overdue", "is_completed"), ("overdue", "priority")},
+        )
+
+    def test_calendar(self):
+        response = self.client.get(reverse("task:task-calendar"))
+
+        self.assertContains(response, "1 open / 1")
+        self.assertContains(response, f'?due={self.today}"')
+        for month in ("2030-13", "0001-01", "9999-12"):
+            self.assertEqual(
+                self.client.get(
+                    reverse("task:task-calendar"), {"month": month}
+                ).status_code,
+                404,
+                month,
+            )
+
+    def test_api_filter(self):
+        url = reverse("task:api-task-list")
+
+        response = self.client.get(url, {"due": "today", "fields": "name"})
+        self.assertEqual(response.json()["results"], [{"name": "today"}])
+
+        response = self.client.get(url, {"due": "soon"})
+        self.assertEqual(response.status_code, 400)
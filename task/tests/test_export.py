@@ -0,0 +1,102 @@
+import json
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task.export import iter_task_rows
+from task.models import TaskType, Task
+
+
+class TaskExportTest(TestCase):
+    def setUp(self) -> None:
+        self.worker = get_user_model().objects.create_user(
+            username="worker",
+            password="qwerty",
+        )
+        other = get_user_model().objects.create_user(
+            username="another",
+            password="qwerty",
+        )
+        self.client.force_login(self.worker)
+        task_type = TaskType.objects.create(name="Bug")
+        self.tasks = []
+
+        for number in range(5):
+            task = Task.objects.create(
+                name=f"{number}Fix Dashboard",
+                description="Fix, Dashboard",
+                deadline="2030-10-05",
+                is_completed=False,
+                priority=Task.Priority.HIGH,
+                task_type=task_type if number else None,
+            )
+            task.assignees.add(self.worker, other)
+            self.tasks.append(task)
+
+    def test_one_assignee_query_per_chunk(self):
+        with CaptureQueriesContext(connection) as queries:
+            rows = list(iter_task_rows(chunk_size=2))
+
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(len(queries), 1 + 3)
+        self.assertEqual(
+            rows[0],
+            {
+                "id": self.tasks[0].pk,
+                "name": "0Fix Dashboard",
+                "description": "Fix, Dashboard",
+                "deadline": rows[0]["deadline"],
+                "is_completed": False,
+                "priority": "High",
+                "task_type": None,
+                "assignees": ["another", "worker"],
+            }
+        )
+
+    def test_csv_view(self):
+        response = self.client.get(reverse("task:task-export"))
+        lines = b"".join(response.streaming_content).decode().splitlines()
+
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(len(lines), 6)
+        self.assertEqual(
+            lines[2],
+            f'{self.tasks[1].pk},1Fix Dashboard,"Fix, Dashboard",2030-10-05,'
+            "False,High,Bug,another worker"
+        )
+
+    def test_ndjson_view_with_search(self):
+        response = self.client.get(
+            reverse("task:task-export"), {"format": "ndjson", "name": "3Fix"}
+        )
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+
+        self.assertEqual([row["name"] for row in rows], ["3Fix Dashboard"])
+
+    def test_unknown_format(self):
+        response = self.client.get(
+            reverse("task:task-export"), {"format": "xml"}
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_command(self):
+        output = StringIO()
+
+        call_command("export_tasks", "--format", "ndjson", stdout=output)
+
+        self.assertEqual(len(output.getvalue().splitlines()), 5)
+
+        for chunk_size in ("0", "-1"):
+            with self.assertRaisesMessage(CommandError, "--chunk-size"):
+                call_command(
+                    "export_tasks", "--chunk-size", chunk_size, stdout=output
+                )
@@ -24,7 +24,7 @@ class TaskFormTest(TestCase):
             "description": "Fix Dashboard for Vacancies",
             "deadline": timezone.now() + timezone.timedelta(days=1),
             "is_completed": False,
-            "priority": "low",
+            "priority": Task.Priority.LOW,
             "task_type": self.task_type,
             "assignees": [self.worker],
         }
@@ -38,7 +38,7 @@ class TaskFormTest(TestCase):
             "description": "Fix Dashboard for Vacancies",
             "deadline": timezone.now() - timezone.timedelta(days=1),
             "is_completed": False,
-            "priority": "low",
+            "priority": Task.Priority.LOW,
             "task_type": self.task_type,
             "assignees": [self.worker],
         }
@@ -56,7 +56,7 @@ class TaskFormTest(TestCase):
             "description": "Fix Dashboard for Vacancies",
             "deadline": timezone.now() + timezone.timedelta(days=365 * 20 + 1),
             "is_completed": False,
-            "priority": "low",
+            "priority": Task.Priority.LOW,
             "task_type": self.task_type,
             "assignees": [self.worker],
         }
@@ -74,7 +74,7 @@ class TaskFormTest(TestCase):
             "description": "Fix Dashboard for Vacancies",
             "deadline": "2023",
             "is_completed": False,
-            "priority": "low",
+            "priority": Task.Priority.LOW,
             "task_type": self.task_type,
             "assignees": [self.worker],
         }
@@ -85,3 +85,63 @@ class TaskFormTest(TestCase):
             "Enter a valid date/time in the format: YYYY-MM-DD HH:MM:SS",
             form.errors["deadline"]
         )
+
+
+class TaskFormAssigneesTest(TestCase):
+    def setUp(self) -> None:
+        self.workers = get_user_model().objects.bulk_create(
+            get_user_model()(username=f"worker{number}")
+            for number in range(30)
+        )
+        self.task_type = TaskType.objects.create(name="Bug")
+
+    def get_form_data(self, assignees):
+        return {
+            "name": "Fix Dashboard",
+            "description": "Fix Dashboard for Vacancies",
+            "deadline": timezone.localdate() + timezone.timedelta(days=1),
+            "is_completed": False,
+            "priority": Task.Priority.LOW,
+            "task_type": self.task_type.id,
+            "assignees": [worker.id for worker in assignees],
+        }
+
+    def test_renders_only_selected_assignees(self):
+        form = TaskForm(data=self.get_form_data(self.workers[:2]))
+
+        with self.assertNumQueries(1):
+            html = str(form["assignees"])
+
+        self.assertIn("worker0", html)
+        self.assertIn("worker1", html)
+        self.assertNotIn("worker2", html)
+        self.assertIn("data-autocomplete-url", html)
+
+    def test_validates_submitted_assignees_in_one_query(self):
+        form = TaskForm(data=self.get_form_data(self.workers[:3]))
+
+        with self.assertNumQueries(1):
+            form.fields["assignees"].clean(form["assignees"].data)
+
+        self.assertTrue(form.is_valid())
+        self.assertEqual(
+            list(form.cleaned_data["assignees"].order_by("id")),
+            self.workers[:3]
+        )
+
+    def test_unknown_assignee(self):
+        data = self.get_form_data(self.workers[:1])
+        data["assignees"].append(0)
+        form = TaskForm(data=data)
+
+        self.assertFalse(form.is_valid())
+        self.assertIn("assignees", form.errors)
+
+    def test_non_integer_assignee(self):
+        data = self.get_form_data(self.workers[:1])
+        data["assignees"].append("abc")
+        form = TaskForm(data=data)
+
+        self.assertFalse(form.is_valid())
+        self.assertIn("assignees", form.errors)
+        self.assertIn("worker0", str(form["assignees"]))
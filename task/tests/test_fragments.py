@@ -0,0 +1,131 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from task import fragments
+from task.bulk import apply_bulk_operations
+from task.models import TaskType, Task, Position
+
+# Loading the session and the logged-in user.
+AUTH_QUERIES = 2
+
+
+class FragmentCacheTest(TestCase):
+    def setUp(self) -> None:
+        self.position = Position.objects.create(name="Developer")
+        self.user = get_user_model().objects.create_user(
+            username="worker",
+            password="qwerty",
+            position=self.position,
+        )
+        self.other = get_user_model().objects.create_user(
+            username="another",
+            password="qwerty",
+        )
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.task = Task.objects.create(
+            name="Fix Dashboard",
+            description="Fix Dashboard",
+            deadline="2030-10-05",
+            is_completed=False,
+            task_type=self.task_type,
+        )
+        self.task.assignees.add(self.user)
+        self.client.force_login(self.user)
+
+    def get_twice(self, url, cached_queries=AUTH_QUERIES):
+        first = self.client.get(url)
+        with self.assertNumQueries(cached_queries):
+            second = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 200)
+        return first, second
+
+    def test_task_list_served_from_fragments(self):
+        url = reverse("task:task-list")
+        first, second = self.get_twice(url)
+
+        self.assertContains(second, "Fix Dashboard")
+        self.assertContains(second, 'form="bulk-form"')
+        self.assertNotEqual(
+            first.context["csrf_token"], second.context["csrf_token"]
+        )
+
+        Task.objects.filter(pk=self.task.pk).update(name="Fix Login")
+        self.assertContains(self.client.get(url), "Fix Dashboard")
+
+        self.task.name = "Fix Login"
+        self.task.save()
+        self.assertContains(self.client.get(url), "Fix Login")
+
+    def test_search_and_pages_are_cached_separately(self):
+        url = reverse("task:task-list")
+        self.get_twice(url)
+
+        response = self.client.get(url, {"name": "Login"})
+
+        self.assertContains(response, "There are no tasks yet.")
+
+    def test_task_detail_keeps_per_user_bits_uncached(self):
+        url = reverse("task:task-detail", args=[self.task.pk])
+        _, second = self.get_twice(url, AUTH_QUERIES + 1)
+
+        self.assertContains(second, "Delete me from this task")
+        self.assertContains(second, "Bug")
+
+        self.client.force_login(self.other)
+        with self.assertNumQueries(AUTH_QUERIES + 1):
+            response = self.client.get(url)
+        self.assertContains(response, "Assign me to this task")
+        self.assertContains(response, "worker (")
+
+    def test_assignment_and_completion_invalidate_task_detail(self):
+        url = reverse("task:task-detail", args=[self.task.pk])
+        self.get_twice(url, AUTH_QUERIES + 1)
+
+        self.client.force_login(self.other)
+        self.client.get(reverse("task:assign-delete", args=[self.task.pk]))
+        self.client.post(reverse("task:mark-unmark", args=[self.task.pk]))
+        response = self.client.get(url)
+
+        self.assertContains(response, "another (")
+        self.assertContains(response, "Unmark as done")
+
+    def test_related_models_invalidate_detail_pages(self):
+        url = reverse("task:worker-detail", args=[self.user.pk])
+        self.get_twice(url)
+
+        self.task_type.name = "Feature"
+        self.task_type.save()
+        self.assertContains(self.client.get(url), "Feature")
+
+        self.position.name = "Designer"
+        self.position.save()
+        self.assertContains(self.client.get(url), "Designer")
+
+    def test_bulk_operations_invalidate_fragments(self):
+        url = reverse("task:task-detail", args=[self.task.pk])
+        self.get_twice(url, AUTH_QUERIES + 1)
+
+        apply_bulk_operations(Task.objects.all(), is_completed=True)
+
+        self.assertContains(self.client.get(url), "Unmark as done")
+
+    def test_worker_list_marks_current_user_outside_cache(self):
+        url = reverse("task:worker-list")
+        self.get_twice(url)
+
+        self.client.force_login(self.other)
+        with self.assertNumQueries(AUTH_QUERIES):
+            response = self.client.get(url)
+
+        self.assertContains(
+            response, f'.me-label[data-worker="{self.other.pk}"]'
+        )
+
+    def test_login_does_not_invalidate(self):
+        versions = fragments.get_versions(["worker"])
+
+        self.client.login(username="another", password="qwerty")
+
+        self.assertEqual(fragments.get_versions(["worker"]), versions)
@@ -0,0 +1,170 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from task import counters
+from task.importer import RowError, import_file, iter_json
+from task.models import TaskType, Task, Position
+
+FIXTURE = [
+    {"model": "task.tasktype", "pk": 7, "fields": {"name": "Bug"}},
+    {"model": "task.position", "pk": 3, "fields": {"name": "Developer"}},
+    {
+        "model": "task.worker",
+        "pk": 10,
+        "fields": {
+            "username": "joyce.byers",
+            "first_name": "Joyce",
+            "last_name": "Byers",
+            "position": 3,
+            "groups": [],
+        },
+    },
+    {
+        "model": "task.task",
+        "pk": 20,
+        "fields": {
+            "name": "Fix Dashboard",
+            "description": "Fix Dashboard",
+            "deadline": "2030-10-05",
+            "is_completed": False,
+            "priority": 1,
+            "task_type": 7,
+            "assignees": [10],
+        },
+    },
+]
+
+CSV = """name,description,deadline,is_completed,priority,task_type,assignees
+Fix Dashboard,Dashboard,2030-10-05,False,High,Bug,joyce.byers
+Write docs,Docs,2030-10-06,True,Low,Documentation,joyce.byers admin
+Refactor,Refactor,2030-10-07,False,,,
+"""
+
+
+class ImporterTest(TestCase):
+    def setUp(self) -> None:
+        self.position = Position.objects.create(name="Developer")
+        get_user_model().objects.bulk_create(
+            [
+                get_user_model()(username="joyce.byers"),
+                get_user_model()(username="admin"),
+            ]
+        )
+        TaskType.objects.create(name="Bug")
+
+    def test_json_fixture_keeps_ids(self):
+        get_user_model().objects.all().delete()
+        TaskType.objects.all().delete()
+        Position.objects.all().delete()
+
+        import_file(StringIO(json.dumps(FIXTURE)), "json")
+
+        task = Task.objects.get()
+        worker = get_user_model().objects.get()
+        self.assertEqual(task.pk, 20)
+        self.assertEqual(task.task_type_id, 7)
+        self.assertEqual(worker.pk, 10)
+        self.assertEqual(worker.position_id, 3)
+        self.assertFalse(worker.has_usable_password())
+        self.assertEqual(list(task.assignees.all()), [worker])
+
+    def test_csv_resolves_names_in_batches(self):
+        with self.assertNumQueries(17):
+            importer = import_file(StringIO(CSV), "csv", batch_size=2)
+
+        self.assertEqual(importer.counts["task"], 3)
+        self.assertEqual(importer.counts["tasktype"], 1)
+        self.assertEqual(importer.counts["assignments"], 3)
+
+        docs = Task.objects.get(name="Write docs")
+        self.assertEqual(docs.priority, Task.Priority.LOW)
+        self.assertTrue(docs.is_completed)
+        self.assertEqual(docs.task_type.name, "Documentation")
+        self.assertEqual(
+            sorted(docs.assignees.values_list("username", flat=True)),
+            ["admin", "joyce.byers"],
+        )
+        refactor = Task.objects.get(name="Refactor")
+        self.assertEqual(refactor.priority, Task.Priority.MEDIUM)
+        self.assertIsNone(refactor.task_type)
+        self.assertEqual(counters.get_counts()["tasks"], 3)
+
+    def test_unknown_assignee_rolls_back(self):
+        data = CSV.replace("joyce.byers admin", "nobody")
+
+        with self.assertRaisesMessage(RowError, "Record 2: Unknown name"):
+            import_file(StringIO(data), "csv", batch_size=1)
+
+        self.assertFalse(Task.objects.exists())
+        self.assertFalse(TaskType.objects.filter(name="Documentation"))
+
+    def test_deadlines_are_validated_in_both_modes(self):
+        data = CSV.replace("2030-10-06", "2020-10-06").replace(
+            "Low", "Someday"
+        )
+
+        importer = import_file(StringIO(data), "csv", dry_run=True)
+
+        self.assertEqual(
+            importer.errors,
+            [
+                "Record 2: Invalid priority: Someday",
+            ],
+        )
+        importer = import_file(
+            StringIO(data.replace("Someday", "Low")), "csv", dry_run=True
+        )
+        self.assertEqual(
+            importer.errors,
+            ["Record 2: The deadline cannot be set in the past"],
+        )
+        self.assertFalse(Task.objects.exists())
+        self.assertFalse(TaskType.objects.filter(name="Documentation"))
+
+        data = data.replace("Someday", "Low")
+        with self.assertRaisesMessage(RowError, "Record 2: The deadline"):
+            import_file(StringIO(data), "csv")
+        self.assertFalse(Task.objects.exists())
+
+        import_file(StringIO(data), "csv", check_deadlines=False)
+        self.assertEqual(Task.objects.count(), 3)
+
+    def test_iter_json_reads_in_chunks(self):
+        items = list(iter_json(StringIO(json.dumps(FIXTURE)), chunk_size=7))
+
+        self.assertEqual(items, FIXTURE)
+
+    def test_command(self):
+        output = StringIO()
+        ndjson = "\n".join(
+            json.dumps({"name": f"Task {number}", "description": "Task",
+                        "deadline": "2030-10-05", "is_completed": False})
+            for number in range(5)
+        )
+
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".ndjson", delete=False
+        ) as file:
+            file.write(ndjson)
+        self.addCleanup(os.remove, file.name)
+
+        call_command("import_data", file.name, stdout=output)
+
+        self.assertEqual(Task.objects.count(), 5)
+        self.assertIn("rows/s", output.getvalue())
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "import_data",
+                file.name,
+                "--format",
+                "csv",
+                stdout=StringIO(),
+            )
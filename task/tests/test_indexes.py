@@ -0,0 +1,125 @@
+import os
+import re
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+
+from task.models import Task, TaskType
+
+SEED_ROWS = int(os.environ.get("TASK_EXPLAIN_ROWS", 5000))
+BATCH_SIZE = 10000
+
+
+class TaskIndexUsageTest(TestCase):
+    """
+    EXPLAIN the hot task queries over a seeded table and assert they are
+    served by an index instead of a full scan followed by a sort. Set
+    TASK_EXPLAIN_ROWS=1000000 to check the plans on a production-sized
+    dataset.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.task_types = TaskType.objects.bulk_create(
+            TaskType(name=f"Type {number}") for number in range(20)
+        )
+        workers = get_user_model().objects.bulk_create(
+            get_user_model()(username=f"worker{number}")
+            for number in range(100)
+        )
+        cls.worker = workers[0]
+
+        priorities = Task.Priority.values
+        for start in range(0, SEED_ROWS, BATCH_SIZE):
+            Task.objects.bulk_create(
+                Task(
+                    name=f"Task {number}",
+                    description="Seeded task",
+                    deadline=f"2030-{number % 12 + 1:02}-{number % 28 + 1:02}",
+                    is_completed=number % 5 != 0,
+                    priority=priorities[number % len(priorities)],
+                    task_type=cls.task_types[number % len(cls.task_types)],
+                )
+                for number in range(start, min(start + BATCH_SIZE, SEED_ROWS))
+            )
+
+        Task.assignees.through.objects.bulk_create(
+            (
+                Task.assignees.through(
+                    task_id=task_id, worker_id=workers[task_id % 100].id
+                )
+                for task_id in Task.objects.values_list("id", flat=True)
+            ),
+            batch_size=BATCH_SIZE,
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def assertIndexScan(self, queryset, sorted_by_index=True):
+        plan = queryset.explain()
+
+        if connection.vendor == "postgresql":
+            self.assertNotRegex(plan, r"Seq Scan on task_task(_assignees)?\b")
+            if sorted_by_index:
+                self.assertNotRegex(plan, r"\bSort\b")
+        elif connection.vendor == "sqlite":
+            self.assertNotRegex(
+                plan,
+                re.compile(r"SCAN task_task(_assignees)?$", re.MULTILINE),
+            )
+            if sorted_by_index:
+                self.assertNotIn("USE TEMP B-TREE FOR ORDER BY", plan)
+
+        return plan
+
+    def test_task_list_page(self):
+        plan = self.assertIndexScan(Task.objects.all()[:4])
+
+        if connection.vendor == "sqlite":
+            self.assertIn("task_ordering_idx", plan)
+
+    def test_task_list_cursor_page(self):
+        self.assertIndexScan(
+            Task.objects.order_by("is_completed", "priority", "id").filter(
+                is_completed=False, priority=Task.Priority.LOW, id__gt=100
+            )[:5]
+        )
+
+    def test_admin_filters(self):
+        self.assertIndexScan(
+            Task.objects.filter(task_type=self.task_types[0])[:100]
+        )
+        self.assertIndexScan(
+            Task.objects.filter(
+                is_completed=False, priority=Task.Priority.HIGH
+            )[:100]
+        )
+
+    def test_open_tasks(self):
+        plan = self.assertIndexScan(
+            Task.objects.filter(is_completed=False)[:100]
+        )
+
+        if connection.vendor == "sqlite":
+            self.assertIn("task_open_ordering_idx", plan)
+
+    def test_deadline_buckets(self):
+        self.assertIndexScan(
+            Task.objects.filter(is_completed=False)
+            .order_by()
+            .values_list("deadline"),
+            sorted_by_index=False,
+        )
+        self.assertIndexScan(
+            Task.objects.filter(
+                is_completed=False, deadline__lt="2030-03-01"
+            ).order_by("deadline"),
+        )
+
+    def test_worker_detail_tasks(self):
+        self.assertIndexScan(
+            self.worker.tasks.select_related("task_type"),
+            sorted_by_index=False,
+        )
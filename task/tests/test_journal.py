@@ -0,0 +1,170 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from task import journal
+from task.bulk import apply_bulk_operations
+from task.models import Task, TaskEvent, TaskType
+
+
+class JournalTest(TestCase):
+    def setUp(self) -> None:
+        self.worker = get_user_model().objects.create_user(
+            username="worker", password="qwerty"
+        )
+        self.client.force_login(self.worker)
+        self.task_type = TaskType.objects.create(name="Bug")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task = Task.objects.create(
+                name="Fix Dashboard",
+                description="Fix Dashboard for Vacancies",
+                deadline="2030-10-05",
+                is_completed=False,
+            )
+
+    def events(self, **filters):
+        return list(
+            TaskEvent.objects.filter(**filters)
+            .order_by("id")
+            .values_list("action", "field", "old_value", "new_value")
+        )
+
+    def test_saves_and_deletes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            task = Task.objects.get()
+            task.name = "Fix Dashboard Now"
+            task.task_type = self.task_type
+            task.save()
+            task.delete()
+
+        self.assertEqual(
+            self.events(),
+            [
+                ("created", "", None, "Fix Dashboard"),
+                ("changed", "name", "Fix Dashboard", "Fix Dashboard Now"),
+                ("changed", "task_type", None, self.task_type.pk),
+                ("deleted", "", "Fix Dashboard Now", None),
+            ],
+        )
+
+    def test_update_view(self):
+        url = reverse("task:task-update", args=[self.task.pk])
+        data = {
+            "name": "Fix Dashboard",
+            "description": "Fix Dashboard for Vacancies",
+            "deadline": "2030-10-06",
+            "is_completed": True,
+            "priority": Task.Priority.URGENT,
+            "task_type": self.task_type.pk,
+            "assignees": [self.worker.pk],
+        }
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            self.events(actor=self.worker),
+            [
+                ("changed", "deadline", "2030-10-05", "2030-10-06"),
+                ("changed", "is_completed", False, True),
+                ("changed", "priority", 3, 1),
+                ("changed", "task_type", None, self.task_type.pk),
+                ("assigned", "assignees", None, self.worker.pk),
+            ],
+        )
+
+    def test_batches(self):
+        with journal.Journal(batch_size=2) as journaled:
+            journaled.extend([journal.event(self.task.pk, "changed")] * 2)
+            self.assertEqual(journaled.pending, [])
+            journaled.extend([journal.event(self.task.pk, "changed")])
+            self.assertEqual(len(journaled.pending), 1)
+
+        self.assertEqual(journaled.pending, [])
+        self.assertEqual(TaskEvent.objects.filter(action="changed").count(), 3)
+
+    def test_rolled_back_changes_are_not_journaled(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    Task.objects.filter(pk=self.task.pk).get().delete()
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        self.assertEqual(self.events(action="deleted"), [])
+
+    def test_views_and_bulk_operations(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse("task:assign-delete", args=[self.task.pk])
+            )
+            self.client.post(reverse("task:mark-unmark", args=[self.task.pk]))
+            apply_bulk_operations(
+                Task.objects.all(),
+                priority=Task.Priority.LOW,
+                task_type=self.task_type,
+                remove_assignees=[self.worker],
+            )
+
+        self.assertEqual(
+            self.events(task=self.task)[1:],
+            [
+                ("assigned", "assignees", None, self.worker.pk),
+                ("changed", "is_completed", False, True),
+                ("unassigned", "assignees", self.worker.pk, None),
+                ("changed", "priority", 3, 4),
+                ("changed", "task_type", None, self.task_type.pk),
+            ],
+        )
+
+    def test_api_since(self):
+        TaskEvent.objects.update(created_at=timezone.now() - timedelta(1))
+        since = timezone.now() - timedelta(hours=1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.assignees.add(self.worker)
+        url = reverse("task:api-task-event-list")
+
+        response = self.client.get(
+            url, {"since": since.isoformat(), "fields": "action,task"}
+        )
+        self.assertEqual(
+            response.json()["results"],
+            [{"action": "assigned", "task": self.task.pk}],
+        )
+
+        response = self.client.get(url, {"since": "yesterday"})
+        self.assertEqual(response.status_code, 400)
+
+    @override_settings(TASK_EVENT_RETENTION_DAYS=30)
+    def test_compact(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for name in ("First", "Second"):
+                self.task.name = name
+                self.task.save()
+        TaskEvent.objects.update(created_at=timezone.now() - timedelta(60))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.assignees.add(self.worker)
+
+        call_command("compact_task_events", "--keep-latest", stdout=StringIO())
+        self.assertEqual(
+            self.events(),
+            [
+                ("created", "", None, "Fix Dashboard"),
+                ("changed", "name", "First", "Second"),
+                ("assigned", "assignees", None, self.worker.pk),
+            ],
+        )
+
+        out = StringIO()
+        call_command("compact_task_events", "--batch-size", "1", stdout=out)
+        self.assertIn("2 event(s) deleted", out.getvalue())
+        self.assertEqual(len(self.events()), 1)
@@ -0,0 +1,100 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from task.metrics import reset_metrics
+from task.models import Task
+
+
+class RequestMetricsTest(TestCase):
+    def setUp(self) -> None:
+        reset_metrics()
+        self.addCleanup(reset_metrics)
+        self.user = get_user_model().objects.create_user(
+            username="staff",
+            password="qwerty",
+            is_staff=True,
+        )
+        self.client.force_login(self.user)
+
+    def test_server_timing_header(self):
+        response = self.client.get(reverse("task:task-list"))
+
+        timing = response["Server-Timing"]
+        self.assertRegex(timing, r'db;dur=[\d.]+;desc="\d+ queries"')
+        self.assertRegex(timing, r"tpl;dur=[\d.]+")
+        self.assertRegex(timing, r"total;dur=[\d.]+")
+        self.assertNotIn("tpl;dur=0.0,", timing)
+
+    @override_settings(TASK_METRICS_TOKEN="secret")
+    def test_server_timing_requires_staff_or_token(self):
+        self.client.force_login(
+            get_user_model().objects.create_user(username="worker")
+        )
+        url = reverse("task:task-list")
+
+        self.assertNotIn("Server-Timing", self.client.get(url))
+        self.assertIn(
+            "Server-Timing",
+            self.client.get(url, HTTP_AUTHORIZATION="Bearer secret"),
+        )
+        self.client.logout()
+        self.assertNotIn("Server-Timing", self.client.get(reverse("login")))
+
+    def test_metrics_endpoint(self):
+        self.client.get(reverse("task:index"))
+        self.client.get(reverse("task:index"))
+
+        response = self.client.get(reverse("task:metrics"))
+        body = response.content.decode()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("# TYPE task_request_duration_seconds histogram", body)
+        self.assertIn(
+            'task_request_duration_seconds_count{view="task:index",'
+            'method="GET",status="200"} 2',
+            body,
+        )
+        self.assertIn(
+            'task_request_db_queries_bucket{view="task:index",'
+            'method="GET",le="+Inf"} 2',
+            body,
+        )
+        self.assertIn("task_request_template_duration_seconds_sum", body)
+
+    @override_settings(TASK_METRICS_TOKEN="secret")
+    def test_metrics_requires_staff_or_token(self):
+        self.client.logout()
+
+        self.assertEqual(
+            self.client.get(reverse("task:metrics")).status_code, 403
+        )
+        self.assertEqual(
+            self.client.get(
+                reverse("task:metrics"), HTTP_AUTHORIZATION="Bearer wrong"
+            ).status_code,
+            403,
+        )
+        self.assertEqual(
+            self.client.get(
+                reverse("task:metrics"), HTTP_AUTHORIZATION="Bearer secret"
+            ).status_code,
+            200,
+        )
+
+    @override_settings(TASK_SLOW_REQUEST_MS=0)
+    def test_slow_requests_are_logged_with_sql(self):
+        Task.objects.create(
+            name="Fix Dashboard",
+            description="Fix Dashboard",
+            deadline="2030-10-05",
+            is_completed=False,
+        )
+
+        with self.assertLogs("task.requests", "WARNING") as logs:
+            self.client.get(reverse("task:task-list"))
+
+        self.assertIn(
+            "Slow request GET /tasks/ (task:task-list)", logs.output[0]
+        )
+        self.assertIn('FROM "task_task"', logs.output[0])
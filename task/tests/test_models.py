@@ -47,7 +47,7 @@ class TaskModelTest(TestCase):
             description="Fix Dashboard for Vacancies",
             deadline="2024-10-05T03:26:35Z",
             is_completed=False,
-            priority="low",
+            priority=Task.Priority.LOW,
             task_type=task_type)
         task.assignees.set([worker])
 
@@ -91,3 +91,20 @@ class WorkerModelTest(TestCase):
 
     def tearDown(self) -> None:
         self.worker.delete()
+
+
+class TaskPriorityTest(TestCase):
+    def test_default_ordering_by_priority_rank(self):
+        for priority in ["Low", "Urgent", "Medium", "High"]:
+            Task.objects.create(
+                name=priority,
+                description="",
+                deadline="2030-10-05",
+                is_completed=False,
+                priority=Task.Priority[priority.upper()],
+            )
+
+        self.assertEqual(
+            [task.get_priority_display() for task in Task.objects.all()],
+            ["Urgent", "High", "Medium", "Low"]
+        )
@@ -0,0 +1,173 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from task import fragments
+from task.nplusone import (
+    NPlusOneError,
+    NPlusOneMiddleware,
+    assert_no_nplusone,
+    query_shape,
+    record_queries,
+)
+from task.models import TaskType, Task, Position
+
+
+class QueryScalingTestCase(TestCase):
+    """
+    Renders a page with a few rows and with many, and fails when the
+    second render needs more queries or repeats a query shape.
+    """
+
+    def assertQueriesDoNotScale(self, url, add_rows, few=1, many=8):
+        add_rows(few)
+        self.client.get(url)
+        # Measure full renders, not pages served from cached fragments.
+        fragments.bump(*fragments.VERSIONED_MODELS)
+        with assert_no_nplusone() as small:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        add_rows(many - few)
+        fragments.bump(*fragments.VERSIONED_MODELS)
+        with assert_no_nplusone() as large:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(
+            small.count,
+            large.count,
+            f"{url} issued {small.count} queries for {few} rows "
+            f"and {large.count} for {many}:\n"
+            + "\n".join(large.shapes),
+        )
+
+
+class ViewQueryScalingTest(QueryScalingTestCase):
+    def setUp(self) -> None:
+        self.position = Position.objects.create(name="Developer")
+        self.user = get_user_model().objects.create_user(
+            username="worker",
+            password="qwerty",
+            position=self.position,
+        )
+        self.client.force_login(self.user)
+        self.task = Task.objects.create(
+            name="Fix Dashboard",
+            description="Fix Dashboard",
+            deadline="2030-10-05",
+            is_completed=False,
+        )
+        self.number = 0
+
+    def create_tasks(self, count, worker=None):
+        for _ in range(count):
+            self.number += 1
+            task = Task.objects.create(
+                name=f"Task {self.number}",
+                description="Task",
+                deadline="2030-10-05",
+                is_completed=self.number % 2 == 0,
+                task_type=TaskType.objects.create(name=f"Type {self.number}"),
+            )
+            if worker:
+                task.assignees.add(worker)
+
+    def create_workers(self, count):
+        for _ in range(count):
+            self.number += 1
+            worker = get_user_model().objects.create(
+                username=f"worker{self.number}",
+                position=Position.objects.create(
+                    name=f"Position {self.number}"
+                ),
+            )
+            self.task.assignees.add(worker)
+
+    def test_task_list(self):
+        self.assertQueriesDoNotScale(
+            reverse("task:task-list"), self.create_tasks
+        )
+
+    def test_task_list_cursor(self):
+        self.assertQueriesDoNotScale(
+            reverse("task:task-list") + "?cursor=", self.create_tasks
+        )
+
+    def test_task_type_list(self):
+        self.assertQueriesDoNotScale(
+            reverse("task:task-type-list"), self.create_tasks
+        )
+
+    def test_position_list(self):
+        self.assertQueriesDoNotScale(
+            reverse("task:position-list"), self.create_workers
+        )
+
+    def test_worker_list(self):
+        self.assertQueriesDoNotScale(
+            reverse("task:worker-list"), self.create_workers
+        )
+
+    def test_worker_detail(self):
+        self.assertQueriesDoNotScale(
+            reverse("task:worker-detail", args=[self.user.pk]),
+            lambda count: self.create_tasks(count, worker=self.user),
+        )
+
+    def test_task_detail(self):
+        self.assertQueriesDoNotScale(
+            reverse("task:task-detail", args=[self.task.pk]),
+            self.create_workers,
+        )
+
+    def test_index(self):
+        self.assertQueriesDoNotScale(reverse("task:index"), self.create_tasks)
+
+
+class NPlusOneDetectorTest(TestCase):
+    def setUp(self) -> None:
+        for number in range(4):
+            Task.objects.create(
+                name=f"Task {number}",
+                description="Task",
+                deadline="2030-10-05",
+                is_completed=False,
+                task_type=TaskType.objects.create(name=f"Type {number}"),
+            )
+
+    def test_query_shape_collapses_in_lists(self):
+        self.assertEqual(
+            query_shape("SELECT * FROM t WHERE id IN (%s, %s,\n %s)"),
+            query_shape("SELECT * FROM t WHERE id IN (%s)"),
+        )
+
+    def test_reports_per_row_lookups(self):
+        with self.assertRaises(NPlusOneError) as error:
+            with assert_no_nplusone():
+                [task.task_type.name for task in Task.objects.all()]
+
+        self.assertIn('4x SELECT "task_tasktype"', str(error.exception))
+        self.assertIn("test_nplusone.py", str(error.exception))
+
+        with record_queries() as recorder:
+            [
+                task.task_type.name
+                for task in Task.objects.select_related("task_type")
+            ]
+        self.assertEqual(recorder.offenders(), [])
+
+    def test_middleware_logs_offenders(self):
+        def view(request):
+            [task.task_type.name for task in Task.objects.all()]
+            return "response"
+
+        request = self.client.get(reverse("task:index")).wsgi_request
+
+        with self.assertLogs("task.nplusone", "WARNING") as logs:
+            NPlusOneMiddleware(view)(request)
+        self.assertIn("Possible N+1 queries in GET /", logs.output[0])
+
+        with override_settings(TASK_NPLUSONE="raise"):
+            with self.assertRaises(NPlusOneError):
+                NPlusOneMiddleware(view)(request)
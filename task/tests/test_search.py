@@ -0,0 +1,114 @@
+from importlib import import_module
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from task import search
+from task.forms import NameSearchForm, WorkerUsernameSearchForm
+from task.models import Position, TaskType, Task
+
+fts_migration = import_module("task.migrations.0012_search_fts_tables")
+
+
+class SearchBackendTest(TestCase):
+    def setUp(self) -> None:
+        self.dashboard = Task.objects.create(
+            name="Fix Dashboard",
+            description="Vacancies page is broken",
+            deadline="2030-10-05",
+            is_completed=False,
+            priority=Task.Priority.LOW,
+        )
+        self.login = Task.objects.create(
+            name="Login form",
+            description="Add remember me to the dashboard login",
+            deadline="2030-10-05",
+            is_completed=False,
+            priority=Task.Priority.LOW,
+        )
+        self.worker = get_user_model().objects.create_user(
+            username="carl",
+            password="qwerty",
+            first_name="Carl",
+            last_name="Derek",
+        )
+
+    def search_tasks(self, query, **kwargs):
+        return list(
+            search.search(Task.objects.order_by("id"), query, **kwargs)
+        )
+
+    def test_name_and_description_substrings(self):
+        self.assertEqual(
+            self.search_tasks("ashboa"), [self.dashboard, self.login]
+        )
+        self.assertEqual(self.search_tasks("VACANCIES"), [self.dashboard])
+        self.assertEqual(self.search_tasks("remember me"), [self.login])
+        self.assertEqual(self.search_tasks("missing"), [])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.login.name = "Signup form"
+        self.login.description = "Add captcha"
+        self.login.save()
+        self.dashboard.delete()
+
+        self.assertEqual(self.search_tasks("ashboa"), [])
+        self.assertEqual(self.search_tasks("captcha"), [self.login])
+
+    def test_short_query_falls_back_to_contains(self):
+        self.assertEqual(self.search_tasks("Fi"), [self.dashboard])
+
+    def test_worker_username_and_full_name(self):
+        form = WorkerUsernameSearchForm({"username": "carl derek"})
+
+        self.assertEqual(
+            list(form.search(get_user_model().objects.all())), [self.worker]
+        )
+
+    @override_settings(
+        TASK_SEARCH_BACKEND="task.search.ContainsSearchBackend"
+    )
+    def test_contains_backend_matches_full_name(self):
+        self.assertEqual(
+            list(search.search(get_user_model().objects.all(), "l der")),
+            [self.worker],
+        )
+
+    def test_names_without_fts_table(self):
+        position = Position.objects.create(name="Developer")
+        Position.objects.create(name="Designer")
+
+        form = NameSearchForm({"name": "velop"})
+
+        self.assertEqual(list(form.search(Position.objects.all())), [position])
+
+    def test_migration_resyncs_after_triggers_are_lost(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("FTS5 mirror tables are SQLite only")
+
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER task_task_fts_insert")
+        task_type = TaskType.objects.create(name="Bug")
+        task = Task.objects.create(
+            name="Refactor search",
+            description="",
+            deadline="2030-10-05",
+            is_completed=False,
+            priority=Task.Priority.LOW,
+            task_type=task_type,
+        )
+
+        fts_migration.install_fts(connection)
+
+        self.assertEqual(self.search_tasks("efactor"), [task])
+
+    def test_list_view_uses_search_backend(self):
+        self.client.force_login(self.worker)
+
+        response = self.client.get(
+            reverse("task:task-list"), {"name": "broken"}
+        )
+
+        self.assertEqual(list(response.context["task_list"]), [self.dashboard])
@@ -0,0 +1,199 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from task import task_counts
+from task.bulk import apply_bulk_operations
+from task.models import Position, Task, TaskType
+
+
+class TaskCountsTest(TestCase):
+    def setUp(self) -> None:
+        self.position = Position.objects.create(name="Developer")
+        self.bug, self.feature = (
+            TaskType.objects.create(name=name) for name in ("Bug", "Feature")
+        )
+        self.worker, self.other = (
+            get_user_model().objects.create_user(
+                username=username, password="qwerty", position=self.position
+            )
+            for username in ("worker", "other")
+        )
+        self.task = self.create_task()
+
+    def create_task(self, **fields):
+        return Task.objects.create(
+            **{
+                "name": "Fix Dashboard",
+                "description": "Fix Dashboard for Vacancies",
+                "deadline": "2030-10-05",
+                "is_completed": False,
+                "task_type": self.bug,
+                **fields,
+            }
+        )
+
+    def assertCounts(self, obj, open_tasks, completed_tasks):
+        obj.refresh_from_db()
+        self.assertEqual(
+            (obj.open_task_count, obj.completed_task_count),
+            (open_tasks, completed_tasks),
+        )
+
+    def assertNoDrift(self):
+        self.assertFalse(any(task_counts.reconcile().values()))
+
+    def test_task_saves(self):
+        self.assertCounts(self.bug, 1, 0)
+
+        self.task.is_completed = True
+        self.task.save()
+        self.assertCounts(self.bug, 0, 1)
+
+        self.task.task_type = self.feature
+        self.task.save()
+        self.assertCounts(self.bug, 0, 0)
+        self.assertCounts(self.feature, 0, 1)
+
+        partial = Task.objects.only("id").get()
+        partial.task_type = self.bug
+        partial.save()
+        self.assertNoDrift()
+
+    def test_assignments(self):
+        self.task.assignees.add(self.worker, self.other)
+        self.assertCounts(self.worker, 1, 0)
+
+        self.worker.tasks.add(self.create_task(is_completed=True))
+        self.assertCounts(self.worker, 1, 1)
+
+        self.task.is_completed = True
+        self.task.save()
+        self.assertCounts(self.worker, 0, 2)
+        self.assertCounts(self.other, 0, 1)
+
+        self.task.assignees.remove(self.worker, self.worker.pk + 100)
+        self.assertCounts(self.worker, 0, 1)
+
+        self.task.assignees.clear()
+        self.worker.tasks.clear()
+        self.assertCounts(self.worker, 0, 0)
+        self.assertCounts(self.other, 0, 0)
+        self.assertNoDrift()
+
+    def test_delete(self):
+        self.task.assignees.add(self.worker)
+
+        Task.objects.all().delete()
+
+        self.assertCounts(self.worker, 0, 0)
+        self.assertCounts(self.bug, 0, 0)
+
+    def test_bulk_delete(self):
+        self.create_task(is_completed=True, task_type=self.feature)
+        self.create_task()
+        for task in Task.objects.all():
+            task.assignees.add(self.worker, self.other)
+
+        with self.assertNumQueries(8):
+            apply_bulk_operations(Task.objects.all(), delete=True)
+
+        self.assertCounts(self.worker, 0, 0)
+        self.assertCounts(self.bug, 0, 0)
+        self.assertCounts(self.feature, 0, 0)
+        self.assertNoDrift()
+
+    def test_worker_positions(self):
+        self.position.refresh_from_db()
+        self.assertEqual(self.position.worker_count, 2)
+
+        self.worker.position = Position.objects.create(name="QA")
+        self.worker.save()
+        self.other.delete()
+
+        self.position.refresh_from_db()
+        self.assertEqual(self.position.worker_count, 0)
+        self.assertNoDrift()
+
+    def test_views_and_bulk_operations(self):
+        self.client.force_login(self.worker)
+        self.client.post(reverse("task:assign-delete", args=[self.task.pk]))
+        self.client.post(reverse("task:mark-unmark", args=[self.task.pk]))
+
+        self.assertCounts(self.worker, 0, 1)
+        self.assertCounts(self.bug, 0, 1)
+
+        second = self.create_task()
+        apply_bulk_operations(
+            Task.objects.all(),
+            is_completed=False,
+            task_type=self.feature,
+            add_assignees=[self.other],
+        )
+
+        self.assertCounts(self.other, 2, 0)
+        self.assertCounts(self.feature, 2, 0)
+        self.assertCounts(self.bug, 0, 0)
+
+        apply_bulk_operations(
+            Task.objects.filter(pk=second.pk), remove_assignees=[self.other]
+        )
+        self.assertCounts(self.other, 1, 0)
+        self.assertNoDrift()
+
+    def test_saving_a_stale_instance_keeps_the_counts(self):
+        stale = get_user_model().objects.get(pk=self.worker.pk)
+        self.worker.tasks.add(
+            self.task, self.create_task(is_completed=True)
+        )
+
+        stale.position = Position.objects.create(name="QA")
+        stale.save()
+        stale_type = TaskType.objects.get(pk=self.feature.pk)
+        self.create_task(task_type=self.feature)
+        stale_type.name = "Story"
+        stale_type.save()
+
+        for model in (get_user_model(), TaskType, Position):
+            counts = task_counts.actual_counts(model)
+            for row in model.objects.annotate(
+                **{f"actual_{name}": count for name, count in counts.items()}
+            ).values(*counts, *(f"actual_{name}" for name in counts)):
+                for name in counts:
+                    self.assertEqual(row[name], row[f"actual_{name}"], name)
+        self.assertCounts(self.worker, 1, 1)
+
+    def test_reconcile_command(self):
+        TaskType.objects.update(open_task_count=7)
+        get_user_model().objects.update(completed_task_count=3)
+        out = StringIO()
+
+        call_command("reconcile_task_counts", stdout=out)
+
+        self.assertIn("task types: 2 row(s) fixed", out.getvalue())
+        self.assertIn("workers: 2 row(s) fixed", out.getvalue())
+        self.assertIn("positions: 0 row(s) fixed", out.getvalue())
+        self.assertCounts(self.bug, 1, 0)
+        self.assertCounts(self.worker, 0, 0)
+
+    def test_list_ordering(self):
+        self.client.force_login(self.worker)
+        self.create_task(task_type=self.feature)
+        self.create_task(task_type=self.feature)
+
+        url = reverse("task:task-type-list")
+
+        for params in ({}, {"cursor": ""}):
+            response = self.client.get(url, {"ordering": "load", **params})
+            self.assertEqual(
+                list(response.context["task_type_list"]),
+                [self.feature, self.bug],
+            )
+
+        response = self.client.get(
+            reverse("task:position-list"), {"ordering": "salary"}
+        )
+        self.assertEqual(response.status_code, 404)
@@ -1,7 +1,10 @@
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from task import deadlines
 from task.models import Task, Position, TaskType
 
 
@@ -23,7 +26,7 @@ class TaskViewTest(TestCase):
                 description=f"{number}Fix Dashboard for Vacancies",
                 deadline="2024-10-05T03:26:35Z",
                 is_completed=False,
-                priority="low",
+                priority=Task.Priority.LOW,
                 task_type=self.task_type)
             task.assignees.set([self.worker])
 
@@ -104,7 +107,7 @@ class TaskViewTest(TestCase):
             "description": "Fix",
             "deadline": "2024-10-05T03:26:35Z",
             "is_completed": False,
-            "priority": "high",
+            "priority": Task.Priority.HIGH,
             "task_type": self.task_type.id,
             "assignees": [self.worker.id],
         }
@@ -122,7 +125,7 @@ class TaskViewTest(TestCase):
             "description": "Fix",
             "deadline": "2024-10-05T03:26:35Z",
             "is_completed": False,
-            "priority": "high",
+            "priority": Task.Priority.HIGH,
             "task_type": self.task_type,
             "assignees": [self.worker],
         }
@@ -145,7 +148,7 @@ class TaskViewTest(TestCase):
             "description": "Fix",
             "deadline": "2024-10-05T03:26:35Z",
             "is_completed": False,
-            "priority": "high",
+            "priority": Task.Priority.HIGH,
             "task_type": self.task_type.id,
             "assignees": [self.worker.id],
         }
@@ -198,7 +201,7 @@ class AssignDeleteTaskTest(TestCase):
             description="Fix Dashboard for Vacancies",
             deadline="2024-10-05T03:26:35Z",
             is_completed=False,
-            priority="low",
+            priority=Task.Priority.LOW,
             task_type=self.task_type)
         self.task.assignees.set([self.worker])
 
@@ -252,7 +255,7 @@ class MarkUnmarkAsDoneViewTest(TestCase):
             description="Fix Dashboard for Vacancies",
             deadline="2024-10-05T03:26:35Z",
             is_completed=False,
-            priority="low",
+            priority=Task.Priority.LOW,
             task_type=self.task_type)
         self.task.assignees.set([self.worker])
 
@@ -282,3 +285,430 @@ class MarkUnmarkAsDoneViewTest(TestCase):
         self.task.refresh_from_db()
 
         self.assertFalse(self.task.is_completed)
+
+
+class CursorPaginationTest(TestCase):
+    def setUp(self) -> None:
+        self.worker = get_user_model().objects.create_user(
+            username="worker",
+            password="qwerty",
+        )
+        self.client.force_login(self.worker)
+
+        priorities = Task.Priority.values
+        for number in range(10):
+            Task.objects.create(
+                name=f"{number}Fix Dashboard",
+                description="Fix Dashboard for Vacancies",
+                deadline="2030-10-05",
+                is_completed=number % 3 == 0,
+                priority=priorities[number % 4],
+            )
+
+        self.expected = list(
+            Task.objects.order_by("is_completed", "priority", "id")
+        )
+
+    def test_first_page_without_count_query(self):
+        # The deadline bucket counts are cached separately from the page.
+        deadlines.get_bucket_counts()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse("task:task-list"), {"cursor": ""}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            list(response.context["task_list"]), self.expected[:4]
+        )
+        self.assertFalse(response.context["page_obj"].has_previous())
+        self.assertFalse(
+            any("COUNT(" in query["sql"] for query in queries.captured_queries)
+        )
+
+    def test_walk_forward_and_back(self):
+        response = self.client.get(reverse("task:task-list"), {"cursor": ""})
+        seen = list(response.context["task_list"])
+
+        while response.context["page_obj"].has_next():
+            response = self.client.get(
+                reverse("task:task-list"),
+                {"cursor": response.context["page_obj"].next_cursor},
+            )
+            seen += list(response.context["task_list"])
+
+        self.assertEqual(seen, self.expected)
+
+        response = self.client.get(
+            reverse("task:task-list"),
+            {"cursor": response.context["page_obj"].previous_cursor},
+        )
+
+        self.assertEqual(
+            list(response.context["task_list"]), self.expected[4:8]
+        )
+
+    def test_cursor_keeps_search_filter(self):
+        response = self.client.get(
+            reverse("task:task-list"), {"cursor": "", "name": "1Fix"}
+        )
+
+        self.assertEqual(
+            list(response.context["task_list"]),
+            [Task.objects.get(name="1Fix Dashboard")]
+        )
+
+    def test_invalid_cursor(self):
+        response = self.client.get(
+            reverse("task:task-list"), {"cursor": "not-a-cursor"}
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+
+class WorkerDetailViewTest(TestCase):
+    def setUp(self) -> None:
+        self.position = Position.objects.create(name="DevOps")
+        self.worker = get_user_model().objects.create_user(
+            username="worker",
+            password="qwerty",
+            position=self.position,
+        )
+        self.client.force_login(self.worker)
+        self.task_type = TaskType.objects.create(name="Bug")
+
+    def create_tasks(self, count):
+        for number in range(count):
+            task = Task.objects.create(
+                name=f"{number}Fix Dashboard",
+                description="Fix Dashboard for Vacancies",
+                deadline="2030-10-05",
+                is_completed=number % 2 == 0,
+                priority=Task.Priority.LOW,
+                task_type=self.task_type,
+            )
+            task.assignees.add(self.worker)
+
+    def test_tasks_partitioned_by_completion(self):
+        self.create_tasks(3)
+
+        response = self.client.get(
+            reverse("task:worker-detail", args=[self.worker.id])
+        )
+
+        self.assertEqual(
+            [task.name for task in response.context["not_completed"]],
+            ["1Fix Dashboard"]
+        )
+        self.assertEqual(
+            sorted(task.name for task in response.context["is_completed"]),
+            ["0Fix Dashboard", "2Fix Dashboard"]
+        )
+        self.assertContains(response, self.task_type.name, count=3)
+
+    def test_query_count_does_not_grow_with_tasks(self):
+        url = reverse("task:worker-detail", args=[self.worker.id])
+
+        self.create_tasks(1)
+        with self.assertNumQueries(4):
+            self.client.get(url)
+
+        self.create_tasks(10)
+        with self.assertNumQueries(4):
+            self.client.get(url)
+
+
+class AssigneeQueriesTest(TestCase):
+    def setUp(self) -> None:
+        self.worker = get_user_model().objects.create_user(
+            username="worker",
+            password="qwerty",
+        )
+        self.client.force_login(self.worker)
+        self.task = Task.objects.create(
+            name="Fix Dashboard",
+            description="Fix Dashboard for Vacancies",
+            deadline="2030-10-05",
+            is_completed=False,
+            priority=Task.Priority.LOW,
+        )
+
+    def add_assignees(self, count):
+        offset = self.task.assignees.count()
+        self.task.assignees.add(
+            *get_user_model().objects.bulk_create(
+                get_user_model()(username=f"assignee{offset + number}")
+                for number in range(count)
+            )
+        )
+
+    def test_toggle_assignment(self):
+        url = reverse("task:assign-delete", args=[self.task.id])
+
+        self.client.post(url)
+        self.assertTrue(self.task.assignees.filter(id=self.worker.id).exists())
+
+        self.client.post(url)
+        self.assertFalse(
+            self.task.assignees.filter(id=self.worker.id).exists()
+        )
+
+    def test_toggle_missing_task(self):
+        response = self.client.post(reverse("task:assign-delete", args=[0]))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_toggle_query_count_does_not_grow_with_assignees(self):
+        url = reverse("task:assign-delete", args=[self.task.id])
+        self.add_assignees(1)
+
+        with CaptureQueriesContext(connection) as few:
+            self.client.post(url)
+            self.client.post(url)
+
+        self.add_assignees(20)
+
+        with CaptureQueriesContext(connection) as many:
+            self.client.post(url)
+            self.client.post(url)
+
+        self.assertEqual(len(few), len(many))
+
+    def test_detail_loads_assignees_once(self):
+        url = reverse("task:task-detail", args=[self.task.id])
+        self.task.assignees.add(self.worker)
+        self.add_assignees(1)
+
+        with CaptureQueriesContext(connection) as few:
+            response = self.client.get(url)
+
+        self.assertTrue(response.context["is_assignee"])
+        self.assertContains(response, "Delete me from this task")
+
+        self.add_assignees(20)
+
+        with CaptureQueriesContext(connection) as many:
+            self.client.get(url)
+
+        self.assertEqual(len(few), len(many))
+        self.assertEqual(
+            sum(
+                "task_task_assignees" in query["sql"]
+                for query in many.captured_queries
+            ),
+            1
+        )
+
+
+class MarkUnmarkToggleTest(TestCase):
+    def setUp(self) -> None:
+        self.worker = get_user_model().objects.create_user(
+            username="worker",
+            password="qwerty",
+        )
+        self.client.force_login(self.worker)
+        self.task = Task.objects.create(
+            name="Fix Dashboard",
+            description="Fix Dashboard for Vacancies",
+            deadline="2030-10-05",
+            is_completed=False,
+            priority=Task.Priority.LOW,
+        )
+        self.url = reverse("task:mark-unmark", args=[self.task.id])
+
+    def test_toggle_returns_json_for_ajax(self):
+        response = self.client.post(
+            self.url, HTTP_ACCEPT="application/json"
+        )
+
+        self.assertEqual(
+            response.json(), {"id": self.task.id, "is_completed": True}
+        )
+
+        response = self.client.post(
+            self.url, HTTP_X_REQUESTED_WITH="XMLHttpRequest"
+        )
+
+        self.assertEqual(
+            response.json(), {"id": self.task.id, "is_completed": False}
+        )
+
+    def test_toggle_updates_only_completion_column(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url)
+
+        updates = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith('UPDATE "task_task"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertNotIn('"name"', updates[0])
+        if connection.features.can_return_columns_from_insert:
+            self.assertIn("RETURNING", updates[0])
+            self.assertFalse(
+                any(
+                    query["sql"].startswith('SELECT "task_task"')
+                    for query in queries.captured_queries
+                )
+            )
+        self.assertRedirects(
+            response, reverse("task:task-detail", args=[self.task.id])
+        )
+        self.task.refresh_from_db()
+        self.assertTrue(self.task.is_completed)
+
+    def test_get_not_allowed(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 405)
+
+    def test_missing_task(self):
+        response = self.client.post(reverse("task:mark-unmark", args=[0]))
+
+        self.assertEqual(response.status_code, 404)
+
+
+class BulkTaskOperationsTest(TestCase):
+    def setUp(self) -> None:
+        self.worker = get_user_model().objects.create_user(
+            username="worker",
+            password="qwerty",
+        )
+        self.client.force_login(self.worker)
+        self.task_type = TaskType.objects.create(name="Bug")
+
+        for number in range(5):
+            Task.objects.create(
+                name=f"{number}Fix Dashboard",
+                description="Fix Dashboard for Vacancies",
+                deadline="2030-10-05",
+                is_completed=False,
+                priority=Task.Priority.LOW,
+            )
+
+        self.ids = list(Task.objects.values_list("id", flat=True))
+        self.url = reverse("task:task-bulk")
+
+    def post(self, data):
+        return self.client.post(
+            self.url, data=data, HTTP_ACCEPT="application/json"
+        )
+
+    def test_update_selected_tasks(self):
+        response = self.post(
+            {
+                "tasks": self.ids[:3],
+                "is_completed": "true",
+                "priority": Task.Priority.URGENT,
+                "task_type": self.task_type.id,
+                "add_assignees": [self.worker.id],
+            }
+        )
+
+        operations = response.json()["operations"]
+        self.assertEqual(operations["is_completed"]["rows"], 3)
+        self.assertEqual(operations["is_completed"]["queries"], 3)
+        self.assertEqual(operations["priority"]["rows"], 3)
+        self.assertEqual(operations["task_type"]["rows"], 3)
+        self.assertEqual(operations["add_assignees"]["rows"], 3)
+        self.assertEqual(
+            Task.objects.filter(
+                is_completed=True,
+                priority=Task.Priority.URGENT,
+                task_type=self.task_type,
+            ).count(),
+            3
+        )
+        self.assertEqual(self.worker.tasks.count(), 3)
+
+    def test_update_tasks_matching_search(self):
+        response = self.post(
+            {
+                "select_all": "on",
+                "name": "1Fix",
+                "priority": Task.Priority.HIGH,
+            }
+        )
+
+        self.assertEqual(response.json()["operations"]["priority"]["rows"], 1)
+        self.assertEqual(
+            Task.objects.get(name="1Fix Dashboard").priority,
+            Task.Priority.HIGH
+        )
+
+    def test_remove_assignees_and_delete(self):
+        self.worker.tasks.add(*self.ids)
+
+        response = self.post(
+            {
+                "tasks": ",".join(str(pk) for pk in self.ids[:2]),
+                "remove_assignees": [self.worker.id],
+            }
+        )
+
+        self.assertEqual(
+            response.json()["operations"]["remove_assignees"]["rows"], 2
+        )
+        self.assertEqual(self.worker.tasks.count(), 3)
+
+        response = self.post({"tasks": self.ids[:2], "delete": "on"})
+
+        self.assertEqual(response.json()["operations"]["delete"]["rows"], 2)
+        self.assertEqual(Task.objects.count(), 3)
+
+    def test_requires_target(self):
+        response = self.post({"priority": Task.Priority.HIGH})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            Task.objects.filter(priority=Task.Priority.HIGH).count(), 0
+        )
+
+    def test_list_page_form_redirects(self):
+        response = self.client.post(
+            self.url, data={"tasks": self.ids[:1], "is_completed": "true"}
+        )
+
+        self.assertRedirects(response, reverse("task:task-list"))
+        self.assertTrue(Task.objects.get(id=self.ids[0]).is_completed)
+
+    def test_list_page_has_assignee_pickers(self):
+        response = self.client.get(reverse("task:task-list"))
+
+        for name in ("add_assignees", "remove_assignees"):
+            self.assertContains(
+                response, f'<select name="{name}" data-autocomplete-url'
+            )
+        self.assertContains(response, "js/autocomplete.js")
+
+
+class WorkerAutocompleteTest(TestCase):
+    def setUp(self) -> None:
+        get_user_model().objects.bulk_create(
+            get_user_model()(username=f"worker{number}", first_name="Carl")
+            for number in range(30)
+        )
+        self.client.force_login(
+            get_user_model().objects.get(username="worker0")
+        )
+        self.url = reverse("task:worker-autocomplete")
+
+    def test_results_are_limited(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(len(response.json()["results"]), 20)
+
+    def test_search(self):
+        response = self.client.get(self.url, {"q": "worker12"})
+
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {
+                    "id": get_user_model().objects.get(username="worker12").id,
+                    "text": "worker12 (Carl )",
+                }
+            ]
+        )
@@ -0,0 +1,85 @@
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task.visits import visit_counter
+
+
+@override_settings(TASK_VISITS_FLUSH_SECONDS=3600)
+class VisitCounterTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            username="worker",
+            password="qwerty",
+        )
+        self.client.force_login(self.user)
+        visit_counter.flush()
+
+    def stored_visits(self):
+        store_class = import_module(settings.SESSION_ENGINE).SessionStore
+        return store_class(self.client.session.session_key).get("num_visits")
+
+    def test_visits_are_buffered(self):
+        self.client.get(reverse("task:index"))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("task:index"))
+
+        self.assertEqual(response.context["num_visits"], 2)
+        self.assertFalse(
+            [
+                query
+                for query in queries
+                if "django_session" in query["sql"]
+                and not query["sql"].startswith("SELECT")
+            ]
+        )
+        self.assertIsNone(self.stored_visits())
+
+        self.assertEqual(visit_counter.flush(), 1)
+        self.assertEqual(self.stored_visits(), 2)
+
+        response = self.client.get(reverse("task:index"))
+        self.assertEqual(response.context["num_visits"], 3)
+
+    @override_settings(TASK_VISITS_FLUSH_SECONDS=0)
+    def test_flushes_when_due(self):
+        self.client.get(reverse("task:index"))
+        self.client.get(reverse("task:index"))
+
+        self.assertEqual(self.stored_visits(), 2)
+
+    @override_settings(TASK_VISITS_FLUSH_SECONDS=0, TASK_VISITS_FLUSH_BATCH=1)
+    def test_flushes_are_bounded(self):
+        store_class = import_module(settings.SESSION_ENGINE).SessionStore
+        for _ in range(2):
+            session = store_class()
+            session.create()
+            visit_counter.record(session)
+
+        self.assertEqual(visit_counter.flush_if_due(), 1)
+        self.assertEqual(visit_counter.flush_if_due(), 1)
+        self.assertEqual(visit_counter.flush_if_due(), 0)
+
+    def test_ended_sessions_are_skipped(self):
+        self.client.get(reverse("task:index"))
+        self.client.logout()
+
+        self.assertEqual(visit_counter.flush(), 0)
+
+    @override_settings(
+        SESSION_ENGINE="django.contrib.sessions.backends.signed_cookies"
+    )
+    def test_signed_cookie_sessions(self):
+        self.client.force_login(self.user)
+
+        self.client.get(reverse("task:index"))
+        response = self.client.get(reverse("task:index"))
+
+        self.assertEqual(response.context["num_visits"], 2)
+        self.assertEqual(self.client.session["num_visits"], 2)
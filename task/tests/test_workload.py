@@ -0,0 +1,142 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from task import fragments, workload
+from task.models import Position, Task
+
+
+class WorkloadTest(TestCase):
+    def setUp(self) -> None:
+        fragments.bump(*fragments.VERSIONED_MODELS)
+        self.today = timezone.localdate()
+        position = Position.objects.create(name="Developer")
+        self.busy, self.idle = (
+            get_user_model().objects.create_user(
+                username=username, password="qwerty", position=position
+            )
+            for username in ("busy", "idle")
+        )
+        self.client.force_login(self.busy)
+
+        for days, priority, is_completed in (
+            (-2, Task.Priority.URGENT, False),
+            (3, Task.Priority.URGENT, False),
+            (3, Task.Priority.LOW, False),
+            (-5, Task.Priority.HIGH, True),
+        ):
+            self.create_task(days, priority, is_completed, self.busy)
+        self.create_task(1, Task.Priority.HIGH, True, self.idle)
+
+    def create_task(self, days, priority, is_completed, *assignees):
+        task = Task.objects.create(
+            name="Task",
+            description="Task",
+            deadline=self.today + timedelta(days=days),
+            priority=priority,
+            is_completed=is_completed,
+        )
+        task.assignees.add(*assignees)
+        return task
+
+    def test_annotations(self):
+        busy = workload.annotate_workload(
+            get_user_model().objects.filter(pk=self.busy.pk)
+        ).get()
+
+        self.assertEqual(
+            workload.serialize_workload(busy),
+            {
+                "open": 3,
+                "completed": 1,
+                "overdue": 1,
+                "open_by_priority": {
+                    "urgent": 2, "high": 0, "medium": 0, "low": 1
+                },
+            },
+        )
+
+    def test_worker_list_query_count_does_not_grow_with_page(self):
+        url = reverse("task:worker-list")
+
+        def count_queries():
+            fragments.bump("worker")
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get(url)
+            return len(queries)
+
+        two_workers = count_queries()
+        for number in range(3):
+            self.create_task(
+                0,
+                Task.Priority.MEDIUM,
+                False,
+                get_user_model().objects.create_user(username=f"w{number}"),
+            )
+
+        self.assertEqual(count_queries(), two_workers)
+
+    def test_worker_list_ordering(self):
+        url = reverse("task:worker-list")
+
+        for ordering in ("workload", "completed", "urgent"):
+            for params in ({}, {"cursor": ""}):
+                response = self.client.get(
+                    url, {"ordering": ordering, **params}
+                )
+                self.assertEqual(
+                    response.context["worker_list"][0], self.busy
+                )
+
+        response = self.client.get(url, {"ordering": "high"})
+        self.assertContains(response, "<td>3</td>")
+        self.assertEqual(
+            self.client.get(url, {"ordering": "salary"}).status_code, 404
+        )
+
+    def test_worker_list_shows_what_it_sorts_by(self):
+        get_user_model().objects.filter(pk=self.idle.pk).update(
+            open_task_count=9
+        )
+
+        response = self.client.get(
+            reverse("task:worker-list"), {"ordering": "workload"}
+        )
+
+        self.assertEqual(response.context["worker_list"][0], self.idle)
+        self.assertContains(response, "<td>9</td>")
+
+    def test_worker_list_follows_assignments(self):
+        url = reverse("task:worker-list")
+        self.client.get(url)
+
+        self.create_task(0, Task.Priority.HIGH, False, self.idle)
+        response = self.client.get(url, {"ordering": "high"})
+
+        self.assertEqual(response.context["worker_list"][0], self.idle)
+
+    def test_api(self):
+        url = reverse("task:api-worker-list")
+
+        response = self.client.get(
+            url, {"fields": "username,workload", "ordering": "overdue"}
+        )
+        results = response.json()["results"]
+
+        self.assertEqual(results[0]["username"], "busy")
+        self.assertEqual(results[0]["workload"]["overdue"], 1)
+        self.assertEqual(results[1]["workload"]["completed"], 1)
+
+        response = self.client.get(
+            url, {"fields": "username", "ordering": "urgent", "page_size": 1}
+        )
+        next_page = self.client.get(response.json()["next"])
+        self.assertEqual(next_page.json()["results"], [{"username": "idle"}])
+
+        response = self.client.get(url, {"ordering": "salary"})
+        self.assertEqual(response.status_code, 400)
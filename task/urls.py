@@ -1,5 +1,16 @@
 from django.urls import path
 
+from task.api import (
+    TaskApiListView,
+    TaskApiDetailView,
+    WorkerApiListView,
+    WorkerApiDetailView,
+    PositionApiListView,
+    PositionApiDetailView,
+    TaskTypeApiListView,
+    TaskTypeApiDetailView,
+    TaskEventApiListView,
+)
 from task.views import (
     index,
     TaskTypeListView,
@@ -8,6 +19,7 @@ from task.views import (
     TaskTypeDeleteView,
     TaskListView,
     TaskDetailView,
+    task_calendar,
     TaskCreateView,
     TaskUpdateView,
     TaskDeleteView,
@@ -20,8 +32,13 @@ from task.views import (
     WorkerCreateView,
     WorkerUpdateView,
     WorkerDeleteView,
+    worker_autocomplete,
     assign_delete_task,
-    mark_unmark_as_done, signup,
+    mark_unmark_as_done,
+    bulk_update_tasks,
+    export_tasks,
+    metrics,
+    signup,
 )
 
 
@@ -46,6 +63,9 @@ urlpatterns = [
     path("tasks/", TaskListView.as_view(), name="task-list"),
     path("tasks/<int:pk>/", TaskDetailView.as_view(), name="task-detail"),
     path("tasks/create/", TaskCreateView.as_view(), name="task-create"),
+    path("tasks/bulk/", bulk_update_tasks, name="task-bulk"),
+    path("tasks/export/", export_tasks, name="task-export"),
+    path("tasks/calendar/", task_calendar, name="task-calendar"),
     path(
         "tasks/<int:pk>/update/",
         TaskUpdateView.as_view(),
@@ -89,6 +109,11 @@ urlpatterns = [
         name="worker-detail"
     ),
     path("workers/create/", WorkerCreateView.as_view(), name="worker-create"),
+    path(
+        "workers/autocomplete/",
+        worker_autocomplete,
+        name="worker-autocomplete"
+    ),
     path(
         "workers/<int:pk>/update/",
         WorkerUpdateView.as_view(),
@@ -100,6 +125,48 @@ urlpatterns = [
         name="worker-delete"
     ),
     path("signup/", signup, name="signup"),
+    path("metrics/", metrics, name="metrics"),
+    path("api/v1/tasks/", TaskApiListView.as_view(), name="api-task-list"),
+    path(
+        "api/v1/tasks/<int:pk>/",
+        TaskApiDetailView.as_view(),
+        name="api-task-detail"
+    ),
+    path(
+        "api/v1/workers/",
+        WorkerApiListView.as_view(),
+        name="api-worker-list"
+    ),
+    path(
+        "api/v1/workers/<int:pk>/",
+        WorkerApiDetailView.as_view(),
+        name="api-worker-detail"
+    ),
+    path(
+        "api/v1/positions/",
+        PositionApiListView.as_view(),
+        name="api-position-list"
+    ),
+    path(
+        "api/v1/positions/<int:pk>/",
+        PositionApiDetailView.as_view(),
+        name="api-position-detail"
+    ),
+    path(
+        "api/v1/task-types/",
+        TaskTypeApiListView.as_view(),
+        name="api-task-type-list"
+    ),
+    path(
+        "api/v1/task-types/<int:pk>/",
+        TaskTypeApiDetailView.as_view(),
+        name="api-task-type-detail"
+    ),
+    path(
+        "api/v1/task-events/",
+        TaskEventApiListView.as_view(),
+        name="api-task-event-list"
+    ),
 ]
 
 app_name = "task"
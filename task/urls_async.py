@@ -0,0 +1,25 @@
+from django.urls import path
+
+from task import async_views
+from task.urls import urlpatterns as sync_urlpatterns
+
+ASYNC_VIEWS = {
+    "index": async_views.index,
+    "task-type-list": async_views.TaskTypeListView.as_view(),
+    "task-list": async_views.TaskListView.as_view(),
+    "task-detail": async_views.TaskDetailView.as_view(),
+    "position-list": async_views.PositionListView.as_view(),
+    "worker-list": async_views.WorkerListView.as_view(),
+    "worker-detail": async_views.WorkerDetailView.as_view(),
+}
+
+# The routes of task.urls with the read-only pages swapped for their
+# async versions.
+urlpatterns = [
+    path(str(pattern.pattern), ASYNC_VIEWS[pattern.name], name=pattern.name)
+    if pattern.name in ASYNC_VIEWS
+    else pattern
+    for pattern in sync_urlpatterns
+]
+
+app_name = "task"
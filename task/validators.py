@@ -0,0 +1,12 @@
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+
+def validate_deadline(deadline):
+    if deadline < timezone.localdate():
+        raise ValidationError("The deadline cannot be set in the past")
+
+    max_deadline = timezone.localdate() + timezone.timedelta(days=365 * 20)
+
+    if deadline > max_deadline:
+        raise ValidationError("The deadline cannot be set more than 20 years into the future")
@@ -1,41 +1,87 @@
+import calendar
+from datetime import timedelta
+
+from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
-from django.shortcuts import render
+from django.db import connection, transaction
+from django.db.models import F, Prefetch
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseRedirect,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.shortcuts import render, get_object_or_404
 from django.urls import reverse_lazy, reverse
+from django.utils import timezone
 from django.views import generic
-
-from task.forms import WorkerForm, TaskForm, NameSearchForm, WorkerUsernameSearchForm, SignupForm
-from task.models import TaskType, Task, Position, Worker
+from django.views.decorators.http import require_POST
+
+from task import (
+    counters,
+    deadlines,
+    fragments,
+    journal,
+    search,
+    task_counts,
+    workload,
+)
+from task.bulk import apply_bulk_operations
+from task.export import EXPORT_FORMATS, iter_export
+from task.forms import (
+    filter_tasks,
+    WorkerForm,
+    TaskForm,
+    NameSearchForm,
+    WorkerUsernameSearchForm,
+    SignupForm,
+    TaskBulkForm,
+)
+from task.metrics import can_view_metrics, render_metrics
+from task.models import TaskType, Task, TaskEvent, Position, Worker
+from task.pagination import CursorPaginationMixin, OrderingParamMixin
+from task.visits import visit_counter
+
+AUTOCOMPLETE_LIMIT = 20
 
 
 @login_required
 def index(request: HttpRequest) -> HttpResponse:
-    task_types = TaskType.objects.count()
-    tasks = Task.objects.count()
-    positions = Position.objects.count()
-    workers = Worker.objects.count()
+    counts = counters.get_counts()
 
-    num_visits = request.session.get("num_visits", 0)
-    request.session["num_visits"] = num_visits + 1
+    num_visits = visit_counter.record(request.session)
 
     context = {
-        "task_types": task_types,
-        "tasks": tasks,
-        "positions": positions,
-        "workers": workers,
-        "num_visits": num_visits + 1,
+        "task_types": counts["task_types"],
+        "tasks": counts["tasks"],
+        "open_tasks": counts["open_tasks"],
+        "completed_tasks": counts["completed_tasks"],
+        "positions": counts["positions"],
+        "workers": counts["workers"],
+        "num_visits": num_visits,
     }
 
     return render(request, "task/index.html", context)
 
 
-class TaskTypeListView(LoginRequiredMixin, generic.ListView):
+class TaskTypeListView(
+    LoginRequiredMixin,
+    OrderingParamMixin,
+    CursorPaginationMixin,
+    generic.ListView,
+):
     model = TaskType
     template_name = "task/task_type_list.html"
     context_object_name = "task_type_list"
     paginate_by = 4
+    orderings = {
+        "load": ("-open_task_count", "id"),
+        "completed": ("-completed_task_count", "id"),
+    }
 
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -47,14 +93,9 @@ class TaskTypeListView(LoginRequiredMixin, generic.ListView):
         return context
 
     def get_queryset(self):
-        queryset = TaskType.objects.all()
-
-        name = self.request.GET.get("name")
-
-        if name:
-            return queryset.filter(name__icontains=name)
-
-        return queryset
+        return NameSearchForm(self.request.GET).search(
+            super().get_queryset()
+        )
 
 
 class TaskTypeCreateView(LoginRequiredMixin, generic.CreateView):
@@ -77,32 +118,113 @@ class TaskTypeDeleteView(LoginRequiredMixin, generic.DeleteView):
     template_name = "task/task_type_confirm_delete.html"
 
 
-class TaskListView(LoginRequiredMixin, generic.ListView):
+class TaskListView(
+    LoginRequiredMixin,
+    fragments.FragmentCacheMixin,
+    CursorPaginationMixin,
+    generic.ListView,
+):
     model = Task
     paginate_by = 4
+    cursor_ordering = ("is_completed", "priority", "id")
+    fragment_models = ("task", "tasktype")
+    fragment_names = ("content", "pagination")
 
-    def get_context_data(self, *, object_list=None, **kwargs):
-        context = super().get_context_data(**kwargs)
+    def get_fragment_key_parts(self):
+        # Buckets such as "overdue" move at midnight.
+        return (timezone.localdate(),)
 
+    def get_uncached_context_data(self):
         name = self.request.GET.get("name", "")
 
-        context["search_form"] = NameSearchForm(initial={"name": name})
+        return {
+            "search_form": NameSearchForm(initial={"name": name}),
+            "deadline_buckets": deadlines.get_bucket_summary(
+                self.get_bucket_counts()
+            ),
+        }
+
+    def get_bucket_counts(self):
+        return deadlines.get_bucket_counts()
+
+    def get_context_data(self, *, object_list=None, **kwargs):
+        context = super().get_context_data(**kwargs)
+
+        context["bulk_form"] = TaskBulkForm(
+            initial={
+                "name": self.request.GET.get("name", ""),
+                "due": self.request.GET.get("due", ""),
+            }
+        )
 
         return context
 
     def get_queryset(self):
-        queryset = Task.objects.all()
+        try:
+            return filter_tasks(Task.objects.all(), self.request.GET)
+        except ValueError as error:
+            raise Http404(str(error))
+
+
+class TaskDetailView(
+    LoginRequiredMixin, fragments.FragmentCacheMixin, generic.DetailView
+):
+    model = Task
+    queryset = Task.objects.select_related("task_type").prefetch_related(
+        Prefetch(
+            "assignees",
+            queryset=Worker.objects.only(
+                "id", "username", "first_name", "last_name"
+            ),
+        )
+    )
 
-        name = self.request.GET.get("name")
+    fragment_models = ("task", "tasktype", "worker")
+    fragment_names = ("details", "completion", "assignees")
 
-        if name:
-            return queryset.filter(name__icontains=name)
+    def get_uncached_context_data(self):
+        if self.object is None:
+            is_assignee = Task.assignees.through.objects.filter(
+                task_id=self.kwargs["pk"], worker_id=self.request.user.pk
+            ).exists()
+        else:
+            is_assignee = any(
+                assignee.pk == self.request.user.pk
+                for assignee in self.object.assignees.all()
+            )
 
-        return queryset
+        return {"task_id": self.kwargs["pk"], "is_assignee": is_assignee}
 
 
-class TaskDetailView(LoginRequiredMixin, generic.DetailView):
-    model = Task
+@login_required
+def task_calendar(request: HttpRequest) -> HttpResponse:
+    today = timezone.localdate()
+
+    try:
+        year, month = deadlines.parse_month(
+            request.GET.get("month") or f"{today:%Y-%m}"
+        )
+        day_counts = deadlines.get_day_counts(year, month)
+        weeks = [
+            [(day, day.month == month, day_counts.get(day)) for day in week]
+            for week in calendar.Calendar().monthdatescalendar(year, month)
+        ]
+        first, last = deadlines.month_range(year, month)
+        previous_month = first - timedelta(days=1)
+        next_month = last + timedelta(days=1)
+    except (ValueError, OverflowError) as error:
+        raise Http404(str(error))
+
+    context = {
+        "month": first,
+        "previous_month": previous_month,
+        "next_month": next_month,
+        "today": today,
+        "weeks": weeks,
+        "deadline_buckets": deadlines.get_bucket_summary(),
+    }
+
+    return render(request, "task/task_calendar.html", context)
 
 
 class TaskCreateView(LoginRequiredMixin, generic.CreateView):
@@ -124,9 +246,15 @@ class TaskDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("task:task-list")
 
 
-class PositionListView(LoginRequiredMixin, generic.ListView):
+class PositionListView(
+    LoginRequiredMixin,
+    OrderingParamMixin,
+    CursorPaginationMixin,
+    generic.ListView,
+):
     model = Position
     paginate_by = 4
+    orderings = {"workers": ("-worker_count", "id")}
 
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -138,14 +266,9 @@ class PositionListView(LoginRequiredMixin, generic.ListView):
         return context
 
     def get_queryset(self):
-        queryset = Position.objects.all()
-
-        name = self.request.GET.get("name")
-
-        if name:
-            return queryset.filter(name__icontains=name)
-
-        return queryset
+        return NameSearchForm(self.request.GET).search(
+            super().get_queryset()
+        )
 
 
 class PositionCreateView(LoginRequiredMixin, generic.CreateView):
@@ -165,50 +288,92 @@ class PositionDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("task:position-list")
 
 
-class WorkerListView(LoginRequiredMixin, generic.ListView):
+class WorkerListView(
+    LoginRequiredMixin,
+    fragments.FragmentCacheMixin,
+    OrderingParamMixin,
+    CursorPaginationMixin,
+    generic.ListView,
+):
     model = Worker
     queryset = Worker.objects.select_related("position")
     paginate_by = 4
+    orderings = workload.ORDERINGS
+    # Assigning tasks only bumps the task version.
+    fragment_models = ("worker", "position", "task")
+    fragment_names = ("content", "pagination")
 
-    def get_context_data(self, *, object_list=None, **kwargs):
-        context = super().get_context_data(**kwargs)
+    def get_fragment_key_parts(self):
+        # Overdue counts move at midnight.
+        return (timezone.localdate(),)
 
+    def get_uncached_context_data(self):
         username = self.request.GET.get("username", "")
 
-        context["search_form"] = WorkerUsernameSearchForm(
-            initial={"username": username}
-        )
-
-        return context
+        return {
+            "search_form": WorkerUsernameSearchForm(
+                initial={"username": username}
+            )
+        }
 
     def get_queryset(self):
-        queryset = get_user_model().objects.all()
+        # Orderings sort by the annotations, so annotate before ordering;
+        # Meta.ordering is not applied to aggregate queries.
+        queryset = workload.annotate_workload(
+            WorkerUsernameSearchForm(self.request.GET).search(
+                self.queryset.all()
+            )
+        )
 
-        username = self.request.GET.get("username")
+        return queryset.order_by(
+            *(self.get_ordering() or (*Worker._meta.ordering, "id"))
+        )
 
-        if username:
-            return queryset.filter(username__icontains=username)
 
-        return queryset
+class WorkerDetailView(
+    LoginRequiredMixin, fragments.FragmentCacheMixin, generic.DetailView
+):
+    model = Worker
+    fragment_models = ("worker", "position", "task", "tasktype")
 
+    queryset = Worker.objects.select_related("position")
 
-class WorkerDetailView(LoginRequiredMixin, generic.DetailView):
-    model = Worker
+    def get_tasks(self):
+        return list(self.object.tasks.select_related("task_type"))
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        worker = self.get_object()
 
-        context["is_completed"] = Task.objects.filter(
-            assignees=worker, is_completed=True
-        )
-        context["not_completed"] = Task.objects.filter(
-            assignees=worker, is_completed=False
-        )
+        tasks = self.get_tasks()
+
+        context["is_completed"] = [task for task in tasks if task.is_completed]
+        context["not_completed"] = [
+            task for task in tasks if not task.is_completed
+        ]
 
         return context
 
 
+@login_required
+def worker_autocomplete(request: HttpRequest) -> HttpResponse:
+    query = request.GET.get("q", "").strip()
+    workers = get_user_model().objects.only(
+        "id", "username", "first_name", "last_name"
+    ).order_by("username")
+
+    if query:
+        workers = search.search(workers, query)
+
+    return JsonResponse(
+        {
+            "results": [
+                {"id": worker.id, "text": str(worker)}
+                for worker in workers[:AUTOCOMPLETE_LIMIT]
+            ]
+        }
+    )
+
+
 class WorkerCreateView(LoginRequiredMixin, generic.CreateView):
     model = Worker
     form_class = WorkerForm
@@ -230,25 +395,134 @@ class WorkerDeleteView(LoginRequiredMixin, generic.DeleteView):
 
 @login_required
 def assign_delete_task(request, pk) -> HttpResponse:
-    worker = get_user_model().objects.get(id=request.user.id)
-    if Task.objects.get(id=pk) in worker.tasks.all():
-        worker.tasks.remove(pk)
+    assignment = Task.assignees.through.objects.filter(
+        task_id=pk, worker_id=request.user.id
+    )
+    if assignment.exists():
+        request.user.tasks.remove(pk)
     else:
-        worker.tasks.add(pk)
+        get_object_or_404(Task.objects.only("id"), id=pk)
+        request.user.tasks.add(pk)
     return HttpResponseRedirect(reverse("task:task-detail", args=[pk]))
 
 
+def wants_json(request: HttpRequest) -> bool:
+    return (
+        request.headers.get("x-requested-with") == "XMLHttpRequest"
+        or request.headers.get("accept", "").startswith("application/json")
+    )
+
+
+def toggle_completion(pk):
+    """
+    Flip ``is_completed`` of task ``pk`` and return the new value, or
+    ``None`` when there is no such task. One ``UPDATE ... RETURNING``
+    where the database has it, else ``update()`` and a read back.
+    """
+    if connection.vendor == "postgresql" or (
+        connection.vendor == "sqlite"
+        and connection.features.can_return_columns_from_insert
+    ):
+        quote = connection.ops.quote_name
+        table = quote(Task._meta.db_table)
+        column = quote(Task._meta.get_field("is_completed").column)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} SET {column} = NOT {column} "
+                f"WHERE {quote(Task._meta.pk.column)} = %s "
+                f"RETURNING {column}",
+                [pk],
+            )
+            row = cursor.fetchone()
+        return None if row is None else bool(row[0])
+
+    task = Task.objects.filter(pk=pk)
+    if not task.update(is_completed=~F("is_completed")):
+        return None
+    return task.values_list("is_completed", flat=True).get()
+
+
 @login_required
+@require_POST
 def mark_unmark_as_done(request, pk) -> HttpResponse:
-    task = Task.objects.get(id=pk)
-    if task.is_completed:
-        task.is_completed = False
-    else:
-        task.is_completed = True
-    task.save()
+    with transaction.atomic():
+        is_completed = toggle_completion(pk)
+        if is_completed is None:
+            raise Http404("No task found matching the query")
+        task_counts.completion_changed(
+            Task.objects.filter(pk=pk), is_completed
+        )
+        journal.record(
+            journal.event(
+                pk,
+                TaskEvent.Action.CHANGED,
+                "is_completed",
+                not is_completed,
+                is_completed,
+            )
+        )
+
+    counters.task_completion_changed(is_completed)
+    fragments.bump("task")
+
+    if wants_json(request):
+        return JsonResponse({"id": pk, "is_completed": is_completed})
+
     return HttpResponseRedirect(reverse("task:task-detail", args=[pk]))
 
 
+@login_required
+@require_POST
+def bulk_update_tasks(request: HttpRequest) -> HttpResponse:
+    form = TaskBulkForm(request.POST)
+
+    if not form.is_valid():
+        if wants_json(request):
+            return JsonResponse({"errors": form.errors}, status=400)
+        for error in form.non_field_errors():
+            messages.error(request, error)
+        return HttpResponseRedirect(reverse("task:task-list"))
+
+    report = apply_bulk_operations(
+        form.get_queryset(), **form.get_operations()
+    )
+
+    if wants_json(request):
+        return JsonResponse({"operations": report})
+
+    for operation, result in report.items():
+        messages.success(
+            request,
+            f"{operation}: {result['rows']} row(s) "
+            f"in {result['queries']} query(ies)"
+        )
+    return HttpResponseRedirect(reverse("task:task-list"))
+
+
+@login_required
+def export_tasks(request: HttpRequest) -> HttpResponse:
+    export_format = request.GET.get("format", "csv")
+
+    if export_format not in EXPORT_FORMATS:
+        raise Http404("Unknown export format")
+
+    try:
+        tasks = filter_tasks(Task.objects.all(), request.GET)
+    except ValueError as error:
+        raise Http404(str(error))
+
+    response = StreamingHttpResponse(
+        iter_export(export_format, tasks),
+        content_type=(
+            "text/csv" if export_format == "csv" else "application/x-ndjson"
+        ),
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="tasks.{export_format}"'
+    )
+    return response
+
+
 def signup(request: HttpRequest) -> HttpResponse:
     if request.method == "POST":
         form = SignupForm(request.POST)
@@ -258,3 +532,12 @@ def signup(request: HttpRequest) -> HttpResponse:
     else:
         form = SignupForm()
     return render(request, "task/signup.html", {"form": form})
+
+
+def metrics(request: HttpRequest) -> HttpResponse:
+    if not can_view_metrics(request):
+        return HttpResponse(status=403)
+
+    return HttpResponse(
+        render_metrics(), content_type="text/plain; version=0.0.4"
+    )
@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import Counter
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.sessions.backends.base import UpdateError
+
+FLUSH_SECONDS = 30
+FLUSH_BATCH = 100
+
+
+def stores_in_cookie():
+    return settings.SESSION_ENGINE.endswith("signed_cookies")
+
+
+class VisitCounter:
+    """
+    Per-session visit counts buffered in memory. Sessions kept on the
+    server are written once per ``TASK_VISITS_FLUSH_SECONDS`` for all
+    buffered visits instead of once per page view; signed-cookie sessions
+    cost no server write and are updated directly.
+
+    Flushing happens after the response is sent (``request_finished``),
+    at most ``TASK_VISITS_FLUSH_BATCH`` sessions per request. Visits still
+    buffered when the process exits are lost, which is acceptable for a
+    counter shown on the home page.
+    """
+
+    def __init__(self):
+        self._pending = Counter()
+        self._lock = threading.Lock()
+        self._flushed_at = time.monotonic()
+
+    def record(self, session) -> int:
+        key = session.session_key
+
+        if key is None or stores_in_cookie():
+            session["num_visits"] = session.get("num_visits", 0) + 1
+            return session["num_visits"]
+
+        with self._lock:
+            self._pending[key] += 1
+            return session.get("num_visits", 0) + self._pending[key]
+
+    def flush_if_due(self) -> int:
+        interval = getattr(settings, "TASK_VISITS_FLUSH_SECONDS", FLUSH_SECONDS)
+
+        with self._lock:
+            due = (
+                self._pending
+                and time.monotonic() - self._flushed_at >= interval
+            )
+
+        if not due:
+            return 0
+
+        return self.flush(
+            limit=getattr(settings, "TASK_VISITS_FLUSH_BATCH", FLUSH_BATCH)
+        )
+
+    def flush(self, limit=None) -> int:
+        """
+        Write the visits of up to ``limit`` buffered sessions. While more
+        remain the flush stays due, so the next requests write them.
+        """
+        with self._lock:
+            keys = list(self._pending)[:limit]
+            pending = {key: self._pending.pop(key) for key in keys}
+            if not self._pending:
+                self._flushed_at = time.monotonic()
+
+        store_class = import_module(settings.SESSION_ENGINE).SessionStore
+
+        written = 0
+        for key, count in pending.items():
+            store = store_class(key)
+            visits = store.get("num_visits", 0)
+
+            # Expired or logged out in the meantime.
+            if store.session_key is None:
+                continue
+
+            store["num_visits"] = visits + count
+            try:
+                store.save()
+            except UpdateError:
+                continue
+            written += 1
+
+        return written
+
+
+visit_counter = VisitCounter()
@@ -0,0 +1,58 @@
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from task.models import Task
+
+PRIORITY_COUNTS = {
+    f"{priority.name.lower()}_tasks": priority for priority in Task.Priority
+}
+# ``?ordering=`` values, each ending in the primary key for cursors.
+# Open and completed counts are the maintained counter columns, both
+# shown and sorted by.
+ORDERINGS = {
+    "workload": ("-open_task_count", "id"),
+    "overdue": ("-overdue_tasks", "id"),
+    "completed": ("-completed_task_count", "id"),
+    **{
+        priority.name.lower(): (f"-{name}", "id")
+        for name, priority in PRIORITY_COUNTS.items()
+    },
+}
+
+
+def workload_annotations(today=None) -> dict:
+    """
+    Overdue and per-priority open task counts per worker as conditional
+    ``Count`` over the assignees join, so a page of workers and their
+    workload is a single query.
+    """
+    today = today or timezone.localdate()
+    is_open = Q(tasks__is_completed=False)
+
+    return {
+        "overdue_tasks": Count(
+            "tasks", filter=is_open & Q(tasks__deadline__lt=today)
+        ),
+        **{
+            name: Count("tasks", filter=is_open & Q(tasks__priority=priority))
+            for name, priority in PRIORITY_COUNTS.items()
+        },
+    }
+
+
+def annotate_workload(workers, today=None):
+    if "overdue_tasks" in workers.query.annotations:
+        return workers
+    return workers.annotate(**workload_annotations(today))
+
+
+def serialize_workload(worker) -> dict:
+    return {
+        "open": worker.open_task_count,
+        "completed": worker.completed_task_count,
+        "overdue": worker.overdue_tasks,
+        "open_by_priority": {
+            priority.label.lower(): getattr(worker, name)
+            for name, priority in PRIORITY_COUNTS.items()
+        },
+    }
@@ -14,6 +14,8 @@ from pathlib import Path
 
 import dj_database_url
 
+from task import cache as task_cache
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -46,19 +48,26 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "task.metrics.RequestMetricsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "task.journal.JournalMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
-ROOT_URLCONF = "task_manager.urls"
+# Serve the read-only pages with async views, task_manager.asgi turns it on.
+TASK_ASYNC_VIEWS = os.environ.get("TASK_ASYNC_VIEWS", "") == "1"
+
+ROOT_URLCONF = (
+    "task_manager.urls_async" if TASK_ASYNC_VIEWS else "task_manager.urls"
+)
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "BACKEND": "task.metrics.InstrumentedDjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -80,6 +89,21 @@ LOGIN_REDIRECT_URL = "/"
 
 AUTH_USER_MODEL = "task.Worker"
 
+# Requests slower than this are logged with their SQL by
+# task.metrics.RequestMetricsMiddleware.
+TASK_SLOW_REQUEST_MS = int(os.environ.get("TASK_SLOW_REQUEST_MS", 500))
+
+# Bearer token that lets Prometheus scrape /metrics/ without a session.
+TASK_METRICS_TOKEN = os.environ.get("TASK_METRICS_TOKEN", "")
+
+# "log" or "raise" turns on task.nplusone.NPlusOneMiddleware (e.g. on
+# staging) for requests that repeat a query shape this many times.
+TASK_NPLUSONE = os.environ.get("TASK_NPLUSONE", "")
+TASK_NPLUSONE_THRESHOLD = int(os.environ.get("TASK_NPLUSONE_THRESHOLD", 3))
+
+if TASK_NPLUSONE:
+    MIDDLEWARE.append("task.nplusone.NPlusOneMiddleware")
+
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
@@ -93,6 +117,68 @@ DATABASES = {
 db_from_env = dj_database_url.config(conn_max_age=500)
 DATABASES["default"].update(db_from_env)
 
+# Caches
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+# Each cache is configured by a URL (locmem://, file:///path, redis://...).
+# Shared backends get a small in-process LRU in front of them, see
+# task.cache.TieredCache. Both default to Redis when REDIS_URL is set and to
+# per-process memory otherwise.
+REDIS_URL = os.environ.get("REDIS_URL", "")
+
+CACHES = {
+    "default": task_cache.config(
+        "CACHE_URL", default=REDIS_URL or "locmem://"
+    ),
+    "sessions": task_cache.config(
+        "SESSIONS_CACHE_URL",
+        default=REDIS_URL or "locmem://sessions",
+        tiered=False,
+    ),
+}
+
+# Dashboard counters are recounted this often, so per-process caches
+# heal from updates made by other processes.
+TASK_COUNTER_TIMEOUT = int(os.environ.get("TASK_COUNTER_TIMEOUT", 300))
+
+# Sessions
+# https://docs.djangoproject.com/en/4.2/topics/http/sessions/
+
+SESSION_BACKENDS = {
+    "db": "django.contrib.sessions.backends.db",
+    "cache": "django.contrib.sessions.backends.cache",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
+}
+
+# cached_db only pays off with a sessions cache shared by every process,
+# a per-process one misses on every other worker and serves stale data.
+SESSIONS_CACHE_SHARED = not CACHES["sessions"]["BACKEND"].endswith(
+    "LocMemCache"
+)
+
+SESSION_ENGINE = SESSION_BACKENDS[
+    os.environ.get(
+        "TASK_SESSION_BACKEND", "cached_db" if SESSIONS_CACHE_SHARED else "db"
+    )
+]
+
+SESSION_CACHE_ALIAS = "sessions"
+
+# How often buffered home page visits are written to the sessions, and
+# how many sessions one request writes at most.
+TASK_VISITS_FLUSH_SECONDS = int(
+    os.environ.get("TASK_VISITS_FLUSH_SECONDS", 30)
+)
+TASK_VISITS_FLUSH_BATCH = int(os.environ.get("TASK_VISITS_FLUSH_BATCH", 100))
+
+# Task events are inserted this many at a time, and at the end of each
+# request; compact_task_events drops those older than the retention.
+TASK_EVENT_BATCH_SIZE = int(os.environ.get("TASK_EVENT_BATCH_SIZE", 500))
+TASK_EVENT_RETENTION_DAYS = int(
+    os.environ.get("TASK_EVENT_RETENTION_DAYS", 365)
+)
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
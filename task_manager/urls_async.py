@@ -0,0 +1,15 @@
+"""
+URL configuration used when TASK_ASYNC_VIEWS is on (the default for
+task_manager.asgi): task_manager.urls with the async read-only pages.
+"""
+from django.conf import settings
+from django.conf.urls.static import static
+from django.contrib import admin
+from django.urls import path, include
+
+
+urlpatterns = [
+    path("admin/", admin.site.urls),
+    path("", include("task.urls_async", namespace="task")),
+    path("accounts/", include("django.contrib.auth.urls")),
+] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)